@@ -184,6 +184,18 @@ class Iteration(object):
     def peakmem_itertuples_raw_to_list(self):
         list(self.df4.itertuples(index=False, name=None))
 
+    def time_iterrecords(self):
+        for row in self.df4.iterrecords():
+            pass
+
+    def time_iterrecords_chunks(self):
+        for rows in self.df4.iterrecords().chunks():
+            pass
+
+    def peakmem_iterrecords(self):
+        for row in self.df4.iterrecords():
+            pass
+
     def time_iterrows(self):
         for row in self.df.iterrows():
             pass
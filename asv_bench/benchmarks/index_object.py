@@ -1,7 +1,7 @@
 import numpy as np
 import pandas.util.testing as tm
 from pandas import (Series, date_range, DatetimeIndex, Index, RangeIndex,
-                    Float64Index)
+                    Float64Index, IntervalIndex)
 
 
 class SetOperations(object):
@@ -82,6 +82,9 @@ class Range(object):
     def setup(self):
         self.idx_inc = RangeIndex(start=0, stop=10**7, step=3)
         self.idx_dec = RangeIndex(start=10**7, stop=-1, step=-3)
+        self.positions = np.arange(100, 10**6, 7)
+        self.mask = np.zeros(len(self.idx_inc), dtype=bool)
+        self.mask[100:10**6] = True
 
     def time_max(self):
         self.idx_inc.max()
@@ -95,6 +98,12 @@ class Range(object):
     def time_min_trivial(self):
         self.idx_inc.min()
 
+    def time_take_evenly_spaced(self):
+        self.idx_inc.take(self.positions)
+
+    def time_getitem_contiguous_mask(self):
+        self.idx_inc[self.mask]
+
 
 class IndexAppend(object):
 
@@ -181,4 +190,89 @@ class Float64IndexMethod(object):
         self.ind.get_loc(0)
 
 
+class GetIndexerMonotonic(object):
+
+    params = ['sorted', 'shuffled']
+    param_names = ['target']
+
+    def setup(self, target):
+        N = 5 * 10**6
+        self.values = np.arange(N) * 2
+        self.target = np.arange(0, 2 * N, 3)
+        if target == 'shuffled':
+            np.random.seed(1234)
+            np.random.shuffle(self.target)
+
+    def time_get_indexer(self, target):
+        # a new index each time, so its lookup table is never reused
+        Index(self.values).get_indexer(self.target)
+
+    def peakmem_get_indexer(self, target):
+        Index(self.values).get_indexer(self.target)
+
+
+class AppendGetLoc(object):
+
+    params = ['int', 'object']
+    param_names = ['dtype']
+
+    def setup(self, dtype):
+        N = 10**5
+        np.random.seed(1234)
+        values = np.random.permutation(N)
+        batches = np.arange(N, 2 * N).reshape(100, -1)
+        if dtype == 'object':
+            values = values.astype(str)
+            batches = batches.astype(str)
+        self.idx = Index(values, dtype=dtype)
+        self.batches = [Index(batch, dtype=dtype) for batch in batches]
+
+    def time_append_get_loc(self, dtype):
+        # streaming: append a batch and look up a key, 100 times
+        idx = self.idx
+        for batch in self.batches:
+            idx = idx.append(batch)
+            idx.get_loc(batch[0])
+
+
+class SliceFlags(object):
+
+    def setup(self):
+        N = 10**6
+        dates = date_range('2000-01-01', periods=N, freq='s')
+        self.idx = DatetimeIndex(dates.values)
+        self.idx.is_unique
+        self.idx.is_monotonic_increasing
+        self.positions = np.arange(0, N, 3)
+
+    def time_slices_is_monotonic(self):
+        # e.g. a rolling window of slices checked before searchsorted
+        for i in range(0, 10**6, 10**5):
+            self.idx[i:].is_monotonic_increasing
+
+    def time_take_sorted_is_unique(self):
+        self.idx.take(self.positions).is_unique
+
+    def time_copy_is_unique(self):
+        self.idx.copy().is_unique
+
+
+class IntervalIndexOverlaps(object):
+
+    def setup(self):
+        N = 10**6
+        np.random.seed(1234)
+        left = np.random.randint(0, 10**8, N)
+        self.windows = IntervalIndex.from_arrays(
+            left, left + np.random.randint(1, 1000, N))
+        breaks = np.arange(0, 10**8 + 1, 10**4)
+        self.sessions = IntervalIndex.from_breaks(breaks, closed='left')
+
+    def time_overlaps_indexer(self):
+        self.windows.overlaps_indexer(self.sessions)
+
+    def peakmem_overlaps_indexer(self):
+        self.windows.overlaps_indexer(self.sessions)
+
+
 from .pandas_vb_common import setup  # noqa: F401
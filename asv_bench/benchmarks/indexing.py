@@ -170,6 +170,26 @@ class DataFrameNumericIndexing(object):
         self.df[self.bool_indexer]
 
 
+class DataFrameScalarIndexing(object):
+
+    def setup(self):
+        self.df = DataFrame(np.random.randn(1000, 10),
+                            columns=list('abcdefghij'))
+        self.df_str = DataFrame(np.random.randn(1000, 10),
+                                index=tm.makeStringIndex(1000),
+                                columns=list('abcdefghij'))
+        self.row = self.df_str.index[500]
+
+    def time_loc_scalar(self):
+        self.df.loc[500, 'c']
+
+    def time_loc_scalar_string(self):
+        self.df_str.loc[self.row, 'c']
+
+    def time_at_scalar(self):
+        self.df.at[500, 'c']
+
+
 class Take(object):
 
     params = ['int', 'datetime']
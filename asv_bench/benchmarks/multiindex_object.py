@@ -2,7 +2,7 @@ import string
 
 import numpy as np
 import pandas.util.testing as tm
-from pandas import date_range, MultiIndex
+from pandas import date_range, MultiIndex, Series
 
 
 class GetLoc(object):
@@ -110,6 +110,64 @@ class Sortlevel(object):
         self.mi.sortlevel(1)
 
 
+class GetLocs(object):
+
+    def setup(self):
+        self.mi = MultiIndex.from_product(
+            [np.arange(200), np.arange(200), np.arange(100)])
+        self.keys = [list(range(0, 200, 3)), list(range(5, 50))]
+        self.tuples = [(i, j) for i in range(0, 200, 7)
+                       for j in range(0, 200, 11)]
+        self.s = Series(np.arange(len(self.mi)), index=self.mi)
+        self.mi.get_locs(self.keys)
+
+    def time_get_locs_lists(self):
+        self.mi.get_locs(self.keys)
+
+    def time_loc_partial_tuples(self):
+        self.s.loc[self.tuples]
+
+
+class SetOperations(object):
+
+    params = ['union', 'intersection', 'difference', 'symmetric_difference']
+    param_names = ['method']
+
+    def setup(self, method):
+        dates = date_range('2000-01-01', periods=100)
+        self.left = MultiIndex.from_product(
+            [np.arange(100), tm.makeStringIndex(50), dates])
+        self.right = MultiIndex.from_product(
+            [np.arange(50, 150), tm.makeStringIndex(50), dates])
+
+    def time_set_operation(self, method):
+        getattr(self.left, method)(self.right)
+
+    def peakmem_set_operation(self, method):
+        getattr(self.left, method)(self.right)
+
+
+class Memory(object):
+
+    def setup(self):
+        self.mi = MultiIndex.from_product(
+            [np.arange(100), tm.makeStringIndex(100),
+             date_range('2000-01-01', periods=10)])
+        self.keys = self.mi[::7]
+
+    def peakmem_isin(self):
+        self.mi.isin(self.keys)
+
+    def peakmem_unique(self):
+        self.mi.unique()
+
+    def peakmem_argsort(self):
+        self.mi.argsort()
+
+    def peakmem_repr(self):
+        repr(self.mi)
+
+
 class Values(object):
 
     def setup_cache(self):
@@ -676,6 +676,80 @@ def backfill_2d_inplace(algos_t[:, :] values,
                 val = values[j, i]
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def lookup_sorted(ndarray[numeric] index, ndarray[numeric] target):
+    """
+    Return the positions of the values of ``target`` in ``index``, -1 for
+    the values that are not found.
+
+    ``index`` must be increasing without duplicates or NaN. Each value is
+    searched from the position of the previous one by galloping: comparing
+    with the values at 1, 2, 4, ... positions away until the value is
+    bracketed, then bisecting the bracket. An increasing ``target`` is thus
+    found in a single merge-like pass over ``index`` that skips the runs of
+    values in between, without a hash table.
+
+    Parameters
+    ----------
+    index : ndarray
+    target : ndarray of the same dtype
+
+    Returns
+    -------
+    indexer : ndarray[int64_t]
+    """
+    cdef:
+        Py_ssize_t i, n = len(index), m = len(target)
+        Py_ssize_t lo, hi, mid, step, pos = 0
+        numeric val
+        ndarray[int64_t] indexer = np.empty(m, dtype=np.int64)
+
+    if n == 0:
+        indexer.fill(-1)
+        return indexer
+
+    with nogil:
+        for i in range(m):
+            val = target[i]
+            if val != val:
+                indexer[i] = -1
+                continue
+
+            # bracket the position of the first value >= val in [lo, hi]
+            if index[pos] < val:
+                lo, hi, step = pos, pos + 1, 1
+                while hi < n and index[hi] < val:
+                    lo = hi
+                    step <<= 1
+                    hi = lo + step
+                lo += 1
+                if hi > n:
+                    hi = n
+            else:
+                lo, hi, step = pos - 1, pos, 1
+                while lo >= 0 and index[lo] >= val:
+                    hi = lo
+                    step <<= 1
+                    lo = hi - step
+                lo = lo + 1 if lo >= 0 else 0
+
+            while lo < hi:
+                mid = lo + (hi - lo) // 2
+                if index[mid] < val:
+                    lo = mid + 1
+                else:
+                    hi = mid
+
+            if lo < n and index[lo] == val:
+                indexer[i] = lo
+            else:
+                indexer[i] = -1
+            pos = lo if lo < n else n - 1
+
+    return indexer
+
+
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def arrmap(algos_t[:] index, object func):
@@ -729,7 +803,8 @@ def is_monotonic(ndarray[algos_t, ndim=1] arr, bint timelike):
         return True, True, True
 
     if timelike and <int64_t>arr[0] == NPY_NAT:
-        return False, False, True
+        # the values are not compared, so nothing is known about uniqueness
+        return False, False, False
 
     if algos_t is not object:
         with nogil:
@@ -10,18 +10,30 @@ cdef class HashTable:
 
 cdef class UInt64HashTable(HashTable):
     cdef kh_uint64_t *table
+    cdef bint external_view_exists
+    cdef object _buffers
+
+    cdef _check_modifiable(self)
 
     cpdef get_item(self, uint64_t val)
     cpdef set_item(self, uint64_t key, Py_ssize_t val)
 
 cdef class Int64HashTable(HashTable):
     cdef kh_int64_t *table
+    cdef bint external_view_exists
+    cdef object _buffers
+
+    cdef _check_modifiable(self)
 
     cpdef get_item(self, int64_t val)
     cpdef set_item(self, int64_t key, Py_ssize_t val)
 
 cdef class Float64HashTable(HashTable):
     cdef kh_float64_t *table
+    cdef bint external_view_exists
+    cdef object _buffers
+
+    cdef _check_modifiable(self)
 
     cpdef get_item(self, float64_t val)
     cpdef set_item(self, float64_t key, Py_ssize_t val)
@@ -6,6 +6,7 @@ from cpython cimport (PyObject, Py_INCREF,
                       PyMem_Malloc, PyMem_Realloc, PyMem_Free)
 
 from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy
 
 import numpy as np
 cimport numpy as cnp
@@ -17,7 +18,7 @@ cdef extern from "numpy/npy_math.h":
 
 
 from pandas._libs.khash cimport (
-    khiter_t,
+    khint_t, khiter_t,
 
     kh_str_t, kh_init_str, kh_put_str, kh_exist_str,
     kh_get_str, kh_destroy_str, kh_resize_str,
@@ -48,6 +49,51 @@ _SIZE_HINT_LIMIT = (1 << 20) + 7
 
 cdef size_t _INIT_VEC_CAP = 128
 
+
+cdef inline Py_ssize_t _flags_size(Py_ssize_t n_buckets):
+    # number of uint32 words of the flags of a khash table, see __ac_fsize
+    if n_buckets == 0:
+        return 0
+    return 1 if n_buckets < 32 else n_buckets >> 5
+
+
+cdef ndarray _buffer_view(void *data, Py_ssize_t n, object dtype,
+                          object base):
+    # read-only array on the memory of a hash table, keeping the table alive
+    cdef:
+        cnp.npy_intp shape = n
+        ndarray arr
+
+    if n == 0:
+        return np.empty(0, dtype=dtype)
+    arr = cnp.PyArray_SimpleNewFromData(1, &shape, np.dtype(dtype).num, data)
+    cnp.set_array_base(arr, base)
+    arr.flags.writeable = False
+    return arr
+
+
+cdef ndarray _check_buffer(object arr, Py_ssize_t n, object dtype,
+                           str name):
+    if not isinstance(arr, np.ndarray) or arr.dtype != dtype:
+        raise ValueError("{name} of the hash table state must be an array "
+                         "of dtype {dtype}".format(name=name,
+                                                   dtype=np.dtype(dtype)))
+    if len(arr) != n or not arr.flags.c_contiguous:
+        raise ValueError("{name} of the hash table state must be a "
+                         "contiguous array of length {n}".format(name=name,
+                                                                 n=n))
+    return arr
+
+
+cdef void *_copy_buffer(const void *data, size_t nbytes) except NULL:
+    # malloc'ed copy of the buckets of a khash table, to be owned by a table
+    cdef void *result = malloc(nbytes if nbytes else 1)
+    if result is NULL:
+        raise MemoryError()
+    if nbytes:
+        memcpy(result, data, nbytes)
+    return result
+
 include "hashtable_class_helper.pxi"
 include "hashtable_func_helper.pxi"
 
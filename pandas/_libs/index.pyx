@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from datetime import datetime, timedelta, date
+import zlib
 
 import cython
 
@@ -187,6 +188,14 @@ cdef class IndexEngine:
 
     cdef inline _do_unique_check(self):
 
+        # a large index is first checked for being strictly monotonic,
+        # which needs no hash table
+        if self.over_size_threshold and self.need_monotonic_check:
+            self._do_monotonic_check()
+            if (not self.need_unique_check and
+                    (self.monotonic_inc or self.monotonic_dec)):
+                return
+
         # this de-facto the same
         self._ensure_mapping_populated()
 
@@ -217,8 +226,9 @@ cdef class IndexEngine:
 
         self.need_monotonic_check = 0
 
-        # we can only be sure of uniqueness if is_unique=1
-        if is_unique:
+        # we can only be sure of uniqueness if is_unique=1, which only
+        # holds for strictly monotonic values
+        if is_unique and (self.monotonic_inc or self.monotonic_dec):
             self.unique = 1
             self.need_unique_check = 0
 
@@ -260,8 +270,142 @@ cdef class IndexEngine:
 
         self.need_unique_check = 0
 
-    cpdef _call_map_locations(self, values):
-        self.mapping.map_locations(values)
+    cpdef _call_map_locations(self, values, Py_ssize_t start=0):
+        self.mapping.map_locations(values, start)
+
+    def _values_checksum(self):
+        """
+        CRC32 of the bytes of the values, to tell whether a hash table state
+        was built from the same values.
+        """
+        values = np.ascontiguousarray(self._get_index_values())
+        return zlib.crc32(values.view(np.uint8)) & 0xffffffff
+
+    def get_mapping_state(self):
+        """
+        Return the state of the hash table, building it if needed, so it
+        can be restored with set_mapping_state instead of being rebuilt.
+
+        The state is taken from a copy of the hash table, so the table of
+        this engine can still be modified.
+        """
+        self._ensure_mapping_populated()
+        if not hasattr(self.mapping, 'get_state'):
+            raise TypeError("the hash table of {name} can not be "
+                            "serialized".format(name=type(self).__name__))
+        state = self.mapping.copy().get_state()
+        state['n_values'] = len(self._get_index_values())
+        state['checksum'] = self._values_checksum()
+        return state
+
+    def set_mapping_state(self, dict state):
+        """
+        Use the hash table of a state returned by get_mapping_state for the
+        same values. The arrays of the state are not copied, they can be
+        memory-mapped and are never modified.
+        """
+        n = len(self._get_index_values())
+        if state['n_values'] != n:
+            raise ValueError("the hash table state is for {n_state} values, "
+                             "the index has {n}"
+                             .format(n_state=state['n_values'], n=n))
+        if state['checksum'] != self._values_checksum():
+            raise ValueError("the hash table state is for different values "
+                             "than those of the index")
+        mapping = self._make_hash_table(1)
+        if not hasattr(mapping, 'set_state'):
+            raise TypeError("the hash table of {name} can not be "
+                            "serialized".format(name=type(self).__name__))
+        mapping.set_state(state)
+
+        self.mapping = mapping
+        self.unique = len(mapping) == n
+        self.need_unique_check = 0
+
+    def extend_state(self, IndexEngine other):
+        """
+        Take over the hash table and the flags of the engine of an index
+        whose values this index starts with, so that only the values after
+        them are hashed and checked.
+
+        The hash table of the other engine is copied, it is not modified.
+        """
+        cdef:
+            Py_ssize_t n, start
+            bint inc, dec, tail_unique
+
+        values = self._get_index_values()
+        n = len(values)
+        start = len(other._get_index_values())
+        if start == 0 or start > n:
+            return
+
+        if not other.need_monotonic_check:
+            # the tail is checked together with the last value of the other
+            # index, which takes care of the boundary
+            try:
+                inc, dec, tail_unique = \
+                    self._call_monotonic(values[start - 1:])
+            except TypeError:
+                inc = dec = tail_unique = 0
+            self.monotonic_inc = other.monotonic_inc and inc
+            self.monotonic_dec = other.monotonic_dec and dec
+            self.need_monotonic_check = 0
+
+            # strictly monotonic before and after the boundary
+            if (not other.need_unique_check and other.unique and
+                    tail_unique and
+                    (self.monotonic_inc or self.monotonic_dec)):
+                self.unique = 1
+                self.need_unique_check = 0
+
+        if not other.need_unique_check and not other.unique:
+            # the duplicates are still there
+            self.need_unique_check = 0
+
+        if other.is_mapping_populated and hasattr(other.mapping, 'copy'):
+            self.mapping = other.mapping.copy()
+            self._call_map_locations(values[start:], start)
+            self.unique = len(self.mapping) == n
+            self.need_unique_check = 0
+
+    def share_state(self, IndexEngine other, bint subset=False,
+                    bint reverse=False):
+        """
+        Take over what the engine of another index knows about its values.
+
+        If ``subset``, the values of this index are some of the values of
+        the other, not repeated and in the same order (reversed if
+        ``reverse``), and only the flags that still hold are taken over.
+        Otherwise the values are the same and the hash table is shared too,
+        it is never modified once built.
+        """
+        cdef:
+            Py_ssize_t n
+            bint inc, dec
+
+        if not other.need_monotonic_check:
+            inc, dec = other.monotonic_inc, other.monotonic_dec
+            if reverse:
+                inc, dec = dec, inc
+            if subset and (inc or dec):
+                # monotonic values are monotonic both ways only if they are
+                # all equal
+                values = self._get_index_values()
+                n = len(values)
+                if n < 2 or values[0] == values[n - 1]:
+                    inc = dec = 1
+            if inc or dec or not subset:
+                self.monotonic_inc = inc
+                self.monotonic_dec = dec
+                self.need_monotonic_check = 0
+
+        if not other.need_unique_check and (other.unique or not subset):
+            self.unique = other.unique
+            self.need_unique_check = 0
+
+        if not subset and other.is_mapping_populated:
+            self.mapping = other.mapping
 
     def clear_mapping(self):
         self.mapping = None
@@ -272,7 +416,29 @@ cdef class IndexEngine:
         self.monotonic_inc = 0
         self.monotonic_dec = 0
 
+    cdef bint _can_lookup_sorted(self):
+        # large increasing indexes are searched rather than hashed, unless
+        # their hash table has already been built
+        return (self.over_size_threshold and
+                not self.is_mapping_populated and
+                self.is_monotonic_increasing and self.is_unique)
+
+    cdef _lookup_sorted(self, ndarray values):
+        # merge the increasing index values with the sorted values, sorting
+        # a copy of the values first if needed
+        index_values = self._get_index_values()
+        if algos.is_monotonic(values, timelike=False)[0]:
+            return algos.lookup_sorted(index_values, values)
+
+        order = values.argsort()
+        indexer = np.empty(len(values), dtype=np.int64)
+        indexer[order] = algos.lookup_sorted(index_values, values.take(order))
+        return indexer
+
     def get_indexer(self, values):
+        if self._can_lookup_sorted():
+            return self._lookup_sorted(values)
+
         self._ensure_mapping_populated()
         return self.mapping.lookup(values)
 
@@ -384,6 +550,9 @@ cdef class ObjectEngine(IndexEngine):
     cdef _make_hash_table(self, n):
         return _hash.PyObjectHashTable(n)
 
+    cdef bint _can_lookup_sorted(self):
+        return False
+
 
 cdef class DatetimeEngine(Int64Engine):
 
@@ -455,10 +624,13 @@ cdef class DatetimeEngine(Int64Engine):
             raise KeyError(val)
 
     def get_indexer(self, values):
-        self._ensure_mapping_populated()
         if values.dtype != self._get_box_dtype():
             return np.repeat(-1, len(values)).astype('i4')
         values = np.asarray(values).view('i8')
+        if self._can_lookup_sorted():
+            return self._lookup_sorted(values)
+
+        self._ensure_mapping_populated()
         return self.mapping.lookup(values)
 
     def get_pad_indexer(self, other, limit=None):
@@ -485,8 +657,9 @@ cdef class PeriodEngine(Int64Engine):
     cdef _get_index_values(self):
         return super(PeriodEngine, self).vgetter()
 
-    cpdef _call_map_locations(self, values):
-        super(PeriodEngine, self)._call_map_locations(values.view('i8'))
+    cpdef _call_map_locations(self, values, Py_ssize_t start=0):
+        super(PeriodEngine, self)._call_map_locations(values.view('i8'),
+                                                      start)
 
     def _call_monotonic(self, values):
         return super(PeriodEngine, self)._call_monotonic(values.view('i8'))
@@ -627,7 +800,7 @@ cdef class BaseMultiIndexCodesEngine:
 
         Parameters
         ----------
-        target : list-like of keys
+        target : list-like of keys or MultiIndex
             Each key is a tuple, with a label for each level of the index.
 
         Returns
@@ -636,8 +809,18 @@ cdef class BaseMultiIndexCodesEngine:
             Integers representing one combination each
         """
 
-        level_codes = [lev.get_indexer(codes) + 1 for lev, codes
-                       in zip(self.levels, zip(*target))]
+        target_levels = getattr(target, 'levels', None)
+        if (target_levels is not None and
+                len(target_levels) == len(self.levels)):
+            # a MultiIndex: map the codes of its levels, not its tuples; -1
+            # takes the -1 appended to the indexer of its level
+            level_codes = [np.append(lev.get_indexer(target_lev), -1)
+                           .take(target_codes) + 1
+                           for lev, target_lev, target_codes
+                           in zip(self.levels, target_levels, target.codes)]
+        else:
+            level_codes = [lev.get_indexer(codes) + 1 for lev, codes
+                           in zip(self.levels, zip(*target))]
         return self._codes_to_ints(np.array(level_codes, dtype='uint64').T)
 
     def get_indexer(self, object target, object method=None,
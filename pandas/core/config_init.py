@@ -45,11 +45,34 @@ def use_numexpr_cb(key):
     expressions.set_use_numexpr(cf.get_option(key))
 
 
+block_threads_doc = """
+: int
+    Number of threads used to apply element-wise and reduction methods
+    (astype, fillna, where, shift, diff, interpolate, quantile) to the
+    blocks of a large DataFrame, the default is 1 (no threads)
+"""
+
+
+def block_threads_cb(key):
+    from pandas.core.internals.managers import _set_block_threads
+    _set_block_threads(key)
+
+
+consolidation_threshold_doc = """
+: int
+    Number of blocks a DataFrame may hold before inserting a column
+    consolidates the blocks of the same dtype, the default is 100
+"""
+
 with cf.config_prefix('compute'):
     cf.register_option('use_bottleneck', True, use_bottleneck_doc,
                        validator=is_bool, cb=use_bottleneck_cb)
     cf.register_option('use_numexpr', True, use_numexpr_doc,
                        validator=is_bool, cb=use_numexpr_cb)
+    cf.register_option('block_threads', 1, block_threads_doc,
+                       validator=is_int, cb=block_threads_cb)
+    cf.register_option('consolidation_threshold', 100,
+                       consolidation_threshold_doc, validator=is_int)
 #
 # options from the "display" namespace
 
@@ -433,6 +456,24 @@ with cf.config_prefix('mode'):
     cf.register_option('chained_assignment', 'warn', chained_assignment,
                        validator=is_one_of_factory([None, 'warn', 'raise']))
 
+copy_on_write_doc = """
+: boolean
+    Whether copies, slices and selected columns share the data of the object
+    they come from, each block being copied only when one side is first
+    modified. Modifying the result of chained indexing then never modifies
+    the original object, and SettingWithCopyWarning is not raised.
+"""
+
+
+def use_copy_on_write_cb(key):
+    from pandas.core.internals.managers import _use_copy_on_write
+    _use_copy_on_write(key)
+
+
+with cf.config_prefix('mode'):
+    cf.register_option('copy_on_write', False, copy_on_write_doc,
+                       validator=is_bool, cb=use_copy_on_write_cb)
+
 # Set up the io.excel specific configuration.
 writer_engine_doc = """
 : string
@@ -480,6 +521,36 @@ with cf.config_prefix('io.parquet'):
         'engine', 'auto', parquet_engine_doc,
         validator=is_one_of_factory(['auto', 'pyarrow', 'fastparquet']))
 
+# Set up the io.pickle specific configuration.
+pickle_index_engine_doc = """
+: bool
+    Whether pickled indexes include the hash table used for label lookups,
+    when it has been built, so that it is not rebuilt after unpickling.
+"""
+
+with cf.config_prefix('io.pickle'):
+    cf.register_option('index_engine', False, pickle_index_engine_doc,
+                       validator=is_bool)
+
+# Set up the io.cache specific configuration.
+cache_max_bytes_doc = """
+: int
+    The number of bytes of decompressed local files and remote (S3, GCS)
+    objects kept in memory by the readers, so that reading the same
+    unchanged file again does not fetch or decompress it. Entries are
+    evicted least recently used first. The default of 0 disables the cache.
+"""
+
+
+def cache_max_bytes_cb(key):
+    from pandas.io.common import _content_cache
+    _content_cache.trim()
+
+
+with cf.config_prefix('io.cache'):
+    cf.register_option('max_bytes', 0, cache_max_bytes_doc,
+                       validator=is_int, cb=cache_max_bytes_cb)
+
 # --------
 # Plotting
 # ---------
@@ -0,0 +1,95 @@
+"""
+Batched iteration over the rows of a DataFrame, see DataFrame.iterrecords.
+"""
+from collections import namedtuple
+
+from pandas.compat import map, range, zip
+
+from pandas.core.dtypes.common import (
+    is_datetimelike, is_extension_array_dtype, is_integer)
+
+import pandas.core.common as com
+
+
+def _values_to_list(values):
+    """
+    Convert values to a list of the scalars that iterating over a Series
+    or Index holding them gives.
+    """
+    if is_datetimelike(values):
+        return [com.maybe_box_datetimelike(x) for x in values]
+    elif is_extension_array_dtype(values):
+        return list(values)
+    return values.tolist()
+
+
+class RowCursor(object):
+    """
+    Iterator over the rows of a DataFrame as namedtuples, reading the rows
+    a chunk at a time.
+
+    The values of a chunk are converted to Python and pandas scalars column
+    by column, and the rows of the chunk are built from those in one pass,
+    so no Series or intermediate array is created per row.
+
+    Parameters
+    ----------
+    frame : DataFrame
+    index : bool, default True
+        Include the row label as the first field, ``Index``.
+    name : str or None, default "Row"
+        The name of the namedtuples, or None for regular tuples.
+    chunksize : int, default 10000
+        Number of rows read at once.
+    """
+
+    def __init__(self, frame, index=True, name='Row', chunksize=10000):
+        if not is_integer(chunksize) or chunksize < 1:
+            raise ValueError("chunksize must be a positive integer, "
+                             "got {chunksize!r}".format(chunksize=chunksize))
+        self.chunksize = chunksize
+
+        fields = list(frame.columns)
+        # use integer indexing because of possible duplicate column names
+        arrays = [frame.iloc[:, k]._values for k in range(len(fields))]
+        if index:
+            fields.insert(0, 'Index')
+            arrays.insert(0, frame.index)
+        self._arrays = arrays
+        self._nrows = len(frame)
+
+        self._make = None
+        # Python 3 supports at most 255 arguments to constructor, and
+        # things get slow with this many fields in Python 2
+        if name is not None and len(fields) < 256:
+            try:
+                self._make = namedtuple(name, fields, rename=True)._make
+            except Exception:
+                pass
+
+    def __len__(self):
+        return self._nrows
+
+    def __iter__(self):
+        for rows in self.chunks():
+            for row in rows:
+                yield row
+
+    def chunks(self):
+        """
+        Iterate over the rows a chunk at a time.
+
+        Yields
+        ------
+        list
+            The rows of the next ``chunksize`` rows of the DataFrame.
+        """
+        if not self._arrays:
+            return
+        for start in range(0, self._nrows, self.chunksize):
+            stop = start + self.chunksize
+            rows = zip(*[_values_to_list(values[start:stop])
+                         for values in self._arrays])
+            if self._make is not None:
+                rows = map(self._make, rows)
+            yield list(rows)
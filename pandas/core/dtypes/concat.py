@@ -574,6 +574,8 @@ def _concat_rangeindex_same_dtype(indexes):
         # Get the stop value from "next" or alternatively
         # from the last non-empty index
         stop = non_empty_indexes[-1]._stop if next is None else next
+        # a single non-empty index of length 1 can have a negative step
+        step = non_empty_indexes[-1]._step if step is None else step
         return RangeIndex(start, stop, step)
 
     # Here all "indexes" had 0 length, i.e. were empty.
@@ -84,6 +84,7 @@ from pandas.core.arrays.datetimelike import (
     DatetimeLikeArrayMixin as DatetimeLikeArray
 )
 from pandas.core.config import get_option
+from pandas.core.cursor import RowCursor
 from pandas.core.generic import NDFrame, _shared_docs
 from pandas.core.index import (Index, MultiIndex, ensure_index,
                                ensure_index_from_sequences)
@@ -92,7 +93,9 @@ from pandas.core.indexes.datetimes import DatetimeIndex
 from pandas.core.indexes.period import PeriodIndex
 from pandas.core.indexing import (maybe_droplevels, convert_to_index_sliceable,
                                   check_bool_indexer)
-from pandas.core.internals import BlockManager
+from pandas.core.internals import (BlockManager, SingleBlockManager,
+                                   make_block, using_copy_on_write)
+from pandas.core.internals.blocks import get_block_type
 from pandas.core.internals.construction import (
     masked_rec_array_to_mgr, get_names_from_index, to_arrays,
     reorder_arrays, init_ndarray, init_dict,
@@ -283,6 +286,9 @@ ValueError: columns overlap but no suffix specified:
     Index(['value'], dtype='object')
 """
 
+# number of values DataFrame.iterrows interleaves at once
+_ITERROWS_CHUNK_SIZE = 1000000
+
 # -----------------------------------------------------------------------
 # DataFrame class
 
@@ -384,6 +390,9 @@ class DataFrame(NDFrame):
 
         if isinstance(data, DataFrame):
             data = data._data
+            if using_copy_on_write():
+                # don't share the manager itself with the other object
+                data = data.copy(deep=False)
 
         if isinstance(data, BlockManager):
             mgr = self._init_mgr(data, axes=dict(index=index, columns=columns),
@@ -795,6 +804,7 @@ class DataFrame(NDFrame):
         See Also
         --------
         itertuples : Iterate over DataFrame rows as namedtuples of the values.
+        iterrecords : Iterate over DataFrame rows in chunks of namedtuples.
         iteritems : Iterate over (column name, Series) pairs.
 
         Notes
@@ -826,9 +836,24 @@ class DataFrame(NDFrame):
         """
         columns = self.columns
         klass = self._constructor_sliced
-        for k, v in zip(self.index, self.values):
-            s = klass(v, index=columns, name=k)
-            yield k, s
+        chunksize = max(1, _ITERROWS_CHUNK_SIZE // max(len(columns), 1))
+
+        # interleave the values a chunk of rows at a time
+        for start in range(0, len(self), chunksize):
+            values = self.iloc[start:start + chunksize].values
+            labels = self.index[start:start + chunksize]
+            if klass is Series and not is_object_dtype(values):
+                # nothing to infer, build the rows' blocks directly
+                block_type = get_block_type(values)
+                placement = slice(0, len(columns))
+                for k, v in zip(labels, values):
+                    block = make_block(v, placement=placement,
+                                       klass=block_type, ndim=1)
+                    mgr = SingleBlockManager(block, columns, fastpath=True)
+                    yield k, klass(mgr, name=k, fastpath=True)
+            else:
+                for k, v in zip(labels, values):
+                    yield k, klass(v, index=columns, name=k)
 
     def itertuples(self, index=True, name="Pandas"):
         """
@@ -893,28 +918,66 @@ class DataFrame(NDFrame):
         Animal(Index='dog', num_legs=4, num_wings=0)
         Animal(Index='hawk', num_legs=2, num_wings=2)
         """
-        arrays = []
-        fields = list(self.columns)
-        if index:
-            arrays.append(self.index)
-            fields.insert(0, "Index")
+        return iter(RowCursor(self, index=index, name=name))
 
-        # use integer indexing because of possible duplicate column names
-        arrays.extend(self.iloc[:, k] for k in range(len(self.columns)))
+    def iterrecords(self, index=True, name='Row', chunksize=10000):
+        """
+        Iterate over DataFrame rows as namedtuples, a chunk of rows at a time.
 
-        # Python 3 supports at most 255 arguments to constructor, and
-        # things get slow with this many fields in Python 2
-        if name is not None and len(self.columns) + index < 256:
-            # `rename` is unsupported in Python 2.6
-            try:
-                itertuple = collections.namedtuple(name, fields, rename=True)
-                return map(itertuple._make, zip(*arrays))
+        .. versionadded:: 0.25.0
 
-            except Exception:
-                pass
+        The values of each chunk of rows are converted to Python and pandas
+        scalars column by column and the namedtuples of the chunk are built
+        in one pass. Like :meth:`itertuples`, and unlike :meth:`iterrows`,
+        no Series is created per row and the dtypes of the columns are
+        preserved.
+
+        Parameters
+        ----------
+        index : bool, default True
+            If True, include the index as the first field, ``Index``.
+        name : str or None, default "Row"
+            The name of the namedtuples, or None to return regular tuples.
+        chunksize : int, default 10000
+            Number of rows converted at once.
+
+        Returns
+        -------
+        RowCursor
+            An iterable over the rows, whose ``chunks`` method yields the
+            rows as lists of ``chunksize`` namedtuples.
+
+        See Also
+        --------
+        DataFrame.itertuples : Iterate over DataFrame rows as namedtuples.
+        DataFrame.iterrows : Iterate over DataFrame rows as (index, Series)
+            pairs.
 
-        # fallback to regular tuples
-        return zip(*arrays)
+        Notes
+        -----
+        The column names will be renamed to positional names if they are
+        invalid Python identifiers, repeated, or start with an underscore.
+        With a large number of columns (>255), regular tuples are returned.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame({'num_legs': [4, 2], 'num_wings': [0, 2]},
+        ...                   index=['dog', 'hawk'])
+        >>> for row in df.iterrecords():
+        ...     print(row)
+        ...
+        Row(Index='dog', num_legs=4, num_wings=0)
+        Row(Index='hawk', num_legs=2, num_wings=2)
+
+        The rows can also be processed in batches:
+
+        >>> for rows in df.iterrecords(index=False, chunksize=1).chunks():
+        ...     print(rows)
+        ...
+        [Row(num_legs=4, num_wings=0)]
+        [Row(num_legs=2, num_wings=2)]
+        """
+        return RowCursor(self, index=index, name=name, chunksize=chunksize)
 
     items = iteritems
 
@@ -1176,6 +1239,61 @@ class DataFrame(NDFrame):
         result = np.array(self.values, dtype=dtype, copy=copy)
         return result
 
+    def to_layout(self, layout, copy=True):
+        """
+        Return the DataFrame with its values stored in the given memory layout.
+
+        .. versionadded:: 0.25.0
+
+        By default the values of each column are stored contiguously, which
+        makes selecting and computing on a column cheap, but the array of
+        :attr:`DataFrame.values` is then Fortran-ordered and handing it to
+        code that requires a C-contiguous array copies it. With the
+        ``'row'`` layout the values of each row are stored contiguously
+        instead, and :attr:`DataFrame.values` of a single-dtype DataFrame is
+        a C-contiguous view on the data.
+
+        The layout is kept by :meth:`DataFrame.copy` and when blocks of the
+        same dtype are consolidated; other operations may return a
+        DataFrame in the default ``'column'`` layout.
+
+        Parameters
+        ----------
+        layout : {'row', 'column'}
+            ``'row'`` to store the values of each row contiguously,
+            ``'column'`` to store the values of each column contiguously.
+        copy : bool, default True
+            Also copy the data that is already stored in ``layout``.
+
+        Returns
+        -------
+        DataFrame
+
+        See Also
+        --------
+        DataFrame.to_numpy : Convert the DataFrame to a NumPy array.
+
+        Notes
+        -----
+        A DataFrame constructed from a two-dimensional C-contiguous NumPy
+        array without copying stores the values of each row contiguously,
+        but only a DataFrame returned by ``to_layout('row')`` keeps them so
+        when copied or consolidated.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame({'A': [1.0, 2.0, 3.0], 'B': [4.0, 5.0, 6.0]})
+        >>> df.values.flags.c_contiguous
+        False
+        >>> df.to_layout('row').values.flags.c_contiguous
+        True
+        """
+        if layout not in ('row', 'column'):
+            raise ValueError("layout must be 'row' or 'column', "
+                             "got {layout!r}".format(layout=layout))
+        new_data = self._data.to_layout(layout, copy=copy)
+        return self._constructor(new_data).__finalize__(self)
+
     def to_dict(self, orient='dict', into=dict):
         """
         Convert the DataFrame to a dictionary.
@@ -2752,25 +2870,29 @@ class DataFrame(NDFrame):
         return self._set_value(index, col, value, takeable=takeable)
 
     def _set_value(self, index, col, value, takeable=False):
-        try:
-            if takeable is True:
-                series = self._iget_item_cache(col)
-                return series._set_value(index, value, takeable=True)
-
-            series = self._get_item_cache(col)
-            engine = self.index._engine
-            engine.set_value(series._values, index, value)
-            return self
-        except (KeyError, TypeError):
+        if not using_copy_on_write():
+            # in copy-on-write mode a column is not a view on the frame's
+            # data, so always set through the indexers below
+            try:
+                if takeable is True:
+                    series = self._iget_item_cache(col)
+                    return series._set_value(index, value, takeable=True)
+
+                series = self._get_item_cache(col)
+                engine = self.index._engine
+                engine.set_value(series._values, index, value)
+                return self
+            except (KeyError, TypeError):
+                pass
 
-            # set using a non-recursive method & reset the cache
-            if takeable:
-                self.iloc[index, col] = value
-            else:
-                self.loc[index, col] = value
-            self._item_cache.pop(col, None)
+        # set using a non-recursive method & reset the cache
+        if takeable:
+            self.iloc[index, col] = value
+        else:
+            self.loc[index, col] = value
+        self._item_cache.pop(col, None)
 
-            return self
+        return self
     _set_value.__doc__ = set_value.__doc__
 
     def _ixs(self, i, axis=0):
@@ -2925,6 +3047,9 @@ class DataFrame(NDFrame):
                 result.columns = result_columns
             else:
                 new_values = self.values[:, loc]
+                if using_copy_on_write() and isinstance(loc, slice):
+                    # don't hand out an untracked view of the values
+                    new_values = new_values.copy()
                 result = self._constructor(new_values, index=self.index,
                                            columns=result_columns)
                 result = result.__finalize__(self)
@@ -3434,6 +3559,8 @@ class DataFrame(NDFrame):
         value = self._sanitize_column(column, value, broadcast=False)
         self._data.insert(loc, column, value,
                           allow_duplicates=allow_duplicates)
+        # the insert may have moved the values of cached columns
+        self._clear_item_cache()
 
     def assign(self, **kwargs):
         r"""
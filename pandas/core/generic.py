@@ -43,7 +43,7 @@ from pandas.core.index import (
 from pandas.core.indexes.datetimes import DatetimeIndex
 from pandas.core.indexes.period import Period, PeriodIndex
 import pandas.core.indexing as indexing
-from pandas.core.internals import BlockManager
+from pandas.core.internals import BlockManager, using_copy_on_write
 from pandas.core.ops import _align_method_FRAME
 
 from pandas.io.formats.format import DataFrameFormatter, format_percentiles
@@ -109,13 +109,14 @@ class NDFrame(PandasObject, SelectionMixin):
     _internal_names = ['_data', '_cacher', '_item_cache', '_cache', '_is_copy',
                        '_subtyp', '_name', '_index', '_default_kind',
                        '_default_fill_value', '_metadata', '__array_struct__',
-                       '__array_interface__']
+                       '__array_interface__', '_scalar_access_axes']
     _internal_names_set = set(_internal_names)
     _accessors = frozenset()
     _deprecations = frozenset(['as_blocks', 'blocks',
                                'convert_objects', 'is_copy'])
     _metadata = []
     _is_copy = None
+    _scalar_access_axes = None
 
     # dummy attribute so that datetime.__eq__(Series/DataFrame) defers
     # by returning NotImplemented
@@ -637,6 +638,7 @@ class NDFrame(PandasObject, SelectionMixin):
     def _set_axis(self, axis, labels):
         self._data.set_axis(axis, labels)
         self._clear_item_cache()
+        self._scalar_access_axes = None
 
     def transpose(self, *args, **kwargs):
         """
@@ -674,7 +676,9 @@ class NDFrame(PandasObject, SelectionMixin):
         new_axes = self._construct_axes_dict_from(self, [self._get_axis(x)
                                                          for x in axes_names])
         new_values = self.values.transpose(axes_numbers)
-        if kwargs.pop('copy', None) or (len(args) and args[-1]):
+        copy = kwargs.pop('copy', None) or (len(args) and args[-1])
+        if copy or (using_copy_on_write() and not self._is_mixed_type):
+            # in copy-on-write mode the values would be an untracked view
             new_values = new_values.copy()
 
         nv.validate_transpose_for_generic(self, kwargs)
@@ -701,7 +705,8 @@ class NDFrame(PandasObject, SelectionMixin):
         new_axes = (self._get_axis(mapping.get(k, k))
                     for k in range(self._AXIS_LEN))
         new_values = self.values.swapaxes(i, j)
-        if copy:
+        if copy or (using_copy_on_write() and not self._is_mixed_type):
+            # in copy-on-write mode the values would be an untracked view
             new_values = new_values.copy()
 
         return self._constructor(new_values, *new_axes).__finalize__(self)
@@ -2529,7 +2534,7 @@ class NDFrame(PandasObject, SelectionMixin):
                    dtype=dtype, method=method)
 
     def to_pickle(self, path, compression='infer',
-                  protocol=pkl.HIGHEST_PROTOCOL):
+                  protocol=pkl.HIGHEST_PROTOCOL, out_of_band=False):
         """
         Pickle (serialize) object to file.
 
@@ -2554,6 +2559,13 @@ class NDFrame(PandasObject, SelectionMixin):
 
             .. [1] https://docs.python.org/3/library/pickle.html
             .. versionadded:: 0.21.0
+        out_of_band : bool, default False
+            Write the block values after the pickle stream instead of copying
+            them into it, using pickle protocol 5 out-of-band buffers.
+            Requires Python >= 3.8 or the ``pickle5`` package. Such files can
+            be memory-mapped back with ``read_pickle(..., memory_map=True)``.
+
+            .. versionadded:: 0.25.0
 
         See Also
         --------
@@ -2588,7 +2600,7 @@ class NDFrame(PandasObject, SelectionMixin):
         """
         from pandas.io.pickle import to_pickle
         return to_pickle(self, path, compression=compression,
-                         protocol=protocol)
+                         protocol=protocol, out_of_band=out_of_band)
 
     def to_clipboard(self, excel=True, sep=None, **kwargs):
         r"""
@@ -3052,6 +3064,11 @@ class NDFrame(PandasObject, SelectionMixin):
 
     def _get_item_cache(self, item):
         """Return the cached item, item represents a label indexer."""
+        if using_copy_on_write():
+            # a cached item would go stale as soon as either side is
+            # modified, so hand out a fresh view each time
+            return self._box_item_values(item, self._data.get(item))
+
         cache = self._item_cache
         res = cache.get(item)
         if res is None:
@@ -3228,7 +3245,11 @@ class NDFrame(PandasObject, SelectionMixin):
         # this is in general not a good practice and we recommend using .loc.
         df.iloc[0:5]['group'] = 'a'
 
+        In copy-on-write mode a modified slice never shares its data with the
+        original object, so there is nothing to warn about.
         """
+        if using_copy_on_write():
+            return
 
         if force or self._is_copy:
 
@@ -6116,7 +6137,13 @@ class NDFrame(PandasObject, SelectionMixin):
                     if k not in result:
                         continue
                     obj = result[k]
-                    obj.fillna(v, limit=limit, inplace=True, downcast=downcast)
+                    if using_copy_on_write():
+                        # the column is not a view of result, assign it back
+                        result[k] = obj.fillna(v, limit=limit,
+                                               downcast=downcast)
+                    else:
+                        obj.fillna(v, limit=limit, inplace=True,
+                                   downcast=downcast)
                 return result if not inplace else None
 
             elif not is_list_like(value):
@@ -37,6 +37,7 @@ import pandas.core.algorithms as algos
 from pandas.core.arrays import ExtensionArray
 from pandas.core.base import IndexOpsMixin, PandasObject
 import pandas.core.common as com
+from pandas.core.config import get_option
 from pandas.core.indexes.frozen import FrozenList
 import pandas.core.missing as missing
 from pandas.core.ops import get_op_result_name, make_invalid_op
@@ -162,6 +163,72 @@ def _new_Index(cls, d):
     return cls.__new__(cls, **d)
 
 
+def _new_Index_with_engine(func, args, engine_state):
+    """
+    Unpickle an index pickled with the state of its engine, see
+    Index.__reduce_ex__.
+    """
+    index = func(*args)
+    index._engine.set_mapping_state(engine_state)
+    return index
+
+
+# header of the files written by Index.dump_engine: the magic string, the
+# dtype of the keys, the checksum of the values and the sizes of the hash
+# table, followed by its flags, keys and vals arrays, each starting at a
+# multiple of 8 bytes
+_ENGINE_MAGIC = b'PDENGINE'
+_ENGINE_FIELDS = ['n_values', 'checksum', 'n_buckets', 'size', 'n_occupied',
+                  'upper_bound']
+_ENGINE_HEADER_SIZE = 16 + 8 * len(_ENGINE_FIELDS)
+
+
+def _padded(nbytes):
+    return -(-nbytes // 8) * 8
+
+
+def _write_engine_state(state, path):
+    keys_dtype = state['keys'].dtype.str.encode('ascii')
+    header = np.array([state[field] for field in _ENGINE_FIELDS],
+                      dtype=np.int64)
+    with open(path, 'wb') as f:
+        f.write(_ENGINE_MAGIC + keys_dtype.ljust(8, b'\0'))
+        f.write(header.tobytes())
+        for name in ['flags', 'keys', 'vals']:
+            arr = state[name]
+            f.write(arr.tobytes())
+            f.write(b'\0' * (_padded(arr.nbytes) - arr.nbytes))
+
+
+def _read_engine_state(path, mmap=True):
+    if mmap:
+        buf = np.memmap(path, dtype=np.uint8, mode='r')
+    else:
+        buf = np.fromfile(path, dtype=np.uint8)
+
+    if (len(buf) < _ENGINE_HEADER_SIZE or
+            buf[:8].tobytes() != _ENGINE_MAGIC):
+        raise ValueError("{path} is not a file written by "
+                         "Index.dump_engine".format(path=path))
+    keys_dtype = np.dtype(buf[8:16].tobytes().rstrip(b'\0').decode('ascii'))
+    header = buf[16:_ENGINE_HEADER_SIZE].view(np.int64)
+    state = {field: int(value) for field, value in zip(_ENGINE_FIELDS,
+                                                       header)}
+
+    n_buckets = state['n_buckets']
+    n_flags = 0 if n_buckets == 0 else max(n_buckets >> 5, 1)
+    offset = _ENGINE_HEADER_SIZE
+    for name, dtype, n in [('flags', np.uint32, n_flags),
+                           ('keys', keys_dtype, n_buckets),
+                           ('vals', np.uintp, n_buckets)]:
+        nbytes = n * np.dtype(dtype).itemsize
+        if offset + nbytes > len(buf):
+            raise ValueError("{path} is truncated".format(path=path))
+        state[name] = buf[offset:offset + nbytes].view(dtype)
+        offset += _padded(nbytes)
+    return state
+
+
 class Index(IndexOpsMixin, PandasObject):
     """
     Immutable ndarray implementing an ordered, sliceable set. The basic object
@@ -565,6 +632,7 @@ class Index(IndexOpsMixin, PandasObject):
 
     @Appender(_index_shared_docs['_shallow_copy'])
     def _shallow_copy(self, values=None, **kwargs):
+        same_values = values is None
         if values is None:
             values = self.values
         attributes = self._get_attributes_dict()
@@ -579,7 +647,10 @@ class Index(IndexOpsMixin, PandasObject):
             #  more specifically
             values = values.asi8
 
-        return self._simple_new(values, **attributes)
+        result = self._simple_new(values, **attributes)
+        if same_values:
+            result._share_engine_state(self)
+        return result
 
     def _shallow_copy_with_infer(self, values, **kwargs):
         """
@@ -645,6 +716,56 @@ class Index(IndexOpsMixin, PandasObject):
         # property, for now, slow to look up
         return self._engine_type(lambda: self._ndarray_values, len(self))
 
+    def _built_engine_of(self, other):
+        """
+        Return the engine of ``other`` if it has been built already and can
+        pass its state to the engine of ``self``, which must not be built
+        yet, None otherwise.
+        """
+        engine = getattr(other, '_cache', {}).get('_engine')
+        if (engine is None or type(engine) is not self._engine_type or
+                not is_dtype_equal(self.dtype, other.dtype) or
+                '_engine' in getattr(self, '_cache', {})):
+            return None
+        return engine
+
+    def _inherit_engine(self, other):
+        """
+        Build the engine from the engine of ``other``, if it has been built
+        already and the values of ``self`` start with the values of
+        ``other``, so only the appended values are hashed and checked.
+        """
+        engine = self._built_engine_of(other)
+        if engine is not None:
+            self._engine.extend_state(engine)
+
+    def _share_engine_state(self, other, indexer=None):
+        """
+        Take over what the engine of ``other`` knows about the monotonicity
+        and uniqueness of its values, if it has been built already.
+
+        ``self`` holds the values of ``other`` at ``indexer``, a slice or an
+        array of increasing or decreasing positions, or all of them if None;
+        the hash table is only shared in the latter case.
+        """
+        engine = self._built_engine_of(other)
+        if engine is None:
+            return
+
+        if indexer is None:
+            self._engine.share_state(engine)
+        elif isinstance(indexer, slice):
+            reverse = indexer.step is not None and indexer.step < 0
+            self._engine.share_state(engine, subset=True, reverse=reverse)
+        else:
+            indexer = ensure_int64(indexer)
+            if len(indexer) and min(indexer[0], indexer[-1]) < 0:
+                # positions from the end are not ordered with the others
+                return
+            inc, dec, strict = libalgos.is_monotonic(indexer, False)
+            if strict:
+                self._engine.share_state(engine, subset=True, reverse=not inc)
+
     # --------------------------------------------------------------------
     # Array-Like Methods
 
@@ -796,7 +917,9 @@ class Index(IndexOpsMixin, PandasObject):
                 msg = 'Unable to fill values because {0} cannot contain NA'
                 raise ValueError(msg.format(self.__class__.__name__))
             taken = self.values.take(indices)
-        return self._shallow_copy(taken)
+        result = self._shallow_copy(taken)
+        result._share_engine_state(self, indices)
+        return result
 
     def _assert_take_fillable(self, values, indices, allow_fill=True,
                               fill_value=None, na_value=np.nan):
@@ -888,6 +1011,7 @@ class Index(IndexOpsMixin, PandasObject):
     def copy(self, name=None, deep=False, dtype=None, **kwargs):
         if deep:
             new_index = self._shallow_copy(self._data.copy())
+            new_index._share_engine_state(self)
         else:
             new_index = self._shallow_copy()
 
@@ -1746,6 +1870,21 @@ class Index(IndexOpsMixin, PandasObject):
         d.update(self._get_attributes_dict())
         return _new_Index, (self.__class__, d), None
 
+    def __reduce_ex__(self, protocol):
+        reduced = self.__reduce__()
+        if not get_option('io.pickle.index_engine'):
+            return reduced
+
+        engine = getattr(self, '_cache', {}).get('_engine')
+        if (engine is None or
+                not getattr(engine, 'is_mapping_populated', False) or
+                not hasattr(engine.mapping, 'get_state')):
+            return reduced
+        func, args = reduced[:2]
+        return ((_new_Index_with_engine,
+                 (func, args, engine.get_mapping_state())) +
+                tuple(reduced[2:]))
+
     def __setstate__(self, state):
         """
         Necessary for making this object picklable.
@@ -1775,6 +1914,79 @@ class Index(IndexOpsMixin, PandasObject):
 
     _unpickle_compat = __setstate__
 
+    def dump_engine(self, path):
+        """
+        Write the hash table used to look up labels to a file.
+
+        .. versionadded:: 0.25.0
+
+        The table is built first if needed. An index with the same values,
+        for instance in another process, can then use the table with
+        :meth:`Index.load_engine` instead of building it.
+
+        Parameters
+        ----------
+        path : str
+            File path, the file is written in the native byte order.
+
+        Raises
+        ------
+        TypeError
+            If the labels of the index are not looked up with a hash table
+            that can be saved, e.g. for object values.
+
+        See Also
+        --------
+        Index.load_engine : Use the hash table of a file.
+        """
+        from pandas.io.common import _stringify_path
+
+        engine = self._engine
+        if not hasattr(engine, 'get_mapping_state'):
+            raise TypeError("the labels of {name} are not looked up with a "
+                            "hash table".format(name=type(self).__name__))
+        _write_engine_state(engine.get_mapping_state(),
+                            _stringify_path(path))
+
+    def load_engine(self, path, mmap=True):
+        """
+        Use the hash table of a file written by :meth:`Index.dump_engine`.
+
+        .. versionadded:: 0.25.0
+
+        The file must have been written by an index with the same values.
+        Its table is used read-only and is not copied when ``mmap`` is True,
+        so processes loading the same file share its memory.
+
+        Parameters
+        ----------
+        path : str
+            File path.
+        mmap : bool, default True
+            Memory-map the file instead of reading it into memory.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a hash table of an index with the same
+            values and dtype.
+        TypeError
+            If the labels of the index are not looked up with a hash table
+            that can be loaded, e.g. for object values.
+
+        See Also
+        --------
+        Index.dump_engine : Write the hash table to a file.
+        """
+        from pandas.io.common import _stringify_path
+
+        engine = self._engine
+        if not hasattr(engine, 'set_mapping_state'):
+            raise TypeError("the labels of {name} are not looked up with a "
+                            "hash table".format(name=type(self).__name__))
+        state = _read_engine_state(_stringify_path(path), mmap=mmap)
+        engine.set_mapping_state(state)
+
     # --------------------------------------------------------------------
     # Null Handling Methods
 
@@ -3959,7 +4171,9 @@ class Index(IndexOpsMixin, PandasObject):
         if isinstance(key, slice):
             # This case is separated from the conditional above to avoid
             # pessimization of basic indexing.
-            return promote(getitem(key))
+            result = promote(getitem(key))
+            result._share_engine_state(self, key)
+            return result
 
         if com.is_bool_indexer(key):
             key = np.asarray(key, dtype=bool)
@@ -4011,7 +4225,9 @@ class Index(IndexOpsMixin, PandasObject):
         names = {obj.name for obj in to_concat}
         name = None if len(names) > 1 else self.name
 
-        return self._concat(to_concat, name)
+        result = self._concat(to_concat, name)
+        result._inherit_engine(self)
+        return result
 
     def _concat(self, to_concat, name):
 
@@ -4933,7 +5149,10 @@ class Index(IndexOpsMixin, PandasObject):
         _self = np.asarray(self)
         item = self._coerce_scalar_to_index(item)._ndarray_values
         idx = np.concatenate((_self[:loc], item, _self[loc:]))
-        return self._shallow_copy_with_infer(idx)
+        result = self._shallow_copy_with_infer(idx)
+        if loc == len(self):
+            result._inherit_engine(self)
+        return result
 
     def drop(self, labels, errors='raise'):
         """
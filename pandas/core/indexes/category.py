@@ -769,7 +769,10 @@ class CategoricalIndex(Index, accessor.PandasDelegate):
 
         codes = self.codes
         codes = np.concatenate((codes[:loc], code, codes[loc:]))
-        return self._create_from_codes(codes)
+        result = self._create_from_codes(codes)
+        if loc == len(self):
+            result._inherit_engine(self)
+        return result
 
     def _concat(self, to_concat, name):
         # if calling index is category, don't check dtype of others
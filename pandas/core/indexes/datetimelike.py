@@ -278,7 +278,9 @@ class DatetimeIndexOpsMixin(ExtensionOpsMixin):
 
         # keep freq in PeriodArray/Index, reset otherwise
         freq = self.freq if is_period_dtype(self) else None
-        return self._shallow_copy(taken, freq=freq)
+        result = self._shallow_copy(taken, freq=freq)
+        result._share_engine_state(self, indices)
+        return result
 
     _can_hold_na = True
 
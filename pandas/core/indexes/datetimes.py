@@ -1175,7 +1175,10 @@ class DatetimeIndex(DatetimeIndexOpsMixin, Int64Index, DatetimeDelegateMixin):
             # even though it only has 1 dim by definition
             assert isinstance(result, np.ndarray), result
             return result
-        return type(self)(result, name=self.name)
+        result = type(self)(result, name=self.name)
+        if isinstance(key, slice):
+            result._share_engine_state(self, key)
+        return result
 
     @property
     def _box_func(self):
@@ -1244,7 +1247,7 @@ class DatetimeIndex(DatetimeIndexOpsMixin, Int64Index, DatetimeDelegateMixin):
         try:
             new_dates = np.concatenate((self[:loc].asi8, [item.view(np.int64)],
                                         self[loc:].asi8))
-            return self._shallow_copy(new_dates, freq=freq)
+            result = self._shallow_copy(new_dates, freq=freq)
         except (AttributeError, TypeError):
 
             # fall back to object index
@@ -1253,6 +1256,10 @@ class DatetimeIndex(DatetimeIndexOpsMixin, Int64Index, DatetimeDelegateMixin):
             raise TypeError(
                 "cannot insert DatetimeIndex with incompatible label")
 
+        if loc == len(self):
+            result._inherit_engine(self)
+        return result
+
     def delete(self, loc):
         """
         Make a new DatetimeIndex with passed location(s) deleted.
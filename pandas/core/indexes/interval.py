@@ -5,7 +5,8 @@ import warnings
 import numpy as np
 
 from pandas._libs import Timedelta, Timestamp
-from pandas._libs.interval import Interval, IntervalMixin, IntervalTree
+from pandas._libs.interval import (
+    Interval, IntervalMixin, IntervalTree, overlapping_pairs)
 from pandas.compat import add_metaclass
 from pandas.util._decorators import Appender, cache_readonly
 from pandas.util._doctools import _WritableDoc
@@ -16,7 +17,8 @@ from pandas.core.dtypes.cast import (
 from pandas.core.dtypes.common import (
     ensure_platform_int, is_datetime64tz_dtype, is_datetime_or_timedelta_dtype,
     is_dtype_equal, is_float, is_float_dtype, is_integer, is_integer_dtype,
-    is_interval_dtype, is_list_like, is_number, is_object_dtype, is_scalar)
+    is_interval_dtype, is_list_like, is_number, is_object_dtype, is_scalar,
+    is_unsigned_integer_dtype, needs_i8_conversion)
 from pandas.core.dtypes.missing import isna
 
 from pandas.core.arrays.interval import IntervalArray, _interval_shared_docs
@@ -1093,6 +1095,95 @@ class IntervalIndex(IntervalMixin, Index):
     def overlaps(self, other):
         return self._data.overlaps(other)
 
+    def overlaps_indexer(self, other):
+        """
+        Find all the pairs of overlapping intervals of the IntervalIndex and
+        another IntervalIndex.
+
+        Two intervals overlap if they share a common point, including closed
+        endpoints. Intervals that only have an open endpoint in common do not
+        overlap. Missing intervals overlap nothing.
+
+        Both sets of intervals are sorted by their left bound and swept
+        once, so the time and memory grow with the number of intervals and
+        of overlapping pairs, rather than with the product of the lengths.
+
+        .. versionadded:: 0.25.0
+
+        Parameters
+        ----------
+        other : IntervalIndex or IntervalArray
+            Intervals to check against for overlaps.
+
+        Returns
+        -------
+        indexer : ndarray of int
+            Positions of the overlapping intervals in the IntervalIndex.
+        other_indexer : ndarray of int
+            Positions in `other` of the intervals overlapping the intervals
+            at ``indexer``. The pairs are sorted by ``indexer``, then by
+            ``other_indexer``.
+
+        Raises
+        ------
+        TypeError
+            If `other` is not interval-like, or the bounds of the intervals
+            can not be compared.
+
+        See Also
+        --------
+        IntervalIndex.overlaps : Check an IntervalIndex elementwise for
+            overlaps with an Interval.
+
+        Examples
+        --------
+        >>> index = pd.IntervalIndex.from_tuples([(0, 2), (1, 3), (4, 5)])
+        >>> other = pd.IntervalIndex.from_tuples([(2, 4), (5, 6)],
+        ...                                      closed='left')
+        >>> index.overlaps_indexer(other)
+        (array([0, 1, 2]), array([0, 0, 1]))
+        """
+        if not isinstance(other, IntervalIndex):
+            if not is_interval_dtype(other):
+                msg = '`other` must be an IntervalIndex, got {other}'
+                raise TypeError(msg.format(other=type(other).__name__))
+            other = IntervalIndex(other)
+
+        subtype = find_common_type([self.dtype.subtype, other.dtype.subtype])
+        if is_object_dtype(subtype):
+            msg = ('can only do overlaps_indexer between two IntervalIndex '
+                   'objects that have compatible dtypes')
+            raise TypeError(msg)
+
+        def bounds(index):
+            # positions and comparable bounds of the non-missing intervals
+            positions = np.flatnonzero(~index.isna())
+            left = index.left.take(positions)
+            right = index.right.take(positions)
+            if needs_i8_conversion(subtype):
+                return positions, left.asi8, right.asi8
+            elif is_unsigned_integer_dtype(subtype):
+                dtype = np.uint64
+            elif is_integer_dtype(subtype):
+                dtype = np.int64
+            else:
+                dtype = np.float64
+            return (positions, left.values.astype(dtype),
+                    right.values.astype(dtype))
+
+        positions, left, right = bounds(self)
+        other_positions, other_left, other_right = bounds(other)
+        indexer, other_indexer = overlapping_pairs(
+            left, right, other_left, other_right,
+            not (self.closed_left and other.closed_right),
+            not (other.closed_left and self.closed_right))
+
+        indexer = positions.take(indexer)
+        other_indexer = other_positions.take(other_indexer)
+        order = np.lexsort((other_indexer, indexer))
+        return (ensure_platform_int(indexer.take(order)),
+                ensure_platform_int(other_indexer.take(order)))
+
     def _setop(op_name, sort=None):
         def func(self, other, sort=sort):
             other = self._as_like_interval_index(other)
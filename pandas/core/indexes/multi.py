@@ -8,6 +8,7 @@ import numpy as np
 
 from pandas._libs import (
     Timestamp, algos as libalgos, index as libindex, lib, tslibs)
+from pandas._libs.hashtable import duplicated_int64
 import pandas.compat as compat
 from pandas.compat import lrange, lzip, map, range, zip
 from pandas.compat.numpy import function as nv
@@ -1178,6 +1179,15 @@ class MultiIndex(Index):
         self._tuples = lib.fast_zip(values)
         return self._tuples
 
+    @property
+    def shape(self):
+        # not the shape of .values, which would build the tuples
+        return (len(self), )
+
+    @property
+    def size(self):
+        return len(self)
+
     @property
     def _has_complex_internals(self):
         # to disable groupby tricks
@@ -1264,7 +1274,6 @@ class MultiIndex(Index):
     @Appender(Index.duplicated.__doc__)
     def duplicated(self, keep='first'):
         from pandas.core.sorting import get_group_index
-        from pandas._libs.hashtable import duplicated_int64
 
         shape = map(len, self.levels)
         ids = get_group_index(self.codes, shape, sort=False, xnull=False)
@@ -1417,7 +1426,7 @@ class MultiIndex(Index):
     def unique(self, level=None):
 
         if level is None:
-            return super(MultiIndex, self).unique()
+            return self.drop_duplicates()
         else:
             level = self._get_level_number(level)
             return self._get_level_values(level=level, unique=True)
@@ -1855,6 +1864,8 @@ class MultiIndex(Index):
             return Index(new_tuples)
 
     def argsort(self, *args, **kwargs):
+        if not args and not kwargs:
+            return _lexsort_codes(self.levels, self.codes)
         return self.values.argsort(*args, **kwargs)
 
     @Appender(_index_shared_docs['repeat'] % _index_doc_kwargs)
@@ -2135,6 +2146,12 @@ class MultiIndex(Index):
             if mask.any():
                 raise KeyError('%s not in index' % keyarr[mask])
 
+        # tuples shorter than the levels select the labels starting with them
+        elif (indexer is None and len(keyarr) and
+              all(isinstance(key, tuple) for key in keyarr) and
+              any(len(key) < self.nlevels for key in keyarr)):
+            indexer = self._get_partial_tuples_indexer(keyarr)
+
         return indexer, keyarr
 
     @Appender(_index_shared_docs['get_indexer'] % _index_doc_kwargs)
@@ -2151,12 +2168,21 @@ class MultiIndex(Index):
                 target = MultiIndex.from_tuples(target)
             except (TypeError, ValueError):
 
-                # let's instead try with a straight Index
+                # let's instead try with a straight Index, only the tuples
+                # of the right length can be found
                 if method is None:
-                    return Index(self.values).get_indexer(target,
-                                                          method=method,
-                                                          limit=limit,
-                                                          tolerance=tolerance)
+                    if not self.is_unique:
+                        raise InvalidIndexError('Reindexing only valid with '
+                                                'uniquely valued Index '
+                                                'objects')
+                    indexer = np.repeat(-1, len(target))
+                    found = np.array([isinstance(key, tuple) and
+                                      len(key) == self.nlevels
+                                      for key in target], dtype=bool)
+                    if found.any():
+                        indexer[found] = self._engine.get_indexer(
+                            target[found])
+                    return ensure_platform_int(indexer)
 
         if not self.is_unique:
             raise ValueError('Reindexing only valid with uniquely valued '
@@ -2709,6 +2735,10 @@ class MultiIndex(Index):
                                      'to be lexsorted: slicing on levels {0}, '
                                      'lexsort depth {1}'
                                      .format(true_slices, self.lexsort_depth))
+        locs = self._get_locs_codes(seq)
+        if locs is not None:
+            return locs
+
         # indexer
         # this is the list of all values that we want to select
         n = len(self)
@@ -2786,6 +2816,172 @@ class MultiIndex(Index):
             return Int64Index([])._ndarray_values
         return indexer._ndarray_values
 
+    @cache_readonly
+    def _sorted_codes_ints(self):
+        # the integers representing the labels in the engine, sorted, and the
+        # positions sorting them or None if they already are sorted
+        engine = self._engine
+        ints = engine.vgetter()
+        if engine.is_monotonic_increasing:
+            return ints, None
+        order = ints.argsort(kind='mergesort')
+        return ints.take(order), order
+
+    def _get_prefix_ranges(self, codes):
+        """
+        Find the labels starting with each of some combinations of codes.
+
+        Parameters
+        ----------
+        codes : list of ndarray
+            The codes of the first ``len(codes)`` levels, -1 for NaN, one
+            combination per position.
+
+        Returns
+        -------
+        starts, ends : ndarray
+            For each combination, the bounds of the positions of its labels
+            in ``order``.
+        order : ndarray or None
+            The positions of the labels in the order of their codes, or None
+            if the index is sorted.
+        """
+        engine = self._engine
+        full_codes = np.zeros((len(codes[0]), self.nlevels), dtype='uint64')
+        for i, level_codes in enumerate(codes):
+            full_codes[:, i] = level_codes + 1
+        keys = engine._codes_to_ints(full_codes)
+
+        # the codes of the following levels are in the lower bits
+        lower = ((np.uint64(1) << engine.offsets[len(codes) - 1]) -
+                 np.uint64(1))
+        ints, order = self._sorted_codes_ints
+        starts = ints.searchsorted(keys, side='left')
+        ends = ints.searchsorted(keys | lower, side='right')
+        return starts, ends, order
+
+    def _get_locs_codes(self, seq):
+        """
+        get_locs for a sequence of labels, lists of labels and slices of
+        labels, searching all the combinations of their codes at once.
+
+        Returns None if the keys or the index are not supported, e.g. for
+        boolean masks, labels missing from the levels or too many levels to
+        represent the labels with 64 bit integers.
+        """
+        from pandas.core.reshape.util import cartesian_product
+
+        if not isinstance(self._engine, MultiIndexUIntEngine):
+            return None
+
+        # the levels after the last key that is not a null slice select all
+        depth = len(seq)
+        while depth and com.is_null_slice(seq[depth - 1]):
+            depth -= 1
+        if depth == 0 or depth > self.nlevels:
+            return None
+
+        codes = []
+        n_combinations = 1
+        for i, k in enumerate(seq[:depth]):
+            level_index = self.levels[i]
+            if com.is_bool_indexer(k):
+                return None
+            elif com.is_null_slice(k):
+                level_codes = np.arange(len(level_index))
+            elif isinstance(k, slice):
+                # partial slices (e.g. of dates) are left to the label by
+                # label lookup
+                try:
+                    start = (0 if k.start is None else
+                             level_index.get_loc(k.start))
+                    stop = (len(level_index) - 1 if k.stop is None else
+                            level_index.get_loc(k.stop))
+                except KeyError:
+                    return None
+                if not is_integer(start) or not is_integer(stop):
+                    return None
+                level_codes = np.arange(start, stop + 1, k.step)
+            elif is_list_like(k):
+                level_codes = level_index.get_indexer(k)
+                if (level_codes == -1).any():
+                    return None
+            else:
+                level_codes = level_index.get_loc(k)
+                if not is_integer(level_codes):
+                    return None
+                level_codes = [level_codes]
+
+            codes.append(np.unique(ensure_int64(level_codes)))
+            n_combinations *= len(codes[-1])
+            if n_combinations > max(len(self), 1000):
+                return None
+
+        if n_combinations == 0:
+            return np.array([], dtype='int64')
+
+        starts, ends, order = self._get_prefix_ranges(
+            cartesian_product(codes))
+        locs = _positions_in_ranges(starts, ends)
+        if order is not None:
+            locs = np.sort(order.take(locs))
+
+        if not len(locs):
+            # like the label by label lookup: labels that are unused by the
+            # index raise, unless a list of unused labels comes first
+            for i, k in enumerate(seq[:depth]):
+                if (not isinstance(k, slice) and
+                        not np.in1d(codes[i], self.codes[i]).any()):
+                    if is_list_like(k):
+                        break
+                    raise KeyError(k)
+        return locs
+
+    def _get_partial_tuples_indexer(self, keys):
+        """
+        Positions of the labels starting with each of the tuples ``keys``,
+        the labels of each key in the order of the index, or None if the
+        labels can not be represented with 64 bit integers.
+        """
+        if not isinstance(self._engine, MultiIndexUIntEngine):
+            return None
+
+        depths = np.array([len(key) for key in keys])
+        starts = np.empty(len(keys), dtype=np.intp)
+        ends = np.empty(len(keys), dtype=np.intp)
+        order = None
+        for depth in np.unique(depths):
+            if depth == 0 or depth > self.nlevels:
+                raise KeyError('Key length ({0}) exceeds index depth ({1})'
+                               ''.format(depth, self.nlevels))
+            where = np.flatnonzero(depths == depth)
+            codes = []
+            for i in range(depth):
+                labels = [keys[j][i] for j in where]
+                level_codes = self.levels[i].get_indexer(labels)
+                # missing labels other than NaN
+                mask = (level_codes == -1) & ~isna(labels)
+                if mask.any():
+                    raise KeyError('%s not in index'
+                                   % [keys[j] for j in where[mask]])
+                codes.append(level_codes)
+            starts[where], ends[where], order = self._get_prefix_ranges(
+                codes)
+
+        mask = starts == ends
+        if mask.any():
+            raise KeyError('%s not in index' % [key for key, missing
+                                                in zip(keys, mask)
+                                                if missing])
+
+        locs = _positions_in_ranges(starts, ends)
+        if order is not None:
+            # restore the order of the index among the labels of each key
+            locs = order.take(locs)
+            key_ids = np.repeat(np.arange(len(keys)), ends - starts)
+            locs = locs[np.lexsort((locs, key_ids))]
+        return locs
+
     def truncate(self, before=None, after=None):
         """
         Slice index between two labels / tuples, return new MultiIndex
@@ -2920,12 +3116,26 @@ class MultiIndex(Index):
 
         # TODO: Index.union returns other when `len(self)` is 0.
 
-        uniq_tuples = lib.fast_unique_multiple([self._ndarray_values,
-                                                other._ndarray_values],
-                                               sort=sort)
+        if not self._can_setop_codes(other):
+            uniq_tuples = lib.fast_unique_multiple([self._ndarray_values,
+                                                    other._ndarray_values],
+                                                   sort=sort)
+            return MultiIndex.from_arrays(lzip(*uniq_tuples), sortorder=0,
+                                          names=result_names)
 
-        return MultiIndex.from_arrays(lzip(*uniq_tuples), sortorder=0,
-                                      names=result_names)
+        levels, ids, other_ids, codes, other_codes = self._setop_codes(other)
+        codes = [np.concatenate([level_codes, other_level_codes])
+                 for level_codes, other_level_codes in zip(codes, other_codes)]
+        indexer = np.flatnonzero(
+            ~duplicated_int64(np.concatenate([ids, other_ids]), 'first'))
+
+        try:
+            return self._from_setop_codes(levels, codes, indexer, sort,
+                                          result_names)
+        except TypeError:
+            # like fast_unique_multiple, leave incomparable labels unsorted
+            return self._from_setop_codes(levels, codes, indexer, False,
+                                          result_names)
 
     def intersection(self, other, sort=False):
         """
@@ -2955,20 +3165,31 @@ class MultiIndex(Index):
         if self.equals(other):
             return self
 
-        self_tuples = self._ndarray_values
-        other_tuples = other._ndarray_values
-        uniq_tuples = set(self_tuples) & set(other_tuples)
+        if not self._can_setop_codes(other):
+            self_tuples = self._ndarray_values
+            other_tuples = other._ndarray_values
+            uniq_tuples = set(self_tuples) & set(other_tuples)
 
-        if sort is None:
-            uniq_tuples = sorted(uniq_tuples)
+            if sort is None:
+                uniq_tuples = sorted(uniq_tuples)
+
+            if len(uniq_tuples) == 0:
+                return MultiIndex(levels=self.levels,
+                                  codes=[[]] * self.nlevels,
+                                  names=result_names, verify_integrity=False)
+            return MultiIndex.from_arrays(lzip(*uniq_tuples), sortorder=0,
+                                          names=result_names)
 
-        if len(uniq_tuples) == 0:
+        levels, ids, other_ids, codes, _ = self._setop_codes(other)
+        indexer = np.flatnonzero(~duplicated_int64(ids, 'first') &
+                                 algos.isin(ids, other_ids))
+
+        if len(indexer) == 0:
             return MultiIndex(levels=self.levels,
                               codes=[[]] * self.nlevels,
                               names=result_names, verify_integrity=False)
-        else:
-            return MultiIndex.from_arrays(lzip(*uniq_tuples), sortorder=0,
-                                          names=result_names)
+        return self._from_setop_codes(levels, codes, indexer, sort,
+                                      result_names)
 
     def difference(self, other, sort=None):
         """
@@ -3003,24 +3224,157 @@ class MultiIndex(Index):
                               codes=[[]] * self.nlevels,
                               names=result_names, verify_integrity=False)
 
-        this = self._get_unique_index()
+        if not self._can_setop_codes(other):
+            this = self._get_unique_index()
 
-        indexer = this.get_indexer(other)
-        indexer = indexer.take((indexer != -1).nonzero()[0])
+            indexer = this.get_indexer(other)
+            indexer = indexer.take((indexer != -1).nonzero()[0])
 
-        label_diff = np.setdiff1d(np.arange(this.size), indexer,
-                                  assume_unique=True)
-        difference = this.values.take(label_diff)
-        if sort is None:
-            difference = sorted(difference)
+            label_diff = np.setdiff1d(np.arange(this.size), indexer,
+                                      assume_unique=True)
+            difference = this.values.take(label_diff)
+            if sort is None:
+                difference = sorted(difference)
 
-        if len(difference) == 0:
+            if len(difference) == 0:
+                return MultiIndex(levels=[[]] * self.nlevels,
+                                  codes=[[]] * self.nlevels,
+                                  names=result_names, verify_integrity=False)
+            return MultiIndex.from_tuples(difference, sortorder=0,
+                                          names=result_names)
+
+        levels, ids, other_ids, codes, _ = self._setop_codes(other)
+        indexer = np.flatnonzero(~duplicated_int64(ids, 'first') &
+                                 ~algos.isin(ids, other_ids))
+
+        if len(indexer) == 0:
             return MultiIndex(levels=[[]] * self.nlevels,
                               codes=[[]] * self.nlevels,
                               names=result_names, verify_integrity=False)
-        else:
-            return MultiIndex.from_tuples(difference, sortorder=0,
-                                          names=result_names)
+        return self._from_setop_codes(levels, codes, indexer, sort,
+                                      result_names)
+
+    @Appender(Index.symmetric_difference.__doc__)
+    def symmetric_difference(self, other, result_name=None, sort=None):
+        self._validate_sort_keyword(sort)
+        self._assert_can_do_setop(other)
+        other, result_name_update = self._convert_can_do_setop(other)
+        if result_name is None:
+            result_name = result_name_update
+
+        if not self._can_setop_codes(other):
+            return super(MultiIndex, self).symmetric_difference(
+                other, result_name=result_name, sort=sort)
+
+        levels, ids, other_ids, codes, other_codes = self._setop_codes(other)
+        in_both = np.concatenate([algos.isin(ids, other_ids),
+                                  algos.isin(other_ids, ids)])
+        ids = np.concatenate([ids, other_ids])
+        indexer = np.flatnonzero(~duplicated_int64(ids, 'first') & ~in_both)
+
+        if len(indexer) == 0:
+            return MultiIndex(levels=[[]] * self.nlevels,
+                              codes=[[]] * self.nlevels,
+                              names=result_name, verify_integrity=False)
+        codes = [np.concatenate([level_codes, other_level_codes])
+                 for level_codes, other_level_codes in zip(codes, other_codes)]
+        try:
+            return self._from_setop_codes(levels, codes, indexer, sort,
+                                          result_name)
+        except TypeError:
+            return self._from_setop_codes(levels, codes, indexer, False,
+                                          result_name)
+
+    def _can_setop_codes(self, other):
+        """
+        Whether a set operation with `other` can be done on the codes of the
+        levels, rather than on the tuples.
+        """
+        return (isinstance(other, MultiIndex) and
+                other.nlevels == self.nlevels)
+
+    def _setop_codes(self, other):
+        """
+        Return the codes of the MultiIndex and of `other` on shared levels,
+        and the ids of their rows, for set operations without tuples.
+
+        Returns
+        -------
+        levels : list of Index
+            The levels of the MultiIndex, extended with the labels of the
+            levels of `other` that they are missing.
+        ids, other_ids : ndarray of int64
+            Ids of the rows of the MultiIndex and of `other`, equal for equal
+            rows.
+        codes, other_codes : list of ndarray
+            Codes of the MultiIndex and of `other` on ``levels``.
+        """
+        from pandas.core.sorting import get_group_index
+
+        levels, codes, other_codes = [], [], []
+        for lev, level_codes, other_lev, other_level_codes in zip(
+                self.levels, self.codes, other.levels, other.codes):
+            # the raw values of a categorical, as in the tuples
+            if is_categorical_dtype(lev):
+                lev = Index(np.asarray(lev))
+            if is_categorical_dtype(other_lev):
+                other_lev = Index(np.asarray(other_lev))
+            indexer = lev.get_indexer(other_lev)
+            missing = indexer == -1
+            if missing.any():
+                indexer[missing] = np.arange(len(lev),
+                                             len(lev) + missing.sum())
+                lev = lev.append(other_lev[missing])
+            levels.append(lev)
+            codes.append(np.asarray(level_codes))
+            # -1 takes the -1 appended to the indexer
+            other_codes.append(np.append(indexer, -1).take(other_level_codes))
+
+        shape = [len(lev) for lev in levels]
+        ids = get_group_index([np.concatenate([level_codes, other_level_codes])
+                               for level_codes, other_level_codes
+                               in zip(codes, other_codes)],
+                              shape, sort=False, xnull=False)
+        return levels, ids[:len(self)], ids[len(self):], codes, other_codes
+
+    def _from_setop_codes(self, levels, codes, indexer, sort, names):
+        """
+        Return the MultiIndex of the rows at indexer of codes on levels,
+        sorted by their labels if sort is None.
+
+        The result keeps the codes: its levels are the labels in use, sorted
+        when they can be compared, as ``MultiIndex.from_arrays`` would give,
+        without factorizing the labels of every row again.
+        """
+        new_levels, new_codes = [], []
+        for lev, level_codes in zip(levels, codes):
+            level_codes = level_codes.take(indexer)
+            # -1 takes the -1 at the end of the mapping
+            mapping = np.repeat(-1, len(lev) + 1)
+            used = np.bincount(level_codes + 1, minlength=len(lev) + 1)[1:]
+            uniques = np.flatnonzero(used)
+            lev = lev.take(uniques)
+            if is_object_dtype(lev):
+                # e.g. the ints of an object level extended with strings
+                lev = Index(lev._values, tupleize_cols=False)
+            try:
+                sorter = lev.argsort()
+            except TypeError:
+                if sort is None:
+                    raise
+                sorter = np.arange(len(lev))
+            mapping[uniques.take(sorter)] = np.arange(len(lev))
+            new_levels.append(lev.take(sorter))
+            new_codes.append(mapping.take(level_codes))
+
+        if sort is None:
+            sorter = _lexsort_codes(new_levels, new_codes)
+            new_codes = [level_codes.take(sorter) for level_codes in new_codes]
+
+        if names is None:
+            names = [None] * len(new_levels)
+        return MultiIndex(levels=new_levels, codes=new_codes, sortorder=0,
+                          names=names, verify_integrity=False)
 
     @Appender(_index_shared_docs['astype'])
     def astype(self, dtype, copy=True):
@@ -3114,9 +3468,12 @@ class MultiIndex(Index):
     @Appender(Index.isin.__doc__)
     def isin(self, values, level=None):
         if level is None:
-            values = MultiIndex.from_tuples(values,
-                                            names=self.names).values
-            return algos.isin(self.values, values)
+            values = MultiIndex.from_tuples(values, names=self.names)
+            if values.nlevels != self.nlevels:
+                return algos.isin(self.values, values.values)
+            # rows with missing labels match as in the other set operations
+            _, ids, values_ids, _, _ = self._setop_codes(values)
+            return algos.isin(ids, values_ids)
         else:
             num = self._get_level_number(level)
             levs = self.levels[num]
@@ -3134,6 +3491,46 @@ MultiIndex._add_numeric_methods_add_sub_disabled()
 MultiIndex._add_logical_methods_disabled()
 
 
+def _lexsort_codes(levels, codes):
+    """
+    Return the indexer sorting the rows given by codes on levels by their
+    labels, as sorting their tuples would, with missing labels last.
+
+    Raises
+    ------
+    TypeError
+        If the labels of a level can not be compared.
+    """
+    from pandas.core.sorting import indexer_from_factorized
+
+    keys = []
+    for lev, level_codes in zip(levels, codes):
+        # only the labels in use are compared, as in the tuples
+        used = np.flatnonzero(np.bincount(level_codes + 1,
+                                          minlength=len(lev) + 1)[1:])
+        # the raw values of a categorical, as in the tuples
+        sorter = used.take(np.asarray(lev).take(used).argsort())
+        # the rank of the code -1 is len(lev), after all the labels
+        ranks = np.empty(len(lev) + 1, dtype=np.int64)
+        ranks[sorter] = np.arange(len(sorter))
+        ranks[-1] = len(lev)
+        keys.append(ranks.take(level_codes))
+    shape = [len(lev) + 1 for lev in levels]
+    return indexer_from_factorized(keys, shape, compress=False)
+
+
+def _positions_in_ranges(starts, ends):
+    """
+    Concatenate the ranges ``range(start, end)``, as an int64 array.
+    """
+    lengths = ends - starts
+    total = lengths.sum()
+    if total == 0:
+        return np.array([], dtype='int64')
+    offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+    return np.arange(total, dtype='int64') + offsets
+
+
 def _sparsify(label_list, start=0, sentinel=''):
     pivoted = lzip(*label_list)
     k = len(label_list)
@@ -304,6 +304,7 @@ class PeriodIndex(DatetimeIndexOpsMixin, Int64Index, PeriodDelegateMixin):
 
     def _shallow_copy(self, values=None, **kwargs):
         # TODO: simplify, figure out type of values
+        same_values = values is None
         if values is None:
             values = self._data
 
@@ -330,7 +331,10 @@ class PeriodIndex(DatetimeIndexOpsMixin, Int64Index, PeriodDelegateMixin):
         attributes.update(kwargs)
         if not len(values) and 'dtype' not in kwargs:
             attributes['dtype'] = self.dtype
-        return self._simple_new(values, **attributes)
+        result = self._simple_new(values, **attributes)
+        if same_values:
+            result._share_engine_state(self)
+        return result
 
     def _shallow_copy_with_infer(self, values=None, **kwargs):
         """ we always want to return a PeriodIndex """
@@ -784,7 +788,10 @@ class PeriodIndex(DatetimeIndexOpsMixin, Int64Index, PeriodDelegateMixin):
 
         idx = np.concatenate((self[:loc].asi8, np.array([item.ordinal]),
                               self[loc:].asi8))
-        return self._shallow_copy(idx)
+        result = self._shallow_copy(idx)
+        if loc == len(self):
+            result._inherit_engine(self)
+        return result
 
     def join(self, other, how='left', level=None, return_indexers=False,
              sort=False):
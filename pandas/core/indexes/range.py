@@ -13,7 +13,8 @@ from pandas.util._decorators import Appender, cache_readonly
 
 from pandas.core.dtypes import concat as _concat
 from pandas.core.dtypes.common import (
-    is_int64_dtype, is_integer, is_scalar, is_timedelta64_dtype)
+    ensure_int64, is_int64_dtype, is_integer, is_integer_dtype, is_scalar,
+    is_timedelta64_dtype)
 from pandas.core.dtypes.generic import (
     ABCDataFrame, ABCSeries, ABCTimedeltaIndex)
 
@@ -586,9 +587,54 @@ class RangeIndex(Int64Index):
 
             return RangeIndex._simple_new(start, stop, step, name=self.name)
 
+        # conserve RangeIndex type for a boolean mask selecting a contiguous
+        # block and for evenly spaced integer positions
+        if com.is_bool_indexer(key):
+            key = np.asarray(key, dtype=bool)
+            if key.shape == (len(self), ):
+                maybe_slice = lib.maybe_booleans_to_slice(key.view(np.uint8))
+                if isinstance(maybe_slice, slice):
+                    return self[maybe_slice]
+        elif isinstance(key, np.ndarray) and is_integer_dtype(key):
+            maybe_slice = lib.maybe_indices_to_slice(ensure_int64(key),
+                                                     len(self))
+            if isinstance(maybe_slice, slice):
+                return self[maybe_slice]
+
         # fall back to Int64Index
         return super_getitem(key)
 
+    @Appender(_index_shared_docs['take'] % ibase._index_doc_kwargs)
+    def take(self, indices, axis=0, allow_fill=True,
+             fill_value=None, **kwargs):
+        if kwargs:
+            nv.validate_take(tuple(), kwargs)
+        indices = ensure_int64(indices)
+
+        maybe_slice = lib.maybe_indices_to_slice(indices, len(self))
+        if isinstance(maybe_slice, slice):
+            return self[maybe_slice]
+
+        return super(RangeIndex, self).take(indices, axis=axis,
+                                            allow_fill=allow_fill,
+                                            fill_value=fill_value)
+
+    def delete(self, loc):
+        """
+        Make new Index with passed location(-s) deleted.
+
+        Returns
+        -------
+        new_index : RangeIndex if the remaining values are evenly spaced,
+            Int64Index otherwise
+        """
+        if is_integer(loc):
+            if loc in (0, -len(self)):
+                return self[1:]
+            if loc in (-1, len(self) - 1):
+                return self[:-1]
+        return self.take(np.delete(np.arange(len(self)), loc))
+
     def __floordiv__(self, other):
         if isinstance(other, (ABCSeries, ABCDataFrame)):
             return NotImplemented
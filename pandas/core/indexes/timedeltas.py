@@ -316,7 +316,10 @@ class TimedeltaIndex(DatetimeIndexOpsMixin, dtl.TimelikeOps, Int64Index,
         result = self._data.__getitem__(key)
         if is_scalar(result):
             return result
-        return type(self)(result, name=self.name)
+        result = type(self)(result, name=self.name)
+        if isinstance(key, slice):
+            result._share_engine_state(self, key)
+        return result
 
     # -------------------------------------------------------------------
 
@@ -674,8 +677,7 @@ class TimedeltaIndex(DatetimeIndexOpsMixin, dtl.TimelikeOps, Int64Index,
         try:
             new_tds = np.concatenate((self[:loc].asi8, [item.view(np.int64)],
                                       self[loc:].asi8))
-            return self._shallow_copy(new_tds, freq=freq)
-
+            result = self._shallow_copy(new_tds, freq=freq)
         except (AttributeError, TypeError):
 
             # fall back to object index
@@ -684,6 +686,10 @@ class TimedeltaIndex(DatetimeIndexOpsMixin, dtl.TimelikeOps, Int64Index,
             raise TypeError(
                 "cannot insert TimedeltaIndex with incompatible label")
 
+        if loc == len(self):
+            result._inherit_engine(self)
+        return result
+
     def delete(self, loc):
         """
         Make a new TimedeltaIndex with passed location(s) deleted.
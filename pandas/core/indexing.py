@@ -1484,13 +1484,17 @@ class _LocationIndexer(_NDFrameIndexer):
 
     def __getitem__(self, key):
         if type(key) is tuple:
-            key = tuple(com.apply_if_callable(x, self.obj)
-                        for x in key)
-            try:
-                if self._is_scalar_access(key):
+            # scalars are not callable, so a key of scalars is used as is
+            is_scalar_access = self._is_scalar_access(key)
+            if not is_scalar_access:
+                key = tuple(com.apply_if_callable(x, self.obj)
+                            for x in key)
+                is_scalar_access = self._is_scalar_access(key)
+            if is_scalar_access:
+                try:
                     return self._getitem_scalar(key)
-            except (KeyError, IndexError, AttributeError):
-                pass
+                except (KeyError, IndexError, AttributeError):
+                    pass
             return self._getitem_tuple(key)
         else:
             # we by definition only have the 0th axis
@@ -1806,20 +1810,34 @@ class _LocIndexer(_LocationIndexer):
         if not hasattr(key, '__len__'):
             return False
 
-        if len(key) != self.ndim:
+        # the axes of the manager, as reading ``ndim`` isn't entirely cheap
+        obj = self.obj
+        axes = obj._data.axes
+        if len(key) != len(axes):
             return False
 
-        for i, k in enumerate(key):
+        for k in key:
             if not is_scalar(k):
                 return False
 
-            ax = self.obj.axes[i]
+        # the axes found to allow scalar access are kept on the object, so
+        # repeated lookups only compare them by identity
+        checked = obj._scalar_access_axes
+        if checked is not None and len(checked) == len(axes):
+            for ax, checked_ax in zip(axes, checked):
+                if ax is not checked_ax:
+                    break
+            else:
+                return True
+
+        for ax in axes:
             if isinstance(ax, MultiIndex):
                 return False
 
             if not ax.is_unique:
                 return False
 
+        obj._scalar_access_axes = tuple(axes)
         return True
 
     def _getitem_scalar(self, key):
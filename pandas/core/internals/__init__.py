@@ -10,4 +10,5 @@ from .managers import (  # noqa:F401
     BlockManager, SingleBlockManager,
     create_block_manager_from_arrays, create_block_manager_from_blocks,
     items_overlap_with_suffix,  # reshape.merge
-    concatenate_block_managers)  # reshape.concat, reshape.merge
+    concatenate_block_managers,  # reshape.concat, reshape.merge
+    using_copy_on_write)
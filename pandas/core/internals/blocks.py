@@ -4,6 +4,7 @@ import functools
 import inspect
 import re
 import warnings
+import weakref
 
 import numpy as np
 
@@ -47,6 +48,33 @@ from pandas.core.nanops import nanpercentile
 from pandas.io.formats.printing import pprint_thing
 
 
+class BlockValuesRefs(object):
+    """
+    Tracks the blocks sharing a values array in copy-on-write mode.
+
+    Only weak references are kept, so a block that has been garbage
+    collected no longer keeps the others from writing in place.
+    """
+    __slots__ = ['referenced_blocks']
+
+    def __init__(self, blk):
+        self.referenced_blocks = [weakref.ref(blk)]
+
+    def add_reference(self, blk):
+        """Register ``blk`` as sharing the tracked values."""
+        self.referenced_blocks = [ref for ref in self.referenced_blocks
+                                  if ref() is not None]
+        self.referenced_blocks.append(weakref.ref(blk))
+
+    def has_reference(self, blk):
+        """Whether a live block other than ``blk`` shares the values."""
+        for ref in self.referenced_blocks:
+            other = ref()
+            if other is not None and other is not blk:
+                return True
+        return False
+
+
 class Block(PandasObject):
     """
     Canonical n-dimensional unit of homogeneous dtype contained in a pandas
@@ -54,7 +82,7 @@ class Block(PandasObject):
 
     Index-ignorant; let the container take care of that
     """
-    __slots__ = ['_mgr_locs', 'values', 'ndim']
+    __slots__ = ['_mgr_locs', 'values', 'ndim', 'refs']
     is_numeric = False
     is_float = False
     is_integer = False
@@ -139,6 +167,30 @@ class Block(PandasObject):
         """ return a boolean if I am possibly a view """
         return self.values.base is not None
 
+    @property
+    def is_shared(self):
+        """
+        Whether another live block shares my values (copy-on-write mode).
+        """
+        refs = getattr(self, 'refs', None)
+        return refs is not None and refs.has_reference(self)
+
+    def add_view(self, blk):
+        """
+        Record that ``blk`` shares my values, so that whichever of the two
+        is written to first is copied (copy-on-write mode).
+
+        Returns
+        -------
+        blk : Block
+        """
+        refs = getattr(self, 'refs', None)
+        if refs is None:
+            refs = self.refs = BlockValuesRefs(self)
+        refs.add_reference(blk)
+        blk.refs = refs
+        return blk
+
     @property
     def is_datelike(self):
         """ return True if I am a non-datelike """
@@ -3107,7 +3159,8 @@ def _block_shape(values, ndim=1, shape=None):
     return values
 
 
-def _merge_blocks(blocks, dtype=None, _can_consolidate=True):
+def _merge_blocks(blocks, dtype=None, _can_consolidate=True,
+                  row_layout=False):
 
     if len(blocks) == 1:
         return blocks[0]
@@ -3122,10 +3175,23 @@ def _merge_blocks(blocks, dtype=None, _can_consolidate=True):
         # FIXME: optimization potential in case all mgrs contain slices and
         # combination of those slices is a slice, too.
         new_mgr_locs = np.concatenate([b.mgr_locs.as_array for b in blocks])
-        new_values = np.vstack([b.values for b in blocks])
-
         argsort = np.argsort(new_mgr_locs)
-        new_values = new_values[argsort]
+
+        if row_layout:
+            # write each block straight to its sorted position, keeping the
+            # values of each row contiguous
+            positions = np.empty_like(argsort)
+            positions[argsort] = np.arange(len(argsort))
+            new_values = np.empty((len(new_mgr_locs), blocks[0].shape[1]),
+                                  dtype=dtype, order='F')
+            start = 0
+            for b in blocks:
+                stop = start + len(b)
+                new_values[positions[start:stop]] = b.values
+                start = stop
+        else:
+            new_values = np.vstack([b.values for b in blocks])
+            new_values = new_values[argsort]
         new_mgr_locs = new_mgr_locs[argsort]
 
         return make_block(new_values, placement=new_mgr_locs)
@@ -2,13 +2,17 @@
 from collections import defaultdict
 from functools import partial
 import itertools
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
 import operator
 import re
+import weakref
 
 import numpy as np
 
 from pandas._libs import internals as libinternals, lib
 from pandas.compat import map, range, zip
+from pandas.core.config import get_option
 from pandas.util._validators import validate_bool_kwarg
 
 from pandas.core.dtypes.cast import (
@@ -39,6 +43,47 @@ from .concat import (  # all for concatenate_block_managers
 
 # TODO: flexible with index=None and/or items=None
 
+# set from the ``mode.copy_on_write`` option, see _use_copy_on_write
+_copy_on_write = False
+
+
+def _use_copy_on_write(key):
+    """
+    Option change callback for the copy-on-write mode.
+
+    When enabled, blocks are shared between managers instead of being
+    copied; the values are only copied once either side is written to.
+    """
+    from pandas.core.config import get_option
+    globals()['_copy_on_write'] = bool(get_option(key))
+
+
+def using_copy_on_write():
+    """Whether the copy-on-write mode is enabled."""
+    return _copy_on_write
+
+
+# set from the ``compute.block_threads`` option, see _set_block_threads
+_block_threads = 1
+
+# block methods that BlockManager.apply may run in a thread pool
+_threaded_methods = frozenset(['astype', 'fillna', 'where', 'shift', 'diff',
+                               'interpolate'])
+
+# smallest number of elements worth handing over to a thread pool
+_threaded_min_size = 100000
+
+
+def _set_block_threads(key):
+    """
+    Option change callback for the number of threads blocks are applied in.
+
+    The number is capped to the number of CPUs, a single CPU gains nothing
+    from the pool.
+    """
+    from pandas.core.config import get_option
+    globals()['_block_threads'] = min(get_option(key), cpu_count())
+
 
 class BlockManager(PandasObject):
     """
@@ -92,7 +137,8 @@ class BlockManager(PandasObject):
     This is *not* a public API class
     """
     __slots__ = ['axes', 'blocks', '_ndim', '_shape', '_known_consolidated',
-                 '_is_consolidated', '_blknos', '_blklocs']
+                 '_is_consolidated', '_blknos', '_blklocs', '_insert_buffers',
+                 '_xs_dtype', '_row_layout']
 
     def __init__(self, blocks, axes, do_integrity_check=True):
         self.axes = [ensure_index(ax) for ax in axes]
@@ -351,6 +397,12 @@ class BlockManager(PandasObject):
         if consolidate:
             self._consolidate_inplace()
 
+        inplace = f == 'setitem' or kwargs.get('inplace', False)
+        if inplace:
+            # never write into values another manager still refers to
+            self._copy_shared_blocks()
+        track_views = _copy_on_write and not inplace
+
         if f == 'where':
             align_copy = True
             if kwargs.get('align', True):
@@ -369,6 +421,7 @@ class BlockManager(PandasObject):
             align_copy = False
             align_keys = ['value']
         else:
+            align_copy = False
             align_keys = []
 
         # TODO(EA): may interfere with ExtensionBlock.setitem for blocks
@@ -378,22 +431,37 @@ class BlockManager(PandasObject):
                         if hasattr(kwargs[k], 'values') and
                         not isinstance(kwargs[k], ABCExtensionArray)}
 
-        for b in self.blocks:
-            if filter is not None:
-                if not b.mgr_locs.isin(filter_locs).any():
-                    result_blocks.append(b)
-                    continue
+        if (_block_threads > 1 and f in _threaded_methods and
+                not inplace and filter is None):
+            applied_blocks = self._apply_threaded(f, aligned_args,
+                                                  align_copy, kwargs)
+        else:
+            applied_blocks = None
 
-            if aligned_args:
-                b_items = self.items[b.mgr_locs.indexer]
+        if applied_blocks is not None:
+            for b, applied in applied_blocks:
+                if track_views:
+                    applied = _track_views(b, applied)
+                result_blocks = _extend_blocks(applied, result_blocks)
+        else:
+            for b in self.blocks:
+                if filter is not None:
+                    if not b.mgr_locs.isin(filter_locs).any():
+                        result_blocks.append(b)
+                        continue
 
-                for k, obj in aligned_args.items():
-                    axis = getattr(obj, '_info_axis_number', 0)
-                    kwargs[k] = obj.reindex(b_items, axis=axis,
-                                            copy=align_copy)
+                if aligned_args:
+                    b_items = self.items[b.mgr_locs.indexer]
 
-            applied = getattr(b, f)(**kwargs)
-            result_blocks = _extend_blocks(applied, result_blocks)
+                    for k, obj in aligned_args.items():
+                        axis = getattr(obj, '_info_axis_number', 0)
+                        kwargs[k] = obj.reindex(b_items, axis=axis,
+                                                copy=align_copy)
+
+                applied = getattr(b, f)(**kwargs)
+                if track_views:
+                    applied = _track_views(b, applied)
+                result_blocks = _extend_blocks(applied, result_blocks)
 
         if len(result_blocks) == 0:
             return self.make_empty(axes or self.axes)
@@ -402,6 +470,52 @@ class BlockManager(PandasObject):
         bm._consolidate_inplace()
         return bm
 
+    def _apply_threaded(self, f, aligned_args, align_copy, kwargs):
+        """
+        Apply the block method ``f`` in a pool of ``compute.block_threads``
+        threads.
+
+        Every block is a separate task; while there are fewer blocks than
+        threads, large blocks are split into slabs of columns for the
+        methods that treat each column on its own.
+
+        Returns
+        -------
+        list of (block, applied) pairs in block order, or None when the
+        blocks are too small to be worth the pool
+        """
+        if sum(np.prod(b.shape) for b in self.blocks) < _threaded_min_size:
+            return None
+
+        tasks = []
+        for b in self.blocks:
+            b_kwargs = kwargs
+            if aligned_args:
+                b_items = self.items[b.mgr_locs.indexer]
+                b_kwargs = dict(kwargs)
+                for k, obj in aligned_args.items():
+                    axis = getattr(obj, '_info_axis_number', 0)
+                    b_kwargs[k] = obj.reindex(b_items, axis=axis,
+                                              copy=align_copy)
+                tasks.append((b, b_kwargs))
+            elif (len(self.blocks) < _block_threads and
+                    _can_split_block(b, f, kwargs)):
+                nslabs = min(_block_threads, len(b))
+                for loc in np.array_split(np.arange(len(b)), nslabs):
+                    slab = b.getitem_block(slice(loc[0], loc[-1] + 1))
+                    tasks.append((_add_view(b, slab), b_kwargs))
+            else:
+                tasks.append((b, b_kwargs))
+
+        if len(tasks) < 2:
+            return None
+
+        def apply_block(task):
+            blk, blk_kwargs = task
+            return blk, getattr(blk, f)(**blk_kwargs)
+
+        return _map_threaded(apply_block, tasks)
+
     def quantile(self, axis=0, consolidate=True, transposed=False,
                  interpolation='linear', qs=None, numeric_only=None):
         """
@@ -442,14 +556,16 @@ class BlockManager(PandasObject):
                 ax = axes[0]
             return ax
 
-        axes, blocks = [], []
-        for b in self.blocks:
-            block = b.quantile(axis=axis, qs=qs, interpolation=interpolation)
-
-            axe = get_axe(b, qs, axes=self.axes)
+        def quantile_block(b):
+            return b.quantile(axis=axis, qs=qs, interpolation=interpolation)
 
-            axes.append(axe)
-            blocks.append(block)
+        if (_block_threads > 1 and len(self.blocks) > 1 and
+                sum(np.prod(b.shape) for b in self.blocks) >=
+                _threaded_min_size):
+            blocks = _map_threaded(quantile_block, self.blocks)
+        else:
+            blocks = [quantile_block(b) for b in self.blocks]
+        axes = [get_axe(b, qs, axes=self.axes) for b in self.blocks]
 
         # note that some DatetimeTZ, Categorical are always ndim==1
         ndim = {b.ndim for b in blocks}
@@ -540,6 +656,8 @@ class BlockManager(PandasObject):
         """ do a list replace """
 
         inplace = validate_bool_kwarg(inplace, 'inplace')
+        if inplace:
+            self._copy_shared_blocks()
 
         # figure out our mask a-priori to avoid repeated replacements
         values = self.as_array()
@@ -635,6 +753,39 @@ class BlockManager(PandasObject):
 
         return False
 
+    @property
+    def layout(self):
+        """
+        'row' if the manager was converted with ``to_layout('row')``, so
+        that its 2D blocks keep the values of each row contiguous, 'column'
+        otherwise (the default).
+        """
+        return 'row' if getattr(self, '_row_layout', False) else 'column'
+
+    def to_layout(self, layout, copy=True):
+        """
+        Return a new manager whose 2D ndarray blocks are stored in
+        ``layout``, 'row' or 'column'.
+
+        Blocks that already have the layout are only copied if ``copy``.
+        """
+        mgr = self.__class__(self._layout_blocks(layout, copy), self.axes)
+        mgr._row_layout = layout == 'row'
+        return mgr
+
+    def _layout_blocks(self, layout, copy):
+        order = 'F' if layout == 'row' else 'C'
+        blocks = []
+        for blk in self.blocks:
+            values = blk.values
+            if (isinstance(values, np.ndarray) and values.ndim == 2 and
+                    (copy or not values.flags[order + '_CONTIGUOUS'])):
+                values = np.array(values, order=order, copy=True)
+                blocks.append(blk.make_block_same_class(values))
+            else:
+                blocks.append(_add_view(blk, blk.copy(deep=copy)))
+        return blocks
+
     def get_bool_data(self, copy=False):
         """
         Parameters
@@ -667,7 +818,7 @@ class BlockManager(PandasObject):
 
         new_blocks = []
         for b in blocks:
-            b = b.copy(deep=copy)
+            b = _add_view(b, b.copy(deep=copy and not _copy_on_write))
             b.mgr_locs = algos.take_1d(inv_indexer, b.mgr_locs.as_array,
                                        axis=0, allow_fill=False)
             new_blocks.append(b)
@@ -687,7 +838,8 @@ class BlockManager(PandasObject):
             slicer = [slice(None)] * (axis + 1)
             slicer[axis] = slobj
             slicer = tuple(slicer)
-            new_blocks = [blk.getitem_block(slicer) for blk in self.blocks]
+            new_blocks = [_add_view(blk, blk.getitem_block(slicer))
+                          for blk in self.blocks]
 
         new_axes = list(self.axes)
         new_axes[axis] = new_axes[axis][slobj]
@@ -716,6 +868,11 @@ class BlockManager(PandasObject):
         Returns
         -------
         copy : BlockManager
+
+        Notes
+        -----
+        In copy-on-write mode the data is never copied here: both managers
+        share the blocks and the values are copied on the first write.
         """
         # this preserves the notion of view copying of axes
         if deep:
@@ -726,8 +883,46 @@ class BlockManager(PandasObject):
             new_axes = [copy(ax) for ax in self.axes]
         else:
             new_axes = list(self.axes)
-        return self.apply('copy', axes=new_axes, deep=deep,
-                          do_integrity_check=False)
+        if _copy_on_write:
+            deep = False
+        if self.layout != 'row':
+            return self.apply('copy', axes=new_axes, deep=deep,
+                              do_integrity_check=False)
+
+        if deep:
+            result = self.__class__(self._layout_blocks('row', copy=True),
+                                    new_axes, do_integrity_check=False)
+        else:
+            result = self.apply('copy', axes=new_axes, deep=False,
+                                do_integrity_check=False)
+        result._row_layout = True
+        return result
+
+    def _copy_shared_blocks(self, blknos=None):
+        """
+        Replace the blocks still sharing their values with another live
+        block by private copies, ahead of an in-place write.
+
+        Blocks are only ever shared in copy-on-write mode.
+
+        Parameters
+        ----------
+        blknos : iterable of int, optional
+            The blocks about to be written, default all
+        """
+        if blknos is None:
+            blknos = range(len(self.blocks))
+
+        blocks = None
+        for blkno in blknos:
+            blk = self.blocks[blkno]
+            if blk.is_shared:
+                if blocks is None:
+                    blocks = list(self.blocks)
+                blocks[blkno] = blk.copy(deep=True)
+
+        if blocks is not None:
+            self.blocks = type(self.blocks)(blocks)
 
     def as_array(self, transpose=False, items=None):
         """Convert the blockmanager data into an numpy array.
@@ -780,7 +975,8 @@ class BlockManager(PandasObject):
         elif is_extension_array_dtype(dtype):
             dtype = 'object'
 
-        result = np.empty(self.shape, dtype=dtype)
+        order = 'F' if self.layout == 'row' else 'C'
+        result = np.empty(self.shape, dtype=dtype, order=order)
 
         itemmask = np.zeros(self.shape[0])
 
@@ -849,15 +1045,15 @@ class BlockManager(PandasObject):
                 newb = make_block(values=blk.values[slicer],
                                   klass=blk.__class__,
                                   placement=blk.mgr_locs)
-                new_blocks.append(newb)
+                new_blocks.append(_add_view(blk, newb))
         elif len(self.blocks) == 1:
             block = self.blocks[0]
             vals = block.values[slicer]
-            if copy:
+            if copy and not _copy_on_write:
                 vals = vals.copy()
-            new_blocks = [make_block(values=vals,
-                                     placement=block.mgr_locs,
-                                     klass=block.__class__)]
+            new_blocks = [_add_view(block, make_block(values=vals,
+                                                      placement=block.mgr_locs,
+                                                      klass=block.__class__))]
 
         return self.__class__(new_blocks, new_axes)
 
@@ -870,34 +1066,49 @@ class BlockManager(PandasObject):
         single block
         """
         if len(self.blocks) == 1:
-            return self.blocks[0].iget((slice(None), loc))
-
-        items = self.items
-
-        # non-unique (GH4726)
-        if not items.is_unique:
-            result = self._interleave()
-            if self.ndim == 2:
-                result = result.T
-            return result[loc]
+            result = self.blocks[0].iget((slice(None), loc))
+            if _copy_on_write and isinstance(result, np.ndarray):
+                # the row is not tracked as a view of the block
+                result = result.copy()
+            return result
 
-        # unique
-        dtype = _interleaved_dtype(self.blocks)
+        # the dtype only depends on the blocks, keep it for the next row;
+        # the blocks are only weakly referenced so that blocks replaced in
+        # the meantime (and their values) are not kept alive
+        cached = getattr(self, '_xs_dtype', None)
+        if (cached is not None and len(cached[0]) == len(self.blocks) and
+                all(ref() is blk for ref, blk in zip(cached[0],
+                                                     self.blocks))):
+            dtype = cached[1]
+        else:
+            dtype = _interleaved_dtype(self.blocks)
+            self._xs_dtype = (tuple(weakref.ref(blk) for blk in self.blocks),
+                              dtype)
 
-        n = len(items)
-        if is_extension_array_dtype(dtype):
+        n = len(self.items)
+        is_extension = is_extension_array_dtype(dtype)
+        if is_extension:
             # we'll eventually construct an ExtensionArray.
             result = np.empty(n, dtype=object)
         else:
             result = np.empty(n, dtype=dtype)
+        is_object = result.dtype == np.object_
 
         for blk in self.blocks:
+            if (isinstance(blk.values, np.ndarray) and
+                    not (blk.is_datetime or blk.is_timedelta) and
+                    (blk.is_object or not is_object)):
+                # nothing to coerce or box, take the whole column of the
+                # block at once
+                result[blk.mgr_locs.indexer] = blk.values[:, loc]
+                continue
+
             # Such assignment may incorrectly coerce NaT to None
             # result[blk.mgr_locs] = blk._slice((slice(None), loc))
             for i, rl in enumerate(blk.mgr_locs):
                 result[rl] = blk._try_coerce_result(blk.iget((i, loc)))
 
-        if is_extension_array_dtype(dtype):
+        if is_extension:
             result = dtype.construct_array_type()._from_sequence(
                 result, dtype=dtype
             )
@@ -917,12 +1128,14 @@ class BlockManager(PandasObject):
 
         bm = self.__class__(self.blocks, self.axes)
         bm._is_consolidated = False
+        bm._row_layout = self.layout == 'row'
         bm._consolidate_inplace()
         return bm
 
     def _consolidate_inplace(self):
         if not self.is_consolidated():
-            self.blocks = tuple(_consolidate(self.blocks))
+            self.blocks = tuple(_consolidate(
+                self.blocks, row_layout=self.layout == 'row'))
             self._is_consolidated = True
             self._known_consolidated = True
             self._rebuild_blknos_and_blklocs()
@@ -969,9 +1182,8 @@ class BlockManager(PandasObject):
 
         # fastpath shortcut for select a single-dim from a 2-dim BM
         return SingleBlockManager(
-            [block.make_block_same_class(values,
-                                         placement=slice(0, len(values)),
-                                         ndim=1)],
+            [_add_view(block, block.make_block_same_class(
+                values, placement=slice(0, len(values)), ndim=1))],
             self.axes[1])
 
     def delete(self, item):
@@ -1057,6 +1269,7 @@ class BlockManager(PandasObject):
 
         blknos = self._blknos[loc]
         blklocs = self._blklocs[loc].copy()
+        self._copy_shared_blocks(set(blknos))
 
         unfit_mgr_locs = []
         unfit_val_locs = []
@@ -1162,23 +1375,91 @@ class BlockManager(PandasObject):
                 new_mgr_locs[new_mgr_locs >= loc] += 1
                 blk.mgr_locs = new_mgr_locs
 
+        blkno, blkloc = self._append_to_insert_buffer(block)
+        if blkno is None:
+            blkno, blkloc = len(self.blocks), 0
+            self.blocks += (block,)
+            self._known_consolidated = False
+
         if loc == self._blklocs.shape[0]:
             # np.append is a lot faster, let's use it if we can.
-            self._blklocs = np.append(self._blklocs, 0)
-            self._blknos = np.append(self._blknos, len(self.blocks))
+            self._blklocs = np.append(self._blklocs, blkloc)
+            self._blknos = np.append(self._blknos, blkno)
         else:
-            self._blklocs = np.insert(self._blklocs, loc, 0)
-            self._blknos = np.insert(self._blknos, loc, len(self.blocks))
+            self._blklocs = np.insert(self._blklocs, loc, blkloc)
+            self._blknos = np.insert(self._blknos, loc, blkno)
 
         self.axes[0] = new_axis
-        self.blocks += (block,)
         self._shape = None
 
-        self._known_consolidated = False
-
-        if len(self.blocks) > 100:
+        if len(self.blocks) > get_option('compute.consolidation_threshold'):
             self._consolidate_inplace()
 
+    def _append_to_insert_buffer(self, block):
+        """
+        Add an inserted item to the block that the previous inserts of the
+        same dtype went to, instead of giving it a block of its own.
+
+        The values of that block are the leading rows of a buffer that grows
+        by doubling, so building a frame column by column copies each column
+        a constant number of times on average and keeps the number of blocks
+        low without consolidating.
+
+        Parameters
+        ----------
+        block : Block
+            The single item block to insert, already placed
+
+        Returns
+        -------
+        blkno, blkloc : int or None
+            The location of the item, or None if ``block`` has to be added
+            as a block of its own.
+        """
+        if (self.ndim != 2 or not block._can_consolidate or
+                not isinstance(block.values, np.ndarray)):
+            return None, None
+        if self.layout == 'row':
+            # the leading rows of a buffer can't keep the values of each
+            # row contiguous, leave it to consolidation
+            return None, None
+
+        buffers = getattr(self, '_insert_buffers', None)
+        if buffers is None:
+            buffers = self._insert_buffers = {}
+
+        key = block._consolidate_key
+        entry = buffers.get(key)
+        if entry is not None:
+            blkno, blk, buf = entry
+            # the block must still be ours and backed by the buffer, and
+            # keep its items in ascending order
+            if (blkno >= len(self.blocks) or self.blocks[blkno] is not blk or
+                    type(blk) is not type(block) or
+                    (buf is not None and blk.values.base is not buf) or
+                    blk.mgr_locs.as_array[-1] > block.mgr_locs.as_array[0]):
+                entry = None
+
+        if entry is None:
+            buffers[key] = (len(self.blocks), block, None)
+            return None, None
+
+        n = len(blk)
+        if buf is None or n == len(buf):
+            new_buf = np.empty((2 * (n + 1),) + blk.shape[1:],
+                               dtype=blk.dtype)
+            new_buf[:n] = blk.values
+            buf = new_buf
+        buf[n] = block.values[0]
+
+        placement = np.append(blk.mgr_locs.as_array, block.mgr_locs.as_array)
+        new_blk = _add_view(blk, blk.make_block_same_class(
+            buf[:n + 1], placement=placement))
+        self.blocks = (self.blocks[:blkno] + (new_blk,) +
+                       self.blocks[blkno + 1:])
+        buffers[key] = (blkno, new_blk, buf)
+        return blkno, n
+
     def reindex_axis(self, new_index, axis, method=None, limit=None,
                      fill_value=None, copy=True):
         """
@@ -1206,6 +1487,9 @@ class BlockManager(PandasObject):
         """
         if indexer is None:
             if new_axis is self.axes[axis] and not copy:
+                if _copy_on_write:
+                    # never hand out the same manager twice
+                    return self.copy(deep=False)
                 return self
 
             result = self.copy(deep=copy)
@@ -1255,7 +1539,8 @@ class BlockManager(PandasObject):
             blk = self.blocks[0]
 
             if sl_type in ('slice', 'mask'):
-                return [blk.getitem_block(slobj, new_mgr_locs=slice(0, sllen))]
+                return [_add_view(blk, blk.getitem_block(
+                    slobj, new_mgr_locs=slice(0, sllen)))]
             elif not allow_fill or self.ndim == 1:
                 if allow_fill and fill_tuple[0] is None:
                     _, fill_value = maybe_promote(blk.dtype)
@@ -1298,7 +1583,8 @@ class BlockManager(PandasObject):
                     # only one item and each mgr loc is a copy of that single
                     # item.
                     for mgr_loc in mgr_locs:
-                        newblk = blk.copy(deep=True)
+                        newblk = _add_view(
+                            blk, blk.copy(deep=not _copy_on_write))
                         newblk.mgr_locs = slice(mgr_loc, mgr_loc + 1)
                         blocks.append(newblk)
 
@@ -1503,8 +1789,12 @@ class SingleBlockManager(BlockManager):
         if axis >= self.ndim:
             raise IndexError("Requested axis not found in manager")
 
-        return self.__class__(self._block._slice(slobj),
-                              self.index[slobj], fastpath=True)
+        block = self._block
+        values = block._slice(slobj)
+        if _copy_on_write:
+            values = _add_view(block, block.make_block_same_class(
+                values, placement=slice(0, len(values)), ndim=1))
+        return self.__class__(values, self.index[slobj], fastpath=True)
 
     @property
     def index(self):
@@ -1880,7 +2170,7 @@ def _interleaved_dtype(blocks):
     return find_common_type([b.dtype for b in blocks])
 
 
-def _consolidate(blocks):
+def _consolidate(blocks, row_layout=False):
     """
     Merge blocks having same dtype, exclude non-consolidating blocks
     """
@@ -1892,7 +2182,8 @@ def _consolidate(blocks):
     new_blocks = []
     for (_can_consolidate, dtype), group_blocks in grouper:
         merged_blocks = _merge_blocks(list(group_blocks), dtype=dtype,
-                                      _can_consolidate=_can_consolidate)
+                                      _can_consolidate=_can_consolidate,
+                                      row_layout=row_layout)
         new_blocks = _extend_blocks(merged_blocks, new_blocks)
     return new_blocks
 
@@ -2013,6 +2304,75 @@ def _transform_index(index, func, level=None):
         return Index(items, name=index.name, tupleize_cols=False)
 
 
+def _shares_values(blk, other):
+    """
+    Whether the values of two blocks may share memory.
+    """
+    values, other_values = blk.values, other.values
+    if values is other_values:
+        return True
+    if isinstance(values, np.ndarray) and isinstance(other_values,
+                                                     np.ndarray):
+        return np.may_share_memory(values, other_values)
+    return False
+
+
+def _add_view(blk, new_blk):
+    """
+    In copy-on-write mode, register ``new_blk`` as a view on ``blk`` when
+    the two share their values.
+
+    Returns
+    -------
+    new_blk : Block
+    """
+    if _copy_on_write and _shares_values(blk, new_blk):
+        blk.add_view(new_blk)
+    return new_blk
+
+
+def _track_views(blk, applied):
+    """
+    Register the blocks produced from ``blk`` by ``BlockManager.apply`` that
+    still share its values. ``blk`` itself is replaced by a new block object,
+    so that the old and the new manager never hold the same block.
+    """
+    result = []
+    for new_blk in _extend_blocks(applied, []):
+        if new_blk is blk:
+            new_blk = blk.copy(deep=False)
+        result.append(_add_view(blk, new_blk))
+    return result
+
+
+def _map_threaded(func, items):
+    """
+    Call ``func`` on each of ``items`` in a pool of ``compute.block_threads``
+    threads, returning the results in the order of ``items``.
+    """
+    pool = ThreadPool(min(_block_threads, len(items)))
+    try:
+        return pool.map(func, items)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _can_split_block(blk, f, kwargs):
+    """
+    Whether applying the block method ``f`` to slabs of columns of ``blk``
+    gives the same result as applying it to ``blk`` as a whole.
+    """
+    if f not in ('astype', 'fillna', 'shift', 'diff'):
+        return False
+    if blk.ndim != 2 or not blk._can_consolidate or len(blk) < 2:
+        return False
+    if f in ('shift', 'diff'):
+        # only along the rows, each column then stands on its own
+        return kwargs.get('axis') == 1
+    return True
+
+
 def _fast_count_smallints(arr):
     """Faster version of set(arr) for sequences of small numbers."""
     counts = np.bincount(arr.astype(np.int_))
@@ -2056,11 +2416,12 @@ def concatenate_block_managers(mgrs_indexers, axes, concat_axis, copy):
         if len(join_units) == 1 and not join_units[0].indexers:
             b = join_units[0].block
             values = b.values
-            if copy:
+            if copy and not _copy_on_write:
                 values = values.copy()
-            elif not copy:
+            else:
                 values = values.view()
-            b = b.make_block_same_class(values, placement=placement)
+            b = _add_view(b, b.make_block_same_class(values,
+                                                     placement=placement))
         elif is_uniform_join_units(join_units):
             b = join_units[0].block.concat_same_type(
                 [ju.block for ju in join_units], placement=placement)
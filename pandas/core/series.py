@@ -42,7 +42,7 @@ from pandas.core.indexes.datetimes import DatetimeIndex
 from pandas.core.indexes.period import PeriodIndex
 from pandas.core.indexes.timedeltas import TimedeltaIndex
 from pandas.core.indexing import check_bool_indexer, maybe_convert_indices
-from pandas.core.internals import SingleBlockManager
+from pandas.core.internals import SingleBlockManager, using_copy_on_write
 from pandas.core.internals.construction import sanitize_array
 from pandas.core.strings import StringMethods
 from pandas.core.tools.datetimes import to_datetime
@@ -204,6 +204,9 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
                 else:
                     data = data.reindex(index, copy=copy)
                 data = data._data
+                if using_copy_on_write():
+                    # don't share the manager itself with the other object
+                    data = data.copy(deep=False)
             elif isinstance(data, dict):
                 data, index = self._init_dict(data, index, dtype)
                 dtype = None
@@ -1047,6 +1050,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
             self._maybe_update_cacher()
 
     def _set_with_engine(self, key, value):
+        self._data._copy_shared_blocks()
         values = self._values
         try:
             self.index._engine.set_value(values, key, value)
@@ -1224,6 +1228,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
         return self._set_value(label, value, takeable=takeable)
 
     def _set_value(self, label, value, takeable=False):
+        self._data._copy_shared_blocks()
         try:
             if takeable:
                 self._values[label] = value
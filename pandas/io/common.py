@@ -1,10 +1,12 @@
 """Common IO api utilities"""
 
 import codecs
+from collections import OrderedDict
 from contextlib import closing, contextmanager
 import csv
 import mmap
 import os
+import threading
 import zipfile
 
 import pandas.compat as compat
@@ -13,6 +15,7 @@ from pandas.errors import (  # noqa
     AbstractMethodError, DtypeWarning, EmptyDataError, ParserError,
     ParserWarning)
 
+from pandas.core.config import get_option
 from pandas.core.dtypes.common import is_file_like, is_number
 
 from pandas.io.formats.printing import pprint_thing
@@ -176,6 +179,114 @@ def is_gcs_url(url):
         return False
 
 
+class _ContentCache(object):
+    """
+    LRU cache of file contents, bounded by the ``io.cache.max_bytes``
+    option (the cache is disabled when it is 0).
+
+    Keys identify a version of a file, e.g. ``(path, size, mtime,
+    compression)`` for a local file or ``(url, size, etag, None)`` for a
+    remote object, so changed files are never served stale. Storing a new
+    version of a file drops the older ones.
+    """
+
+    def __init__(self):
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_bytes(self):
+        return max(get_option('io.cache.max_bytes'), 0)
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key):
+        with self._lock:
+            try:
+                content = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return None
+            # re-insert as the most recently used entry
+            self._data[key] = content
+            self.hits += 1
+            return content
+
+    def put(self, key, content):
+        max_bytes = self.max_bytes
+        if len(content) > max_bytes:
+            return
+        with self._lock:
+            for other in [k for k in self._data if k[0] == key[0]]:
+                self.nbytes -= len(self._data.pop(other))
+            self._data[key] = content
+            self.nbytes += len(content)
+        self.trim(max_bytes)
+
+    def trim(self, max_bytes=None):
+        """ evict the least recently used entries down to ``max_bytes`` """
+        if max_bytes is None:
+            max_bytes = self.max_bytes
+        with self._lock:
+            while self.nbytes > max_bytes:
+                _, content = self._data.popitem(last=False)
+                self.nbytes -= len(content)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+            self.hits = self.misses = 0
+
+
+_content_cache = _ContentCache()
+
+
+def _local_cache_key(path, compression):
+    """
+    Return the content cache key of the compressed local file ``path``,
+    or None when the cache is disabled.
+    """
+    if not _content_cache.max_bytes:
+        return None
+    try:
+        stat = os.stat(path)
+    except (OSError, IOError):
+        return None
+    return os.path.abspath(path), stat.st_size, stat.st_mtime, compression
+
+
+def _get_cached_remote_buffer(fs, path, url, f):
+    """
+    Serve the remote file ``f``, opened for reading as ``path`` on the
+    s3fs/gcsfs file system ``fs``, from the content cache.
+
+    When the cache is enabled the content is returned in a BytesIO and
+    ``f`` is closed, otherwise ``f`` is returned unchanged.
+    """
+    if not _content_cache.max_bytes:
+        return f
+
+    info = fs.info(path)
+    size = info.get('Size', info.get('size'))
+    version = info.get('ETag', info.get('etag', info.get('md5Hash')))
+    if version is None:
+        # without a version we can't tell stale content apart
+        return f
+
+    key = url, size, version, None
+    content = _content_cache.get(key)
+    if content is None:
+        content = f.read()
+        _content_cache.put(key, content)
+    f.close()
+    return BytesIO(content)
+
+
 def get_filepath_or_buffer(filepath_or_buffer, encoding=None,
                            compression=None, mode=None):
     """
@@ -222,6 +333,20 @@ def get_filepath_or_buffer(filepath_or_buffer, encoding=None,
                                           compression=compression,
                                           mode=mode)
 
+    if (compression is not None and mode in (None, 'r', 'rb') and
+            isinstance(filepath_or_buffer, compat.string_types) and
+            _content_cache.max_bytes):
+        path = _expand_user(filepath_or_buffer)
+        compression = _infer_compression(path, compression)
+        if compression is not None and os.path.isfile(path):
+            # serve the decompressed content from the cache
+            f, handles = _get_handle(path, 'rb', compression=compression,
+                                     is_text=False)
+            for handle in handles:
+                if handle is not f:
+                    handle.close()
+            return f, None, None, True
+
     if isinstance(filepath_or_buffer, (compat.string_types,
                                        compat.binary_type,
                                        mmap.mmap)):
@@ -362,8 +487,17 @@ def _get_handle(path_or_buf, mode, encoding=None, compression=None,
             msg = 'compression with encoding is not yet supported in Python 2'
             raise ValueError(msg)
 
+        cache_key = content = None
+        if is_path and mode in ('r', 'rb'):
+            cache_key = _local_cache_key(path_or_buf, compression)
+            if cache_key is not None:
+                content = _content_cache.get(cache_key)
+
+        if content is not None:
+            f = BytesIO(content)
+
         # GZ Compression
-        if compression == 'gzip':
+        elif compression == 'gzip':
             import gzip
             if is_path:
                 f = gzip.open(path_or_buf, mode)
@@ -412,6 +546,13 @@ def _get_handle(path_or_buf, mode, encoding=None, compression=None,
             msg = 'Unrecognized compression type: {}'.format(compression)
             raise ValueError(msg)
 
+        if cache_key is not None and content is None:
+            # decompress it all now so the next read is served from memory
+            content = f.read()
+            f.close()
+            _content_cache.put(cache_key, content)
+            f = BytesIO(content)
+
         handles.append(f)
 
     elif is_path:
@@ -5,7 +5,8 @@ from distutils.version import LooseVersion
 from pandas.compat import range
 from pandas.util._decorators import deprecate_kwarg
 
-from pandas import DataFrame, Int64Index, RangeIndex
+from pandas import DataFrame, Index, Int64Index, RangeIndex
+from pandas.core.internals import BlockManager, make_block
 
 from pandas.io.common import _stringify_path
 
@@ -83,8 +84,45 @@ def to_feather(df, path):
     feather.write_feather(df, path)
 
 
+def _table_to_frame(pyarrow, table, use_threads):
+    """
+    Convert a pyarrow Table to a DataFrame without copying its numeric
+    columns.
+
+    Integer and float columns held in a single chunk without nulls become
+    blocks viewing the Arrow buffers (e.g. the pages of a memory-mapped
+    file), the other columns are converted by pyarrow.
+    """
+    names = table.schema.names
+    blocks, zero_copy = [], []
+    for i in range(table.num_columns):
+        column = table.column(i)
+        data = getattr(column, 'data', column)
+        if (data.num_chunks == 1 and data.null_count == 0 and
+                (pyarrow.types.is_integer(data.type) or
+                 pyarrow.types.is_floating(data.type))):
+            values = data.chunk(0).to_numpy()
+            blocks.append(make_block(values.reshape(1, -1), placement=[i]))
+            zero_copy.append(i)
+
+    if len(zero_copy) < table.num_columns:
+        rest = table
+        for i in reversed(zero_copy):
+            rest = rest.remove_column(i)
+        positions = sorted(set(range(table.num_columns)) - set(zero_copy))
+        converted = rest.to_pandas(use_threads=use_threads)
+        for blk in converted._data.blocks:
+            placement = [positions[j] for j in blk.mgr_locs.as_array]
+            blocks.append(blk.make_block_same_class(blk.values,
+                                                    placement=placement))
+
+    mgr = BlockManager(blocks, [Index(names), RangeIndex(table.num_rows)])
+    return DataFrame(mgr)
+
+
 @deprecate_kwarg(old_arg_name='nthreads', new_arg_name='use_threads')
-def read_feather(path, columns=None, use_threads=True):
+def read_feather(path, columns=None, use_threads=True, memory_map=False,
+                 zero_copy=False):
     """
     Load a feather-format object from the file path
 
@@ -106,6 +144,17 @@ def read_feather(path, columns=None, use_threads=True):
         Whether to parallelize reading using multiple threads
 
        .. versionadded 0.24.0
+    memory_map : bool, default False
+        Memory-map the file instead of reading it, only the selected
+        ``columns`` are touched. Requires pyarrow >= 0.12.0.
+
+       .. versionadded:: 0.25.0
+    zero_copy : bool, default False
+        With ``memory_map=True``, return integer and float columns without
+        missing values as views of the mapped file rather than copies.
+        These columns are read-only: setting values in them raises.
+
+       .. versionadded:: 0.25.0
 
     Returns
     -------
@@ -116,6 +165,20 @@ def read_feather(path, columns=None, use_threads=True):
     feather, pyarrow = _try_import()
     path = _stringify_path(path)
 
+    if memory_map:
+        if LooseVersion(pyarrow.__version__) < LooseVersion('0.12.0'):
+            raise ImportError("pyarrow >= 0.12.0 required for memory "
+                              "mapped feather reads\n\n"
+                              "you can install via conda\n"
+                              "conda install pyarrow -c conda-forge\n"
+                              "or via pip\n"
+                              "pip install -U pyarrow\n")
+        source = pyarrow.memory_map(path, 'r')
+        table = feather.read_table(source, columns=columns)
+        if zero_copy:
+            return _table_to_frame(pyarrow, table, bool(use_threads))
+        return table.to_pandas(use_threads=bool(use_threads))
+
     if LooseVersion(pyarrow.__version__) < LooseVersion('0.11.0'):
         int_use_threads = int(use_threads)
         if int_use_threads < 1:
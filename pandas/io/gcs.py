@@ -4,6 +4,8 @@ try:
 except ImportError:
     raise ImportError("The gcsfs library is required to handle GCS files")
 
+from pandas.io.common import _get_cached_remote_buffer
+
 
 def get_filepath_or_buffer(filepath_or_buffer, encoding=None,
                            compression=None, mode=None):
@@ -11,6 +13,10 @@ def get_filepath_or_buffer(filepath_or_buffer, encoding=None,
     if mode is None:
         mode = 'rb'
 
+    url = filepath_or_buffer
     fs = gcsfs.GCSFileSystem()
-    filepath_or_buffer = fs.open(filepath_or_buffer, mode)
+    filepath_or_buffer = fs.open(url, mode)
+    if mode == 'rb':
+        filepath_or_buffer = _get_cached_remote_buffer(
+            fs, url, url, filepath_or_buffer)
     return filepath_or_buffer, None, compression, True
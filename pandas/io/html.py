@@ -4,6 +4,7 @@ HTML IO.
 """
 
 from distutils.version import LooseVersion
+from itertools import chain
 import numbers
 import os
 import re
@@ -12,7 +13,7 @@ import pandas.compat as compat
 from pandas.compat import (
     binary_type, iteritems, lmap, lrange, raise_with_traceback, string_types,
     u)
-from pandas.errors import AbstractMethodError, EmptyDataError
+from pandas.errors import AbstractMethodError, EmptyDataError, ParserError
 
 from pandas.core.dtypes.common import is_list_like
 
@@ -20,7 +21,7 @@ from pandas import Series
 
 from pandas.io.common import _is_url, _validate_header_arg, urlopen
 from pandas.io.formats.printing import pprint_thing
-from pandas.io.parsers import TextParser
+from pandas.io.parsers import TextParser, _validate_integer
 
 _IMPORTS = False
 _HAS_BS4 = False
@@ -144,6 +145,63 @@ def _read(obj):
     return text
 
 
+def _expand_colspan_rowspan(rows):
+    """
+    Given an iterable of rows of ``(text, rowspan, colspan)`` cells, yield
+    each row as a list of text.
+
+    Any cell with ``rowspan`` or ``colspan`` has its text copied to the
+    subsequent cells. Rows are consumed lazily, one at a time.
+    """
+    remainder = []  # list of (index, text, nrows)
+
+    for cells in rows:
+        texts = []  # the output for this row
+        next_remainder = []
+
+        index = 0
+        for text, rowspan, colspan in cells:
+            # Append texts from previous rows with rowspan>1 that come
+            # before this <td>
+            while remainder and remainder[0][0] <= index:
+                prev_i, prev_text, prev_rowspan = remainder.pop(0)
+                texts.append(prev_text)
+                if prev_rowspan > 1:
+                    next_remainder.append((prev_i, prev_text,
+                                           prev_rowspan - 1))
+                index += 1
+
+            # Append the text from this <td>, colspan times
+            for _ in range(colspan):
+                texts.append(text)
+                if rowspan > 1:
+                    next_remainder.append((index, text, rowspan - 1))
+                index += 1
+
+        # Append texts from previous rows at the final position
+        for prev_i, prev_text, prev_rowspan in remainder:
+            texts.append(prev_text)
+            if prev_rowspan > 1:
+                next_remainder.append((prev_i, prev_text,
+                                       prev_rowspan - 1))
+
+        yield texts
+        remainder = next_remainder
+
+    # Append rows that only appear because the previous row had non-1
+    # rowspan
+    while remainder:
+        next_remainder = []
+        texts = []
+        for prev_i, prev_text, prev_rowspan in remainder:
+            texts.append(prev_text)
+            if prev_rowspan > 1:
+                next_remainder.append((prev_i, prev_text,
+                                       prev_rowspan - 1))
+        yield texts
+        remainder = next_remainder
+
+
 class _HtmlFrameParser(object):
     """Base class for parsers that parse HTML into DataFrames.
 
@@ -444,61 +502,17 @@ class _HtmlFrameParser(object):
         to subsequent cells.
         """
 
-        all_texts = []  # list of rows, each a list of str
-        remainder = []  # list of (index, text, nrows)
-
-        for tr in rows:
-            texts = []  # the output for this row
-            next_remainder = []
-
-            index = 0
-            tds = self._parse_td(tr)
-            for td in tds:
-                # Append texts from previous rows with rowspan>1 that come
-                # before this <td>
-                while remainder and remainder[0][0] <= index:
-                    prev_i, prev_text, prev_rowspan = remainder.pop(0)
-                    texts.append(prev_text)
-                    if prev_rowspan > 1:
-                        next_remainder.append((prev_i, prev_text,
-                                               prev_rowspan - 1))
-                    index += 1
-
-                # Append the text from this <td>, colspan times
-                text = _remove_whitespace(self._text_getter(td))
-                rowspan = int(self._attr_getter(td, 'rowspan') or 1)
-                colspan = int(self._attr_getter(td, 'colspan') or 1)
-
-                for _ in range(colspan):
-                    texts.append(text)
-                    if rowspan > 1:
-                        next_remainder.append((index, text, rowspan - 1))
-                    index += 1
-
-            # Append texts from previous rows at the final position
-            for prev_i, prev_text, prev_rowspan in remainder:
-                texts.append(prev_text)
-                if prev_rowspan > 1:
-                    next_remainder.append((prev_i, prev_text,
-                                           prev_rowspan - 1))
-
-            all_texts.append(texts)
-            remainder = next_remainder
+        return list(_expand_colspan_rowspan(self._parse_cells(tr)
+                                            for tr in rows))
 
-        # Append rows that only appear because the previous row had non-1
-        # rowspan
-        while remainder:
-            next_remainder = []
-            texts = []
-            for prev_i, prev_text, prev_rowspan in remainder:
-                texts.append(prev_text)
-                if prev_rowspan > 1:
-                    next_remainder.append((prev_i, prev_text,
-                                           prev_rowspan - 1))
-            all_texts.append(texts)
-            remainder = next_remainder
-
-        return all_texts
+    def _parse_cells(self, tr):
+        """
+        Return the cells of a <tr> as ``(text, rowspan, colspan)`` tuples.
+        """
+        return [(_remove_whitespace(self._text_getter(td)),
+                 int(self._attr_getter(td, 'rowspan') or 1),
+                 int(self._attr_getter(td, 'colspan') or 1))
+                for td in self._parse_td(tr)]
 
     def _handle_hidden_tables(self, tbl_list, attr_name):
         """
@@ -768,6 +782,213 @@ class _LxmlFrameParser(_HtmlFrameParser):
         return table.xpath('.//tfoot//tr')
 
 
+def _is_hidden(elem):
+    return "display:none" in elem.get("style", "").replace(" ", "")
+
+
+class _LxmlIterFrameParser(_LxmlFrameParser):
+    """HTML to DataFrame parser streaming the document through lxml.
+
+    The document is fed to an ``lxml.etree.HTMLPullParser`` block by block.
+    Table selection by ``attrs`` happens when a <table> starts and by
+    ``match`` as its text is parsed, and every <tr> is converted to cells
+    and freed as soon as it ends, so that only the rows being turned into
+    the current chunk are kept in memory.
+
+    Notes
+    -----
+    Rows seen before the text of a table matches ``match`` are held until
+    it does, which is checked at the end of every row and of the table.
+    Nested tables are part of the text of the cell holding them.
+    """
+
+    _block_size = 1 << 16
+
+    def parse_tables(self):
+        """
+        Yield, for each matching table, an iterator of its
+        ``(section, cells, all_th)`` rows. Each iterator must be consumed
+        before the next table is parsed, afterwards it raises ValueError.
+        """
+        events = self._iter_events()
+        for event, _ in events:
+            if event == 'start':
+                state = {'done': False, 'stale': False}
+                yield self._iter_rows(events, state)
+                state['stale'] = True
+                if not state['done']:
+                    # skip whatever the consumer left of the table
+                    for event, _ in events:
+                        if event == 'end':
+                            break
+
+    @staticmethod
+    def _iter_rows(events, state):
+        msg = ("the rows of a table streamed with chunksize must be read "
+               "before the next table")
+        if state['stale']:
+            raise ValueError(msg)
+        for event, row in events:
+            if event == 'end':
+                state['done'] = True
+                return
+            yield row
+            if state['stale']:
+                raise ValueError(msg)
+
+    def _iter_blocks(self):
+        """ yield the raw document in blocks """
+        io = self.io
+        if _is_url(io):
+            with urlopen(io) as f:
+                for block in iter(lambda: f.read(self._block_size), b''):
+                    yield block
+        elif hasattr(io, 'read'):
+            while True:
+                block = io.read(self._block_size)
+                if not block:
+                    break
+                yield block
+        elif isinstance(io, char_types):
+            try:
+                is_file = os.path.isfile(io)
+            except (TypeError, ValueError):
+                is_file = False
+            if is_file:
+                with open(io, 'rb') as f:
+                    for block in iter(lambda: f.read(self._block_size),
+                                      b''):
+                        yield block
+            else:
+                yield io
+        else:
+            raise TypeError("Cannot read object of type %r"
+                            % type(io).__name__)
+
+    def _iter_events(self):
+        """
+        Yield ``('start', None)`` when a table matches, ``('row', row)``
+        for each of its rows and ``('end', None)`` at its end.
+        """
+        from lxml.etree import HTMLPullParser
+
+        attrs = dict(self.attrs or {})
+        if 'class_' in attrs:
+            attrs['class'] = attrs.pop('class_')
+
+        parser = HTMLPullParser(events=('start', 'end'),
+                                encoding=self.encoding)
+        depth = 0         # nesting level of <table> elements
+        section = None    # 'thead', 'tbody' or 'tfoot' of the table
+        skip = False      # the table doesn't match attrs or is hidden
+        matched = False   # text of the table matched self.match
+        found = False
+        buffered = []     # rows parsed before the table matched
+
+        for block in chain(self._iter_blocks(), [None]):
+            if block is None:
+                parser.close()
+            else:
+                parser.feed(block)
+
+            for event, elem in parser.read_events():
+                tag = elem.tag
+                if not isinstance(tag, string_types):
+                    continue
+
+                if event == 'start':
+                    if tag == 'table':
+                        depth += 1
+                        if depth == 1:
+                            skip = (
+                                any(elem.get(k) != v
+                                    for k, v in iteritems(attrs)) or
+                                (self.displayed_only and _is_hidden(elem)))
+                            section, matched, buffered = None, False, []
+                    elif depth == 1 and tag in ('thead', 'tbody', 'tfoot'):
+                        section = tag
+                    continue
+
+                if depth == 0:
+                    # free everything parsed outside of tables
+                    elem.clear()
+                    continue
+
+                # rows are freed at their end, so look for the match in
+                # their text (and the tails within them) before that, and in
+                # whatever else is left of the table at its end
+                if (not skip and not matched and
+                        (tag == 'tr' or (tag == 'table' and depth == 1)) and
+                        any(self.match.search(text)
+                            for text in elem.itertext())):
+                    matched = found = True
+                    yield 'start', None
+                    for row in buffered:
+                        yield 'row', row
+                    buffered = []
+
+                row = None
+                if tag == 'table':
+                    depth -= 1
+                    if depth == 0:
+                        if matched:
+                            yield 'end', None
+                        skip, matched, buffered = False, False, []
+                        self._free(elem)
+                elif depth > 1 or skip:
+                    pass
+                elif tag in ('thead', 'tbody', 'tfoot'):
+                    # see _parse_thead_tr for <thead> holding <th>s
+                    if tag == 'thead' and self._parse_td(elem):
+                        row = self._parse_row('thead', elem)
+                    section = None
+                elif tag == 'tr':
+                    row = self._parse_row(section or 'tbody', elem)
+                    self._free(elem)
+
+                if row is not None:
+                    if matched:
+                        yield 'row', row
+                    else:
+                        buffered.append(row)
+
+        if not found:
+            raise ValueError("No tables found matching regex {patt!r}"
+                             .format(patt=self.match.pattern))
+
+    def _parse_row(self, section, tr):
+        """
+        Return ``(section, cells, all_th)`` for a <tr>, or None if it is
+        hidden.
+        """
+        if self.displayed_only:
+            for elem in chain([tr], tr.iterancestors()):
+                if elem.tag == 'table':
+                    break
+                if _is_hidden(elem):
+                    return None
+            for elem in [elem for elem in tr.iterdescendants()
+                         if 'style' in elem.attrib and _is_hidden(elem)]:
+                elem.getparent().remove(elem)
+
+        all_th = all(self._equals_tag(td, 'th') for td in self._parse_td(tr))
+        return section, self._parse_cells(tr), all_th
+
+    def _text_getter(self, obj):
+        # same as text_content(), comments are skipped
+        return u('').join(obj.itertext())
+
+    def _parse_td(self, row):
+        return [child for child in row if child.tag in ('td', 'th')]
+
+    @staticmethod
+    def _free(elem):
+        elem.clear()
+        parent = elem.getparent()
+        if parent is not None:
+            parent.remove(elem)
+
+
 def _expand_elements(body):
     lens = Series(lmap(len, body))
     lens_max = lens.max()
@@ -778,22 +999,25 @@ def _expand_elements(body):
         body[ind] += empty * (lens_max - length)
 
 
+def _infer_header(head, header):
+    """ infer header when there is a <thead> or top <th>-only rows """
+    if head and header is None:
+        if len(head) == 1:
+            header = 0
+        else:
+            # ignore all-empty-text rows
+            header = [i for i, row in enumerate(head)
+                      if any(text for text in row)]
+    return header
+
+
 def _data_to_frame(**kwargs):
     head, body, foot = kwargs.pop('data')
-    header = kwargs.pop('header')
+    header = _infer_header(head, kwargs.pop('header'))
     kwargs['skiprows'] = _get_skiprows(kwargs['skiprows'])
     if head:
         body = head + body
 
-        # Infer header when there is a <thead> or top <th>-only rows
-        if header is None:
-            if len(head) == 1:
-                header = 0
-            else:
-                # ignore all-empty-text rows
-                header = [i for i, row in enumerate(head)
-                          if any(text for text in row)]
-
     if foot:
         body += foot
 
@@ -804,6 +1028,85 @@ def _data_to_frame(**kwargs):
     return df
 
 
+def _iter_data_to_frames(rows, chunksize, **kwargs):
+    """
+    Yield DataFrames of ``chunksize`` rows from the
+    ``(section, cells, all_th)`` rows of a streamed table.
+
+    As in ``_HtmlFrameParser._parse_thead_tbody_tfoot`` the header is made
+    of the <thead> rows, or else of the top all-<th> rows, and the <tfoot>
+    rows come last. Ragged rows are padded to the width of the header (or
+    of the first row).
+
+    Raises
+    ------
+    ParserError
+        If a row is wider than the header and the first row, as the
+        columns of the chunks already read can not be extended.
+    """
+    head, pending, foot = [], [], []
+    rows = iter(rows)
+    first = None
+    for row in rows:
+        section, cells, all_th = row
+        if section == 'thead':
+            head.append(cells)
+        elif section == 'tfoot':
+            foot.append(cells)
+        elif all_th:
+            pending.append(cells)
+        else:
+            first = cells
+            break
+    if not head:
+        head, pending = pending, []
+    if first is not None:
+        pending.append(first)
+
+    def body_cells():
+        for cells in pending:
+            yield cells
+        for section, cells, _ in rows:
+            if section == 'tfoot':
+                foot.append(cells)
+            else:
+                yield cells
+
+    head = list(_expand_colspan_rowspan(head))
+    body = _expand_colspan_rowspan(body_cells())
+    # generators start lazily: this sees the <tfoot> rows found in the body
+    footer = _expand_colspan_rowspan(foot)
+
+    header = _infer_header(head, kwargs.pop('header'))
+    kwargs['skiprows'] = _get_skiprows(kwargs['skiprows'])
+
+    first_row = next(body, None)
+    width = max([len(row) for row in head] +
+                [len(first_row) if first_row is not None else 0])
+
+    def padded():
+        lines = chain(head, [] if first_row is None else [first_row], body,
+                      footer)
+        empty = ['']
+        for i, line in enumerate(lines):
+            if len(line) < width:
+                line = line + empty * (width - len(line))
+            elif len(line) > width:
+                raise ParserError("row {i} of the table has {n} cells, more "
+                                  "than the {width} of its header or first "
+                                  "row; read it without chunksize"
+                                  .format(i=i, n=len(line), width=width))
+            yield line
+
+    try:
+        reader = TextParser(padded(), header=header, chunksize=chunksize,
+                            **kwargs)
+    except EmptyDataError:  # empty table
+        return
+    for chunk in reader:
+        yield chunk
+
+
 _valid_parsers = {'lxml': _LxmlFrameParser, None: _LxmlFrameParser,
                   'html5lib': _BeautifulSoupHtml5LibFrameParser,
                   'bs4': _BeautifulSoupHtml5LibFrameParser}
@@ -924,11 +1227,34 @@ def _parse(flavor, io, match, attrs, encoding, displayed_only, **kwargs):
     return ret
 
 
+def _parse_chunks(flavor, io, match, attrs, encoding, displayed_only,
+                  chunksize, **kwargs):
+    flavor = _validate_flavor(flavor)
+    if 'lxml' not in flavor:
+        raise ValueError("chunksize is only supported by the 'lxml' flavor")
+    _parser_dispatch('lxml')
+
+    parser = _LxmlIterFrameParser(io, re.compile(match), attrs, encoding,
+                                  displayed_only)
+
+    def iter_tables():
+        for rows in parser.parse_tables():
+            chunks = _iter_data_to_frames(rows, chunksize, **kwargs)
+            # skip empty tables, like _parse
+            try:
+                first = next(chunks)
+            except StopIteration:
+                continue
+            yield chain([first], chunks)
+
+    return iter_tables()
+
+
 def read_html(io, match='.+', flavor=None, header=None, index_col=None,
               skiprows=None, attrs=None, parse_dates=False,
               tupleize_cols=None, thousands=',', encoding=None,
               decimal='.', converters=None, na_values=None,
-              keep_default_na=True, displayed_only=True):
+              keep_default_na=True, displayed_only=True, chunksize=None):
     r"""Read HTML tables into a ``list`` of ``DataFrame`` objects.
 
     Parameters
@@ -1037,9 +1363,22 @@ def read_html(io, match='.+', flavor=None, header=None, index_col=None,
 
         .. versionadded:: 0.23.0
 
+    chunksize : int, optional
+        Stream the document with lxml and return, instead of a list, an
+        iterator over the matching tables, each an iterator of DataFrames
+        of ``chunksize`` rows. Each <tr> is freed as soon as it has been
+        parsed, so tables larger than memory can be read. The chunks of a
+        table must be read before moving on to the next table, reading them
+        afterwards raises a ``ValueError``. A row wider than the header or
+        the first row of its table raises a ``ParserError``. Requires the
+        'lxml' flavor.
+
+        .. versionadded:: 0.25.0
+
     Returns
     -------
-    dfs : list of DataFrames
+    dfs : list of DataFrames, or an iterator of iterators of DataFrames if
+          ``chunksize`` is given
 
     See Also
     --------
@@ -1085,6 +1424,18 @@ def read_html(io, match='.+', flavor=None, header=None, index_col=None,
         raise ValueError('cannot skip rows starting from the end of the '
                          'data (you passed a negative value)')
     _validate_header_arg(header)
+    if chunksize is not None:
+        chunksize = _validate_integer('chunksize', chunksize, 1)
+        return _parse_chunks(flavor=flavor, io=io, match=match,
+                             header=header, index_col=index_col,
+                             skiprows=skiprows, parse_dates=parse_dates,
+                             tupleize_cols=tupleize_cols,
+                             thousands=thousands, attrs=attrs,
+                             encoding=encoding, decimal=decimal,
+                             converters=converters, na_values=na_values,
+                             keep_default_na=keep_default_na,
+                             displayed_only=displayed_only,
+                             chunksize=chunksize)
     return _parse(flavor=flavor, io=io, match=match, header=header,
                   index_col=index_col, skiprows=skiprows,
                   parse_dates=parse_dates, tupleize_cols=tupleize_cols,
@@ -12,7 +12,13 @@ class ExtType(namedtuple('ExtType', 'code data')):
         if not isinstance(code, int):
             raise TypeError("code must be int")
         if not isinstance(data, bytes):
-            raise TypeError("data must be bytes")
+            # objects exposing a contiguous buffer (e.g. ndarrays) are
+            # packed directly, without an intermediate bytes copy
+            try:
+                memoryview(data)
+            except TypeError:
+                raise TypeError("data must be bytes or support the buffer "
+                                "protocol")
         if not 0 <= code <= 127:
             raise ValueError("code must be 0~127")
         return super(ExtType, cls).__new__(cls, code, data)
@@ -10,6 +10,7 @@ from cpython cimport (
     PyBytes_AsString,
     PyBytes_FromStringAndSize,
     PyUnicode_AsEncodedString)
+from cpython.buffer cimport PyBUF_SIMPLE, PyBuffer_Release, PyObject_GetBuffer
 from libc.stdlib cimport free, malloc
 
 from pandas.io.msgpack.exceptions import PackValueError
@@ -135,6 +136,7 @@ cdef class Packer(object):
             dict d
             size_t L
             int default_used = 0
+            Py_buffer view
 
         if nest_limit < 0:
             raise PackValueError("recursion limit exceeded.")
@@ -213,12 +215,26 @@ cdef class Packer(object):
             elif isinstance(o, ExtType):
                 # This should be before Tuple because ExtType is namedtuple.
                 longval = o.code
-                rawval = o.data
-                L = len(o.data)
-                if L > (2**32) - 1:
-                    raise ValueError("EXT data is too large")
-                ret = msgpack_pack_ext(&self.pk, longval, L)
-                ret = msgpack_pack_raw_body(&self.pk, rawval, L)
+                if PyBytes_Check(o.data):
+                    rawval = o.data
+                    L = len(o.data)
+                    if L > (2**32) - 1:
+                        raise ValueError("EXT data is too large")
+                    ret = msgpack_pack_ext(&self.pk, longval, L)
+                    ret = msgpack_pack_raw_body(&self.pk, rawval, L)
+                else:
+                    # pack straight from the buffer of the object (e.g. an
+                    # ndarray) instead of copying it into bytes first
+                    PyObject_GetBuffer(o.data, &view, PyBUF_SIMPLE)
+                    try:
+                        L = view.len
+                        if L > (2**32) - 1:
+                            raise ValueError("EXT data is too large")
+                        ret = msgpack_pack_ext(&self.pk, longval, L)
+                        ret = msgpack_pack_raw_body(&self.pk,
+                                                    <char*>view.buf, L)
+                    finally:
+                        PyBuffer_Release(&view)
             elif PyTuple_Check(o) or PyList_Check(o):
                 L = len(o)
                 if L > (2**32) - 1:
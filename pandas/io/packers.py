@@ -39,6 +39,8 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
 from datetime import date, datetime, timedelta
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
 import os
 from textwrap import dedent
 import warnings
@@ -287,8 +289,9 @@ def convert(values):
         if dtype == np.object_:
             return v.tolist()
 
-        # convert to a bytes array
-        v = v.tostring()
+        # compress straight from the (contiguous) array buffer
+        if compat.PY2:
+            v = v.tostring()
         return ExtType(0, zlib.compress(v))
 
     elif compressor == 'blosc':
@@ -302,13 +305,57 @@ def convert(values):
         v = v.tostring()
         return ExtType(0, blosc.compress(v, typesize=dtype.itemsize))
 
-    # ndarray (on original dtype)
-    return ExtType(0, v.tostring())
+    # ndarray (on original dtype), the packer reads the buffer of the
+    # contiguous array directly
+    return ExtType(0, v)
+
+
+def _convert_blocks(blocks):
+    """
+    Convert the values of the blocks. When compressing, the blocks are
+    compressed in parallel on a thread pool (zlib and blosc release the GIL).
+    """
+    values = [b.values for b in blocks]
+    if not compressor or len(values) < 2:
+        return [convert(v) for v in values]
+
+    pool = ThreadPool(min(len(values), cpu_count()))
+    try:
+        return pool.map(convert, values)
+    finally:
+        pool.close()
+        pool.join()
+
+
+class _ExtBuffer(object):
+    """
+    Holds the data of a pandas (code 0) ext type while unpacking.
+
+    ``unconvert`` pops the bytes out of the holder, leaving them with a
+    single reference so that they can be moved into a mutable buffer instead
+    of being copied.
+    """
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = data
+
+    def pop(self):
+        data = self.data
+        self.data = None
+        return data
+
+
+def _ext_hook(code, data):
+    if code == 0:
+        return _ExtBuffer(data)
+    return ExtType(code, data)
 
 
 def unconvert(values, dtype, compress=None):
 
     as_is_ext = isinstance(values, ExtType) and values.code == 0
+    as_ext_buffer = isinstance(values, _ExtBuffer)
 
     if as_is_ext:
         values = values.data
@@ -321,7 +368,7 @@ def unconvert(values, dtype, compress=None):
 
     dtype = pandas_dtype(dtype).base
 
-    if not as_is_ext:
+    if not (as_is_ext or as_ext_buffer):
         values = values.encode('latin1')
 
     if compress:
@@ -334,6 +381,9 @@ def unconvert(values, dtype, compress=None):
         else:
             raise ValueError("compress must be one of 'zlib' or 'blosc'")
 
+        if as_ext_buffer:
+            values = values.pop()
+
         try:
             return np.frombuffer(
                 _move_into_mutable_buffer(decompress(values)),
@@ -357,6 +407,16 @@ def unconvert(values, dtype, compress=None):
                 )
                 # fall through to copying `np.fromstring`
 
+    elif as_ext_buffer:
+        # The unpacked bytes are only referenced by the holder, so they can be
+        # handed to the array without a copy.
+        try:
+            return np.frombuffer(_move_into_mutable_buffer(values.pop()),
+                                 dtype=dtype)
+        except _BadMove as e:
+            # memoized (empty or single character) bytes, copy below
+            values = e.args[0]
+
     # Copy the bytes into a numpy array.
     buf = np.frombuffer(values, dtype=dtype)
     buf = buf.copy()  # required to not mutate the original data
@@ -482,11 +542,14 @@ def encode(obj):
                     u'klass': u(obj.__class__.__name__),
                     u'axes': data.axes,
                     u'blocks': [{u'locs': b.mgr_locs.as_array,
-                                 u'values': convert(b.values),
+                                 u'values': values,
                                  u'shape': b.values.shape,
                                  u'dtype': u(b.dtype.name),
                                  u'klass': u(b.__class__.__name__),
-                                 u'compress': compressor} for b in data.blocks]
+                                 u'compress': compressor}
+                                for b, values in zip(
+                                    data.blocks,
+                                    _convert_blocks(data.blocks))]
                     }
 
     elif isinstance(obj, (datetime, date, np.datetime64, timedelta,
@@ -735,7 +798,7 @@ def pack(o, default=encode,
 def unpack(packed, object_hook=decode,
            list_hook=None, use_list=False, encoding='utf-8',
            unicode_errors='strict', object_pairs_hook=None,
-           max_buffer_size=0, ext_hook=ExtType):
+           max_buffer_size=0, ext_hook=_ext_hook):
     """
     Unpack a packed object, return an iterator
     Note: packed lists will be returned as tuples
@@ -771,7 +834,8 @@ class Unpacker(_Unpacker):
     def __init__(self, file_like=None, read_size=0, use_list=False,
                  object_hook=decode,
                  object_pairs_hook=None, list_hook=None, encoding='utf-8',
-                 unicode_errors='strict', max_buffer_size=0, ext_hook=ExtType):
+                 unicode_errors='strict', max_buffer_size=0,
+                 ext_hook=_ext_hook):
         super(Unpacker, self).__init__(file_like=file_like,
                                        read_size=read_size,
                                        use_list=use_list,
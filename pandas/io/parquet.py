@@ -1,12 +1,24 @@
 """ parquet compat """
 
+from collections import OrderedDict
+import datetime
 from distutils.version import LooseVersion
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+import numbers
+import os
+import uuid
 from warnings import catch_warnings
 
-from pandas.compat import string_types
+import numpy as np
+
+from pandas.compat import binary_type, string_types, text_type
 from pandas.errors import AbstractMethodError
 
-from pandas import DataFrame, get_option
+from pandas.core.dtypes.common import is_categorical_dtype, is_list_like
+
+from pandas import Categorical, DataFrame, RangeIndex, Series, get_option
+from pandas.core.reshape.concat import concat
 
 from pandas.io.common import get_filepath_or_buffer, is_s3_url
 
@@ -43,6 +55,286 @@ def get_engine(engine):
         return FastParquetImpl()
 
 
+_FILTER_OPS = ('=', '==', '!=', '<', '<=', '>', '>=', 'in', 'not in')
+
+
+def _normalize_filters(filters):
+    """
+    Validate ``filters`` and return them in disjunctive normal form.
+
+    A flat list of ``(column, op, value)`` tuples is a single conjunction;
+    a list of such lists is a disjunction of conjunctions.
+    """
+    if filters is None:
+        return None
+
+    if not isinstance(filters, list) or not len(filters):
+        raise ValueError("filters must be a non-empty list of "
+                         "(column, op, value) tuples")
+    if isinstance(filters[0], tuple):
+        filters = [filters]
+
+    for conjunction in filters:
+        if not isinstance(conjunction, list) or not len(conjunction):
+            raise ValueError("filters must be a non-empty list of "
+                             "(column, op, value) tuples")
+        for predicate in conjunction:
+            if not isinstance(predicate, tuple) or len(predicate) != 3:
+                raise ValueError("invalid filter {predicate!r}, filters "
+                                 "must be (column, op, value) "
+                                 "tuples".format(predicate=predicate))
+            op, value = predicate[1:]
+            if op not in _FILTER_OPS:
+                raise ValueError("invalid filter operator {op!r}, must be "
+                                 "one of {ops}".format(op=op,
+                                                       ops=_FILTER_OPS))
+            if op in ('in', 'not in') and not is_list_like(value):
+                raise ValueError("the value of an {op!r} filter must be "
+                                 "list-like".format(op=op))
+    return filters
+
+
+def _filter_columns(columns, filters):
+    """
+    Return the columns to read so that ``filters`` can be evaluated, and
+    the ones among them that were not asked for.
+    """
+    if columns is None or filters is None:
+        return columns, []
+
+    extra = []
+    for conjunction in filters:
+        for name, _, _ in conjunction:
+            if name not in columns and name not in extra:
+                extra.append(name)
+    return list(columns) + extra, extra
+
+
+# kinds of values that are ordered among themselves
+_ORDERED_KINDS = [(numbers.Number, np.number, np.bool_), text_type,
+                  binary_type, (datetime.date, np.datetime64),
+                  (datetime.timedelta, np.timedelta64)]
+
+
+def _same_kind(a, b):
+    """
+    Return whether ``a`` and ``b`` can be ordered against each other. Under
+    Python 2 comparing e.g. strings with numbers doesn't raise but orders
+    them by type.
+    """
+    for kind in _ORDERED_KINDS:
+        if isinstance(a, kind):
+            return isinstance(b, kind)
+    return type(a) is type(b)
+
+
+def _predicate_may_match(op, value, lo, hi):
+    """
+    Return whether a row group whose values lie in ``[lo, hi]`` may hold a
+    value satisfying ``op value``.
+    """
+    sample = value
+    if op in ('in', 'not in'):
+        sample = next(iter(value), None)
+    if isinstance(lo, binary_type) and isinstance(sample, text_type):
+        # string statistics are the raw utf-8 bytes
+        try:
+            lo, hi = lo.decode('utf-8'), hi.decode('utf-8')
+        except UnicodeDecodeError:
+            return True
+
+    values = value if op in ('in', 'not in') else [value]
+    if not all(_same_kind(lo, v) and _same_kind(hi, v) for v in values):
+        # the statistics can't rule out the row group
+        return True
+
+    try:
+        if op in ('=', '=='):
+            return bool(lo <= value <= hi)
+        elif op == '!=':
+            return not (lo == hi == value)
+        elif op == '<':
+            return bool(lo < value)
+        elif op == '<=':
+            return bool(lo <= value)
+        elif op == '>':
+            return bool(hi > value)
+        elif op == '>=':
+            return bool(hi >= value)
+        elif op == 'in':
+            return any(lo <= v <= hi for v in value)
+        else:
+            return not (lo == hi and lo in value)
+    except (TypeError, ValueError):
+        # the statistics are not comparable with the filter value
+        return True
+
+
+def _row_group_may_match(statistics, filters):
+    """
+    Return whether any row of a row group may satisfy ``filters``.
+
+    ``statistics`` maps column names to ``(min, max)``; predicates on
+    columns without statistics can never rule a row group out.
+    """
+    for conjunction in filters:
+        if all(name not in statistics or
+               _predicate_may_match(op, value, *statistics[name])
+               for name, op, value in conjunction):
+            return True
+    return False
+
+
+def _filter_frame(df, filters):
+    """ return the rows of ``df`` that satisfy ``filters`` """
+    mask = np.zeros(len(df), dtype=bool)
+    for conjunction in filters:
+        matched = np.ones(len(df), dtype=bool)
+        for name, op, value in conjunction:
+            if name in df.columns:
+                values = df[name]
+            elif name in df.index.names:
+                values = Series(df.index.get_level_values(name),
+                                index=df.index)
+            else:
+                raise ValueError("filter column {name!r} is not in the "
+                                 "data".format(name=name))
+            if is_categorical_dtype(values):
+                # partition keys are read as unordered categoricals
+                values = values.astype(values.cat.categories.dtype)
+
+            if op in ('=', '=='):
+                result = values == value
+            elif op == '!=':
+                result = (values != value) & values.notna()
+            elif op == '<':
+                result = values < value
+            elif op == '<=':
+                result = values <= value
+            elif op == '>':
+                result = values > value
+            elif op == '>=':
+                result = values >= value
+            elif op == 'in':
+                result = values.isin(value)
+            else:
+                result = ~values.isin(value) & values.notna()
+            matched &= np.asarray(result, dtype=bool)
+        mask |= matched
+
+    if mask.all():
+        return df
+    return df[mask]
+
+
+def _is_local(path, kwargs):
+    """
+    Return whether ``path`` is an open file or a path on the local
+    filesystem, i.e. not a URL, and no ``filesystem`` is passed in
+    ``kwargs``.
+    """
+    return (kwargs.get('filesystem') is None and
+            not (isinstance(path, string_types) and '://' in path))
+
+
+def _write_partitioned(df, path, partition_cols, write):
+    """
+    Write ``df`` as a hive-style dataset under the directory ``path``.
+
+    The frame is split in a single pass with ``groupby`` and every group is
+    written without its partition columns by ``write(frame, filename)`` to a
+    ``key=value/...`` subdirectory, one level per partition column.
+    """
+    if not is_list_like(partition_cols):
+        partition_cols = [partition_cols]
+    partition_cols = list(partition_cols)
+
+    missing = [name for name in partition_cols if name not in df.columns]
+    if missing:
+        raise ValueError("partition_cols {missing} are not columns of the "
+                         "DataFrame".format(missing=missing))
+    data_cols = [name for name in df.columns if name not in partition_cols]
+    if not data_cols:
+        raise ValueError("No data left to save outside partition columns")
+
+    for keys, group in df.groupby(partition_cols, sort=False):
+        if not isinstance(keys, tuple):
+            keys = (keys,)
+        subdir = os.path.join(path, *['{name}={value}'.format(name=name,
+                                                              value=value)
+                                      for name, value in zip(partition_cols,
+                                                             keys)])
+        if not os.path.isdir(subdir):
+            os.makedirs(subdir)
+        write(group[data_cols],
+              os.path.join(subdir, '{name}.parquet'.format(
+                  name=uuid.uuid4().hex)))
+
+
+def _discover_partitions(path):
+    """
+    Find the data files of a hive-style dataset under the directory
+    ``path``.
+
+    Returns a list of ``(filename, [(key, value), ...])`` pieces and an
+    OrderedDict mapping each partition key to its sorted values. Keys whose
+    values are all integers are converted to int, names starting with
+    ``'_'`` or ``'.'`` (metadata, hidden files) are skipped.
+    """
+    pieces = []
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(name for name in dirs
+                         if not name.startswith(('_', '.')))
+        partition = []
+        relative = os.path.relpath(root, path)
+        if relative != os.curdir:
+            for part in relative.split(os.sep):
+                key, sep, value = part.partition('=')
+                if not sep:
+                    raise ValueError("{part!r} is not a 'key=value' "
+                                     "partition directory".format(part=part))
+                partition.append((key, value))
+        for name in sorted(files):
+            if not name.startswith(('_', '.')):
+                pieces.append((os.path.join(root, name), partition))
+
+    keys = [key for key, _ in pieces[0][1]] if pieces else []
+    if any([key for key, _ in partition] != keys
+           for _, partition in pieces):
+        raise ValueError("the partition directories of {path!r} are not "
+                         "nested in the same order".format(path=path))
+
+    converters = []
+    for i in range(len(keys)):
+        try:
+            for _, partition in pieces:
+                int(partition[i][1])
+        except ValueError:
+            converters.append(text_type)
+        else:
+            converters.append(int)
+    pieces = [(name, [(key, convert(value)) for (key, value), convert
+                      in zip(partition, converters)])
+              for name, partition in pieces]
+
+    categories = OrderedDict(
+        (key, sorted({partition[i][1] for _, partition in pieces}))
+        for i, key in enumerate(keys))
+    return pieces, categories
+
+
+def _pyarrow_statistics(row_group):
+    """ return ``{column: (min, max)}`` for a pyarrow row group """
+    statistics = {}
+    for i in range(row_group.num_columns):
+        column = row_group.column(i)
+        stats = column.statistics
+        if stats is None or not getattr(stats, 'has_min_max', True):
+            continue
+        statistics[column.path_in_schema] = (stats.min, stats.max)
+    return statistics
+
+
 class BaseImpl(object):
 
     api = None  # module
@@ -69,7 +361,7 @@ class BaseImpl(object):
     def write(self, df, path, compression, **kwargs):
         raise AbstractMethodError(self)
 
-    def read(self, path, columns=None, **kwargs):
+    def read(self, path, columns=None, filters=None, **kwargs):
         raise AbstractMethodError(self)
 
 
@@ -110,31 +402,148 @@ class PyArrowImpl(BaseImpl):
             from_pandas_kwargs = {}
         else:
             from_pandas_kwargs = {'preserve_index': index}
-        table = self.api.Table.from_pandas(df, **from_pandas_kwargs)
-        if partition_cols is not None:
+
+        def write_table(frame, where):
+            table = self.api.Table.from_pandas(frame, **from_pandas_kwargs)
+            self.api.parquet.write_table(
+                table, where, compression=compression,
+                coerce_timestamps=coerce_timestamps, **kwargs)
+
+        if partition_cols is not None and not _is_local(path, kwargs):
+            # datasets on other filesystems are written by pyarrow
+            table = self.api.Table.from_pandas(df, **from_pandas_kwargs)
             self.api.parquet.write_to_dataset(
                 table, path, compression=compression,
                 coerce_timestamps=coerce_timestamps,
                 partition_cols=partition_cols, **kwargs)
+        elif partition_cols is not None:
+            if index is None:
+                # like pyarrow.parquet.write_to_dataset, the index of the
+                # groups is not written by default
+                from_pandas_kwargs['preserve_index'] = False
+            _write_partitioned(df, path, partition_cols, write_table)
         else:
-            self.api.parquet.write_table(
-                table, path, compression=compression,
-                coerce_timestamps=coerce_timestamps, **kwargs)
+            write_table(df, path)
 
-    def read(self, path, columns=None, **kwargs):
+    def read(self, path, columns=None, filters=None, **kwargs):
         path, _, _, should_close = get_filepath_or_buffer(path)
+        filters = _normalize_filters(filters)
+        read_columns, extra_columns = _filter_columns(columns, filters)
 
         kwargs['use_pandas_metadata'] = True
-        result = self.api.parquet.read_table(path, columns=columns,
-                                             **kwargs).to_pandas()
+        local = _is_local(path, kwargs)
+        if (local and isinstance(path, string_types) and
+                os.path.isdir(path)):
+            return self._read_dataset(path, columns, filters, **kwargs)
+
+        # datasets on other filesystems are read by pyarrow
+        if filters is not None and local:
+            table = self._read_row_groups(path, read_columns, filters,
+                                          **kwargs)
+        else:
+            table = self.api.parquet.read_table(path, columns=read_columns,
+                                                **kwargs)
+        result = table.to_pandas()
         if should_close:
             try:
                 path.close()
             except:  # noqa: flake8
                 pass
 
+        if filters is not None:
+            result = _filter_frame(result, filters)
+            if extra_columns:
+                result = result.drop(extra_columns, axis=1)
+        return result
+
+    def _read_dataset(self, path, columns, filters, **kwargs):
+        """
+        Read a hive-style partitioned dataset.
+
+        Partitions whose directory keys rule out ``filters`` are skipped,
+        the remaining files are read in parallel and the partition keys
+        are added back as categorical columns.
+        """
+        all_pieces, categories = _discover_partitions(path)
+        if not all_pieces:
+            return DataFrame(columns=columns)
+
+        pieces = all_pieces
+        if filters is not None:
+            pieces = [piece for piece in all_pieces
+                      if _row_group_may_match(
+                          dict((key, (value, value))
+                               for key, value in piece[1]), filters)]
+            if not pieces:
+                # nothing can match, but read a file for the schema
+                pieces = all_pieces[:1]
+
+        read_columns, _ = _filter_columns(columns, filters)
+        if read_columns is not None:
+            read_columns = [name for name in read_columns
+                            if name not in categories]
+
+        def read_piece(piece):
+            filename, partition = piece
+            if filters is None:
+                table = self.api.parquet.read_table(
+                    filename, columns=read_columns, **kwargs)
+            else:
+                table = self._read_row_groups(filename, read_columns,
+                                              filters, **kwargs)
+            frame = table.to_pandas()
+            for key, value in partition:
+                frame[key] = value
+            return frame
+
+        if len(pieces) == 1:
+            frames = [read_piece(pieces[0])]
+        else:
+            # pyarrow releases the GIL while reading and converting
+            pool = ThreadPool(min(len(pieces), cpu_count()))
+            try:
+                frames = pool.map(read_piece, pieces)
+            finally:
+                pool.close()
+                pool.join()
+
+        ignore_index = all(isinstance(frame.index, RangeIndex)
+                           for frame in frames)
+        result = concat(frames, ignore_index=ignore_index, sort=False)
+        for key, values in categories.items():
+            result[key] = Categorical(result[key], categories=values)
+
+        if filters is not None:
+            result = _filter_frame(result, filters)
+        if columns is not None:
+            result = result[list(columns)]
         return result
 
+    def _read_row_groups(self, path, columns, filters, **kwargs):
+        """
+        Read the row groups of a single file whose statistics show that
+        they may hold rows matching ``filters``.
+        """
+        parquet_file = self.api.parquet.ParquetFile(path)
+        metadata = parquet_file.metadata
+        if not metadata.num_row_groups:
+            return parquet_file.read(columns=columns, **kwargs)
+
+        row_groups = [
+            i for i in range(metadata.num_row_groups)
+            if _row_group_may_match(
+                _pyarrow_statistics(metadata.row_group(i)), filters)]
+        if not row_groups:
+            # nothing can match, but read a row group for the schema
+            return parquet_file.read_row_group(
+                0, columns=columns, **kwargs).slice(0, 0)
+
+        tables = [parquet_file.read_row_group(i, columns=columns, **kwargs)
+                  for i in row_groups]
+        if len(tables) == 1:
+            return tables[0]
+        return self.api.concat_tables(tables)
+
 
 class FastParquetImpl(BaseImpl):
 
@@ -194,7 +603,10 @@ class FastParquetImpl(BaseImpl):
                            write_index=index, partition_on=partition_cols,
                            **kwargs)
 
-    def read(self, path, columns=None, **kwargs):
+    def read(self, path, columns=None, filters=None, **kwargs):
+        filters = _normalize_filters(filters)
+        read_columns, extra_columns = _filter_columns(columns, filters)
+
         if is_s3_url(path):
             # When path is s3:// an S3File is returned.
             # We need to retain the original path(str) while also
@@ -208,7 +620,24 @@ class FastParquetImpl(BaseImpl):
             path, _, _, _ = get_filepath_or_buffer(path)
             parquet_file = self.api.ParquetFile(path)
 
-        return parquet_file.to_pandas(columns=columns, **kwargs)
+        if filters is None:
+            return parquet_file.to_pandas(columns=columns, **kwargs)
+
+        # fastparquet skips row groups (and partitions) using the
+        # statistics of a single conjunction, so select the row groups
+        # kept by any conjunction and evaluate the predicate on the rest
+        keep = set()
+        for conjunction in filters:
+            keep.update(id(rg) for rg in
+                        parquet_file.filter_row_groups(conjunction))
+        parquet_file.row_groups = [rg for rg in parquet_file.row_groups
+                                   if id(rg) in keep]
+
+        result = parquet_file.to_pandas(columns=read_columns, **kwargs)
+        result = _filter_frame(result, filters)
+        if extra_columns:
+            result = result.drop(extra_columns, axis=1)
+        return result
 
 
 def to_parquet(df, path, engine='auto', compression='snappy', index=None,
@@ -240,7 +669,9 @@ def to_parquet(df, path, engine='auto', compression='snappy', index=None,
 
     partition_cols : list, optional, default None
         Column names by which to partition the dataset
-        Columns are partitioned in the order they are given
+        Columns are partitioned in the order they are given. With the
+        pyarrow engine the frame is split in a single ``groupby`` pass and
+        written as a ``key=value/...`` directory tree.
 
         .. versionadded:: 0.24.0
 
@@ -252,7 +683,7 @@ def to_parquet(df, path, engine='auto', compression='snappy', index=None,
                       partition_cols=partition_cols, **kwargs)
 
 
-def read_parquet(path, engine='auto', columns=None, **kwargs):
+def read_parquet(path, engine='auto', columns=None, filters=None, **kwargs):
     """
     Load a parquet object from the file path, returning a DataFrame.
 
@@ -261,7 +692,13 @@ def read_parquet(path, engine='auto', columns=None, **kwargs):
     Parameters
     ----------
     path : string
-        File path
+        File path, or the root directory of a partitioned dataset.
+
+        .. versionchanged:: 0.25.0
+
+           With the pyarrow engine the files of a partitioned dataset are
+           read in parallel.
+
     columns : list, default=None
         If not None, only these columns will be read from the file.
 
@@ -271,6 +708,17 @@ def read_parquet(path, engine='auto', columns=None, **kwargs):
         ``io.parquet.engine`` is used. The default ``io.parquet.engine``
         behavior is to try 'pyarrow', falling back to 'fastparquet' if
         'pyarrow' is unavailable.
+    filters : list of tuples or list of lists of tuples, default None
+        Only return the rows matching these predicates. Each predicate is
+        a ``(column, op, value)`` tuple, where ``op`` is one of ``'='``,
+        ``'=='``, ``'!='``, ``'<'``, ``'<='``, ``'>'``, ``'>='``, ``'in'``
+        or ``'not in'``. The predicates of a list are combined with "and",
+        a list of such lists is combined with "or". Row groups whose
+        statistics show that none of their rows can match are not read,
+        nor are the partitions of a dataset whose directory keys rule out
+        a match.
+
+        .. versionadded:: 0.25.0
     kwargs are passed to the engine
 
     Returns
@@ -279,4 +727,4 @@ def read_parquet(path, engine='auto', columns=None, **kwargs):
     """
 
     impl = get_engine(engine)
-    return impl.read(path, columns=columns, **kwargs)
+    return impl.read(path, columns=columns, filters=filters, **kwargs)
@@ -1,14 +1,111 @@
 """ pickle compat """
+import mmap
+import struct
+import sys
 import warnings
 
 from numpy.lib.format import read_array
 
 from pandas.compat import PY3, BytesIO, cPickle as pkl, pickle_compat as pc
 
-from pandas.io.common import _get_handle, _stringify_path
+from pandas.io.common import _get_handle, _infer_compression, _stringify_path
 
+# Files written with out-of-band buffers start with this marker, followed by
+# the length of a small header, the header, the pickle stream and finally the
+# raw buffers, each aligned to _OUT_OF_BAND_ALIGNMENT bytes.
+_OUT_OF_BAND_MAGIC = b'PDPKLOOB'
+_OUT_OF_BAND_ALIGNMENT = 64
 
-def to_pickle(obj, path, compression='infer', protocol=pkl.HIGHEST_PROTOCOL):
+
+def _get_pickle5():
+    """
+    Return a pickle module supporting protocol 5 out-of-band buffers
+    (PEP 574): the standard library on Python >= 3.8, otherwise the pickle5
+    backport if installed, otherwise None.
+    """
+    if sys.version_info >= (3, 8):
+        import pickle
+        return pickle
+    try:
+        import pickle5
+    except ImportError:
+        return None
+    return pickle5
+
+
+def _import_pickle5():
+    pickle5 = _get_pickle5()
+    if pickle5 is None:
+        raise ImportError("out-of-band pickle buffers require pickle "
+                          "protocol 5, available in Python >= 3.8 or through "
+                          "the pickle5 package")
+    return pickle5
+
+
+def _write_out_of_band(f, obj, protocol):
+    pickle5 = _import_pickle5()
+    if protocol < 0:
+        protocol = pickle5.HIGHEST_PROTOCOL
+    if protocol < 5:
+        raise ValueError("out_of_band requires protocol >= 5, got "
+                         "{protocol}".format(protocol=protocol))
+
+    # numpy arrays (and so the Block values of a BlockManager) hand their
+    # data to the buffer callback instead of copying it into the stream
+    buffers = []
+    data = pickle5.dumps(obj, protocol=protocol,
+                         buffer_callback=buffers.append)
+    buffers = [buf.raw() for buf in buffers]
+
+    header = pkl.dumps({'pickle_length': len(data),
+                        'buffer_lengths': [buf.nbytes for buf in buffers]},
+                       protocol=2)
+    f.write(_OUT_OF_BAND_MAGIC)
+    f.write(struct.pack('<Q', len(header)))
+    f.write(header)
+    f.write(data)
+
+    pos = len(_OUT_OF_BAND_MAGIC) + 8 + len(header) + len(data)
+    for buf in buffers:
+        padding = -pos % _OUT_OF_BAND_ALIGNMENT
+        f.write(b'\x00' * padding)
+        f.write(buf)
+        pos += padding + buf.nbytes
+
+
+def _read_out_of_band(f, memory_map):
+    # the marker has already been consumed
+    pickle5 = _import_pickle5()
+    header_length = struct.unpack('<Q', f.read(8))[0]
+    header = pkl.loads(f.read(header_length))
+    data = f.read(header['pickle_length'])
+    pos = len(_OUT_OF_BAND_MAGIC) + 8 + header_length + len(data)
+
+    if memory_map:
+        # a private (copy-on-write) mapping keeps the arrays writeable
+        # without ever modifying the file
+        view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY))
+
+    buffers = []
+    for nbytes in header['buffer_lengths']:
+        padding = -pos % _OUT_OF_BAND_ALIGNMENT
+        pos += padding
+        if memory_map:
+            buffers.append(view[pos:pos + nbytes])
+        else:
+            f.read(padding)
+            buf = bytearray(nbytes)
+            if f.readinto(buf) != nbytes:
+                raise ValueError("failed to read out-of-band buffer, the "
+                                 "file is truncated")
+            buffers.append(buf)
+        pos += nbytes
+
+    return pickle5.loads(data, buffers=buffers)
+
+
+def to_pickle(obj, path, compression='infer', protocol=pkl.HIGHEST_PROTOCOL,
+              out_of_band=False):
     """
     Pickle (serialize) object to file.
 
@@ -34,6 +131,15 @@ def to_pickle(obj, path, compression='infer', protocol=pkl.HIGHEST_PROTOCOL):
 
         .. [1] https://docs.python.org/3/library/pickle.html
         .. versionadded:: 0.21.0
+    out_of_band : bool, default False
+        Write the data buffers of the object (e.g. the block values of a
+        DataFrame) after the pickle stream instead of copying them into it,
+        using pickle protocol 5 out-of-band buffers. Requires Python >= 3.8
+        or the ``pickle5`` package, and a protocol >= 5. Files written this
+        way can only be loaded with :func:`read_pickle`, which can
+        memory-map the buffers back with ``memory_map=True``.
+
+        .. versionadded:: 0.25.0
 
     See Also
     --------
@@ -70,17 +176,26 @@ def to_pickle(obj, path, compression='infer', protocol=pkl.HIGHEST_PROTOCOL):
     f, fh = _get_handle(path, 'wb',
                         compression=compression,
                         is_text=False)
-    if protocol < 0:
-        protocol = pkl.HIGHEST_PROTOCOL
     try:
-        f.write(pkl.dumps(obj, protocol=protocol))
+        if out_of_band:
+            if _infer_compression(path, compression) == 'zip':
+                # every write to a zip handle creates a new archive member
+                bio = BytesIO()
+                _write_out_of_band(bio, obj, protocol)
+                f.write(bio.getvalue())
+            else:
+                _write_out_of_band(f, obj, protocol)
+        else:
+            if protocol < 0:
+                protocol = pkl.HIGHEST_PROTOCOL
+            f.write(pkl.dumps(obj, protocol=protocol))
     finally:
         f.close()
         for _f in fh:
             _f.close()
 
 
-def read_pickle(path, compression='infer'):
+def read_pickle(path, compression='infer', memory_map=False):
     """
     Load pickled pandas object (or any object) from file.
 
@@ -100,6 +215,14 @@ def read_pickle(path, compression='infer'):
         Set to None for no decompression.
 
         .. versionadded:: 0.20.0
+    memory_map : bool, default False
+        For files written with ``to_pickle(..., out_of_band=True)``,
+        memory-map the out-of-band buffers instead of reading them, so the
+        loaded arrays are backed by the file (copy-on-write) and are only
+        paged in when accessed. Ignored for compressed files and for regular
+        pickle files.
+
+        .. versionadded:: 0.25.0
 
     Returns
     -------
@@ -140,22 +263,34 @@ def read_pickle(path, compression='infer'):
     path = _stringify_path(path)
     f, fh = _get_handle(path, 'rb', compression=compression, is_text=False)
 
-    # 1) try with cPickle
-    # 2) try with the compat pickle to handle subclass changes
-    # 3) pass encoding only if its not None as py2 doesn't handle the param
-
     try:
-        with warnings.catch_warnings(record=True):
-            # We want to silence any warnings about, e.g. moved modules.
-            warnings.simplefilter("ignore", Warning)
-            return pkl.load(f)
-    except Exception:  # noqa: E722
+        head = f.read(len(_OUT_OF_BAND_MAGIC))
+        if head == _OUT_OF_BAND_MAGIC:
+            memory_map = (memory_map and
+                          _infer_compression(path, compression) is None)
+            return _read_out_of_band(f, memory_map)
+        try:
+            f.seek(0)
+        except (IOError, ValueError):
+            # handle is not seekable, e.g. zip members on Python < 3.7
+            f = BytesIO(head + f.read())
+
+        # 1) try with cPickle
+        # 2) try with the compat pickle to handle subclass changes
+        # 3) pass encoding only if its not None as py2 doesn't handle the param
+
         try:
-            return pc.load(f, encoding=None)
+            with warnings.catch_warnings(record=True):
+                # We want to silence any warnings about, e.g. moved modules.
+                warnings.simplefilter("ignore", Warning)
+                return pkl.load(f)
         except Exception:  # noqa: E722
-            if PY3:
-                return pc.load(f, encoding='latin1')
-            raise
+            try:
+                return pc.load(f, encoding=None)
+            except Exception:  # noqa: E722
+                if PY3:
+                    return pc.load(f, encoding='latin1')
+                raise
     finally:
         f.close()
         for _f in fh:
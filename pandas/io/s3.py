@@ -1,6 +1,8 @@
 """ s3 support for remote file interactivity """
 from pandas import compat
 
+from pandas.io.common import _get_cached_remote_buffer
+
 try:
     import s3fs
     from botocore.exceptions import NoCredentialsError
@@ -25,9 +27,11 @@ def get_filepath_or_buffer(filepath_or_buffer, encoding=None,
     if mode is None:
         mode = 'rb'
 
+    url = filepath_or_buffer
+    path = _strip_schema(url)
     fs = s3fs.S3FileSystem(anon=False)
     try:
-        filepath_or_buffer = fs.open(_strip_schema(filepath_or_buffer), mode)
+        filepath_or_buffer = fs.open(path, mode)
     except (compat.FileNotFoundError, NoCredentialsError):
         # boto3 has troubles when trying to access a public file
         # when credentialed...
@@ -36,5 +40,8 @@ def get_filepath_or_buffer(filepath_or_buffer, encoding=None,
         # A NoCredentialsError is raised if you don't have creds
         # for that bucket.
         fs = s3fs.S3FileSystem(anon=True)
-        filepath_or_buffer = fs.open(_strip_schema(filepath_or_buffer), mode)
+        filepath_or_buffer = fs.open(path, mode)
+    if mode == 'rb':
+        filepath_or_buffer = _get_cached_remote_buffer(
+            fs, path, url, filepath_or_buffer)
     return filepath_or_buffer, None, compression, True
@@ -1,6 +1,8 @@
 # cython: profile=False
 # cython: boundscheck=False, initializedcheck=False
 
+from cpython cimport PyBytes_FromStringAndSize
+
 import numpy as np
 import sas_constants as const
 
@@ -437,8 +439,10 @@ cdef class Parser(object):
                 jb += 1
             elif column_types[j] == column_type_string:
                 # string
-                string_chunk[js, current_row] = np.array(source[start:(
-                    start + lngt)]).tostring().rstrip(b"\x00 ")
+                # build the bytes object straight from the row buffer,
+                # avoiding an intermediate ndarray per cell
+                string_chunk[js, current_row] = PyBytes_FromStringAndSize(
+                    <const char *>&source[start], lngt).rstrip(b"\x00 ")
                 js += 1
 
         self.current_row_on_page_index += 1
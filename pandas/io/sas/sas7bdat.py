@@ -13,6 +13,7 @@ Partial documentation of the file format:
 Reference for binary data compression:
   http://collaboration.cmc.ec.gc.ca/science/rpn/biblio/ddj/Website/articles/CUJ/1992/9210/ross/ross.htm
 """
+from collections import OrderedDict
 from datetime import datetime
 import struct
 
@@ -665,17 +666,18 @@ class SAS7BDATReader(BaseIterator):
         n = self._current_row_in_chunk_index
         m = self._current_row_in_file_index
         ix = range(m - n, m)
-        rslt = pd.DataFrame(index=ix)
 
+        # convert whole columns of the chunk at once and build the frame in
+        # a single constructor call rather than inserting column by column
+        data = OrderedDict()
         js, jb = 0, 0
         for j in range(self.column_count):
 
             name = self.column_names[j]
 
             if self._column_types[j] == b'd':
-                rslt[name] = self._byte_chunk[jb, :].view(
-                    dtype=self.byte_order + 'd')
-                rslt[name] = np.asarray(rslt[name], dtype=np.float64)
+                values = self._byte_chunk[jb, :].view(
+                    dtype=self.byte_order + 'd').astype(np.float64)
                 if self.convert_dates:
                     unit = None
                     if self.column_formats[j] in const.sas_date_formats:
@@ -683,21 +685,29 @@ class SAS7BDATReader(BaseIterator):
                     elif self.column_formats[j] in const.sas_datetime_formats:
                         unit = 's'
                     if unit:
-                        rslt[name] = pd.to_datetime(rslt[name], unit=unit,
-                                                    origin="1960-01-01")
+                        values = np.asarray(
+                            pd.to_datetime(values, unit=unit,
+                                           origin="1960-01-01"))
+                data[name] = values
                 jb += 1
             elif self._column_types[j] == b's':
-                rslt[name] = self._string_chunk[js, :]
-                if self.convert_text and (self.encoding is not None):
-                    rslt[name] = rslt[name].str.decode(
-                        self.encoding or self.default_encoding)
+                values = self._string_chunk[js, :]
                 if self.blank_missing:
-                    ii = rslt[name].str.len() == 0
-                    rslt.loc[ii, name] = np.nan
+                    blank = values == b""
+                if self.convert_text and (self.encoding is not None):
+                    encoding = self.encoding or self.default_encoding
+                    # cells after a zero-length column are left unset
+                    values = np.array([np.nan if x is None
+                                       else x.decode(encoding)
+                                       for x in values], dtype=np.object_)
+                if self.blank_missing and blank.any():
+                    values = values.copy()
+                    values[blank] = np.nan
+                data[name] = values
                 js += 1
             else:
                 self.close()
                 raise ValueError("unknown column type {type}".format(
                     type=self._column_types[j]))
 
-        return rslt
+        return pd.DataFrame(data, index=ix, columns=list(data))
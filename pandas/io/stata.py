@@ -32,6 +32,7 @@ from pandas.core.dtypes.common import (
     ensure_object, is_categorical_dtype, is_datetime64_dtype)
 
 from pandas import DatetimeIndex, compat, isna, to_datetime, to_timedelta
+from pandas.core.algorithms import factorize
 from pandas.core.arrays import Categorical
 from pandas.core.base import StringMixin
 from pandas.core.frame import DataFrame
@@ -702,16 +703,14 @@ class StataValueLabel(object):
         bio.write(struct.pack(byteorder + 'i', self.text_len))
 
         # off - int32 array (n elements)
-        for offset in self.off:
-            bio.write(struct.pack(byteorder + 'i', offset))
+        bio.write(self.off.astype(byteorder + 'i4').tobytes())
 
         # val - int32 array (n elements)
-        for value in self.val:
-            bio.write(struct.pack(byteorder + 'i', value))
+        bio.write(self.val.astype(byteorder + 'i4').tobytes())
 
         # txt - Text labels, null terminated
-        for text in self.txt:
-            bio.write(self._encode(text + null_string))
+        if self.txt:
+            bio.write(self._encode(null_string.join(self.txt) + null_string))
 
         bio.seek(0)
         return bio.read()
@@ -980,6 +979,7 @@ class StataReader(StataParser, BaseIterator):
         self._can_read_value_labels = False
         self._column_selector_set = False
         self._value_labels_read = False
+        self._strls_read = False
         self._data_read = False
         self._dtype = None
         self._lines_read = 0
@@ -1425,6 +1425,7 @@ class StataReader(StataParser, BaseIterator):
                 va = va[0:-1].decode(self._encoding)
             # Wrap v_o in a string to allow uint64 values as keys on 32bit OS
             self.GSO[str(v_o)] = va
+        self._strls_read = True
 
     # legacy
     @Appender(_data_method_doc)
@@ -1494,7 +1495,9 @@ class StataReader(StataParser, BaseIterator):
 
         if (self.format_version >= 117) and (not self._value_labels_read):
             self._can_read_value_labels = True
-            self._read_strls()
+            # The strL table is the same for every chunk, only read it once
+            if not self._strls_read:
+                self._read_strls()
 
         # Read data
         dtype = self._dtype
@@ -1511,68 +1514,47 @@ class StataReader(StataParser, BaseIterator):
         offset = self._lines_read * dtype.itemsize
         self.path_or_buf.seek(self.data_location + offset)
         read_lines = min(nrows, self.nobs - self._lines_read)
-        data = np.frombuffer(self.path_or_buf.read(read_len), dtype=dtype,
-                             count=read_lines)
+        raw_data = np.frombuffer(self.path_or_buf.read(read_len),
+                                 dtype=dtype, count=read_lines)
 
         self._lines_read += read_lines
         if self._lines_read == self.nobs:
             self._can_read_value_labels = True
             self._data_read = True
+
+        varlist = self.varlist
+        if columns is not None:
+            # Project the record array so that skipped fields are never
+            # byteswapped, decoded or converted
+            try:
+                raw_data, varlist = self._do_select_columns(raw_data,
+                                                            columns)
+            except ValueError:
+                self.close()
+                raise
+
         # if necessary, swap the byte order to native here
         if self.byteorder != self._native_byteorder:
-            data = data.byteswap().newbyteorder()
+            raw_data = raw_data.byteswap().newbyteorder()
 
         if convert_categoricals:
             self._read_value_labels()
 
-        if len(data) == 0:
-            data = DataFrame(columns=self.varlist)
-        else:
-            data = DataFrame.from_records(data)
-            data.columns = self.varlist
-
         # If index is not specified, use actual row number rather than
         # restarting at 0 for each chunk.
         if index_col is None:
             ix = np.arange(self._lines_read - read_lines, self._lines_read)
-            data = data.set_index(ix)
-
-        if columns is not None:
-            try:
-                data = self._do_select_columns(data, columns)
-            except ValueError:
-                self.close()
-                raise
-
-        # Decode strings
-        for col, typ in zip(data, self.typlist):
-            if type(typ) is int:
-                data[col] = data[col].apply(
-                    self._null_terminate, convert_dtype=True)
-
-        data = self._insert_strls(data)
-
-        cols_ = np.where(self.dtyplist)[0]
-
-        # Convert columns (if needed) to match input type
-        ix = data.index
-        requires_type_conversion = False
-        data_formatted = []
-        for i in cols_:
-            if self.dtyplist[i] is not None:
-                col = data.columns[i]
-                dtype = data[col].dtype
-                if dtype != np.dtype(object) and dtype != self.dtyplist[i]:
-                    requires_type_conversion = True
-                    data_formatted.append(
-                        (col, Series(data[col], ix, self.dtyplist[i])))
-                else:
-                    data_formatted.append((col, data[col]))
-        if requires_type_conversion:
-            data = DataFrame.from_dict(OrderedDict(data_formatted))
-        del data_formatted
+        else:
+            ix = None
 
-        self._do_convert_missing(data, convert_missing)
+        # Decode strings, insert strLs, restore the input types and replace
+        # missing values on the raw arrays, then build the frame once
+        data = OrderedDict()
+        for i, (col, field) in enumerate(zip(varlist, raw_data.dtype.names)):
+            values = self._convert_column(raw_data[field], self.typlist[i],
+                                          self.dtyplist[i], convert_missing)
+            data[col] = values
+        data = DataFrame(data, index=ix, columns=varlist)
 
         if convert_dates:
             cols = np.where(lmap(lambda x: any(x.startswith(fmt)
@@ -1614,58 +1596,65 @@ class StataReader(StataParser, BaseIterator):
 
         return data
 
-    def _do_convert_missing(self, data, convert_missing):
-        # Check for missing values, and replace if found
-
-        for i, colname in enumerate(data):
-            fmt = self.typlist[i]
-            if fmt not in self.VALID_RANGE:
-                continue
-
-            nmin, nmax = self.VALID_RANGE[fmt]
-            series = data[colname]
-            missing = np.logical_or(series < nmin, series > nmax)
-
-            if not missing.any():
-                continue
-
-            if convert_missing:  # Replacement follows Stata notation
-
-                missing_loc = np.argwhere(missing._ndarray_values)
-                umissing, umissing_loc = np.unique(series[missing],
-                                                   return_inverse=True)
-                replacement = Series(series, dtype=np.object)
-                for j, um in enumerate(umissing):
-                    missing_value = StataMissingValue(um)
-
-                    loc = missing_loc[umissing_loc == j]
-                    replacement.iloc[loc] = missing_value
-            else:  # All replacements are identical
-                dtype = series.dtype
-                if dtype not in (np.float32, np.float64):
-                    dtype = np.float64
-                replacement = Series(series, dtype=dtype)
-                replacement[missing] = np.nan
+    def _convert_column(self, values, typ, dtyp, convert_missing):
+        """
+        Convert a single field of the raw record array into the values of
+        the output column.
+        """
+        if type(typ) is int:
+            # have bytes not strings, so must decode
+            return np.array([self._null_terminate(s) for s in values],
+                            dtype=np.object_)
+        if typ == 'Q' and getattr(self, 'GSO', None):
+            # Wrap v_o in a string to allow uint64 values as keys on 32bit OS
+            gso = self.GSO
+            return np.array([gso[str(k)] for k in values], dtype=np.object_)
 
-            data[colname] = replacement
+        if dtyp is not None and values.dtype != dtyp:
+            values = values.astype(dtyp)
+        return self._do_convert_missing(values, typ, convert_missing)
 
-    def _insert_strls(self, data):
-        if not hasattr(self, 'GSO') or len(self.GSO) == 0:
-            return data
-        for i, typ in enumerate(self.typlist):
-            if typ != 'Q':
-                continue
-            # Wrap v_o in a string to allow uint64 values as keys on 32bit OS
-            data.iloc[:, i] = [self.GSO[str(k)] for k in data.iloc[:, i]]
-        return data
+    def _do_convert_missing(self, values, fmt, convert_missing):
+        # Check for missing values, and replace if found
+        if fmt not in self.VALID_RANGE:
+            return values
+
+        nmin, nmax = self.VALID_RANGE[fmt]
+        missing = (values < nmin) | (values > nmax)
+
+        if not missing.any():
+            return values
+
+        if convert_missing:  # Replacement follows Stata notation
+            # Create a single StataMissingValue per distinct missing code
+            umissing, umissing_loc = np.unique(values[missing],
+                                               return_inverse=True)
+            missing_values = np.empty(len(umissing), dtype=np.object_)
+            for j, um in enumerate(umissing):
+                missing_values[j] = StataMissingValue(um)
+            replacement = values.astype(np.object_)
+            replacement[missing] = missing_values[umissing_loc]
+        else:  # All replacements are identical
+            dtype = values.dtype
+            if dtype not in (np.float32, np.float64):
+                dtype = np.float64
+            replacement = values.astype(dtype)
+            replacement[missing] = np.nan
+
+        return replacement
 
     def _do_select_columns(self, data, columns):
+        """
+        Select columns from the raw record array.
 
+        Returns the projected record array and the names of the selected
+        columns.
+        """
         if not self._column_selector_set:
             column_set = set(columns)
             if len(column_set) != len(columns):
                 raise ValueError('columns contains duplicate entries')
-            unmatched = column_set.difference(data.columns)
+            unmatched = column_set.difference(self.varlist)
             if unmatched:
                 raise ValueError('The following columns were not found in the '
                                  'Stata data set: ' +
@@ -1675,20 +1664,24 @@ class StataReader(StataParser, BaseIterator):
             typlist = []
             fmtlist = []
             lbllist = []
+            fields = []
             for col in columns:
-                i = data.columns.get_loc(col)
+                i = self.varlist.index(col)
                 dtyplist.append(self.dtyplist[i])
                 typlist.append(self.typlist[i])
                 fmtlist.append(self.fmtlist[i])
                 lbllist.append(self.lbllist[i])
+                fields.append(data.dtype.names[i])
 
             self.dtyplist = dtyplist
             self.typlist = typlist
             self.fmtlist = fmtlist
             self.lbllist = lbllist
+            self._selected_fields = fields
+            self._selected_columns = list(columns)
             self._column_selector_set = True
 
-        return data[columns]
+        return data[self._selected_fields], self._selected_columns
 
     def _do_convert_categoricals(self, data, value_label_dict, lbllist,
                                  order_categoricals):
@@ -1701,12 +1694,10 @@ class StataReader(StataParser, BaseIterator):
             if label in value_labels:
                 # Explicit call with ordered=True
                 cat_data = Categorical(data[col], ordered=order_categoricals)
-                categories = []
-                for category in cat_data.categories:
-                    if category in value_label_dict[label]:
-                        categories.append(value_label_dict[label][category])
-                    else:
-                        categories.append(category)  # Partially labeled
+                labels = value_label_dict[label]
+                # Partially labeled categories keep their value
+                categories = [labels.get(category, category)
+                              for category in cat_data.categories]
                 try:
                     cat_data.categories = categories
                 except ValueError:
@@ -2572,19 +2563,33 @@ class StataStrLWriter(object):
         gso_df = self.df
         columns = list(gso_df.columns)
         selected = gso_df[self.columns]
-        col_index = [(col, columns.index(col)) for col in self.columns]
-        keys = np.empty(selected.shape, dtype=np.uint64)
-        for o, (idx, row) in enumerate(selected.iterrows()):
-            for j, (col, v) in enumerate(col_index):
-                val = row[col]
-                # Allow columns with mixed str and None (GH 23633)
-                val = '' if val is None else val
-                key = gso_table.get(val, None)
-                if key is None:
-                    # Stata prefers human numbers
-                    key = (v + 1, o + 1)
-                    gso_table[val] = key
-                keys[o, j] = self._convert_key(key)
+        col_index = np.array([columns.index(col) for col in self.columns],
+                             dtype=np.int64)
+        nrows, ncols = selected.shape
+
+        # Factorize the values in row-major order so that codes follow the
+        # order in which strings are first seen in the DataFrame
+        values = np.asarray(selected.values, dtype=np.object_).ravel()
+        codes, uniques = factorize(values)
+        # Allow columns with mixed str and None (GH 23633)
+        valid = codes >= 0
+        positions = np.arange(len(codes))[valid]
+        codes = codes[valid]
+
+        # Stata prefers human numbers
+        first = positions[np.unique(codes, return_index=True)[1]]
+        o = first // ncols + 1
+        v = col_index[first % ncols] + 1
+        unique_keys = (v + self._o_offet * o).astype(np.uint64)
+        is_empty = np.array([val == '' for val in uniques], dtype=bool)
+        unique_keys[is_empty] = 0
+        for val, vi, oi, empty in zip(uniques, v, o, is_empty):
+            if not empty:
+                gso_table[val] = (int(vi), int(oi))
+
+        keys = np.zeros(nrows * ncols, dtype=np.uint64)
+        keys[positions] = unique_keys[codes]
+        keys = keys.reshape(nrows, ncols)
         for i, col in enumerate(self.columns):
             gso_df[col] = keys[:, i]
 
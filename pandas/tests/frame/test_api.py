@@ -210,6 +210,25 @@ class SharedWithSparse(object):
             exp = float_string_frame.loc[k]
             self._assert_series_equal(v, exp)
 
+        df = self.klass({'a': [1, 2], 'b': [1.5, 2.5]}, index=['x', 'y'])
+        for k, v in df.iterrows():
+            exp = df.loc[k]
+            self._assert_series_equal(v, exp)
+
+    def test_iterrows_chunks(self, monkeypatch):
+        df = self.klass({'a': np.arange(9.), 'b': np.arange(9.) * 2},
+                        index=list('abcdefghi'))
+        expected = [(k, v.copy()) for k, v in df.iterrows()]
+
+        # rows are read three at a time
+        monkeypatch.setattr('pandas.core.frame._ITERROWS_CHUNK_SIZE', 6)
+        result = list(df.iterrows())
+        assert [k for k, _ in result] == list(df.index)
+        assert len(result) == len(expected)
+        for (k, v), (exp_k, exp_v) in zip(result, expected):
+            assert k == exp_k
+            self._assert_series_equal(v, exp_v)
+
     def test_iterrows_iso8601(self):
         # GH 19671
         if self.klass == SparseDataFrame:
@@ -262,6 +281,36 @@ class SharedWithSparse(object):
         assert not hasattr(tup3, '_fields')
         assert isinstance(tup3, tuple)
 
+    @pytest.mark.parametrize('chunksize', [1, 2, 10000])
+    def test_iterrecords(self, float_string_frame, chunksize):
+        df = float_string_frame
+        df['D'] = date_range('2000-01-01', periods=len(df))
+
+        rows = df.iterrecords(chunksize=chunksize)
+        assert len(rows) == len(df)
+        assert list(rows) == list(df.itertuples())
+
+        row = next(iter(rows))
+        assert type(row).__name__ == 'Row'
+        assert row._fields == ('Index', 'A', 'B', 'C', 'D', 'foo')
+        assert row.D == df['D'].iloc[0]
+        assert row.foo == 'bar'
+
+        chunks = list(df.iterrecords(index=False,
+                                     chunksize=chunksize).chunks())
+        assert len(chunks) == -(-len(df) // chunksize)
+        assert sum(chunks, []) == list(df.itertuples(index=False))
+
+    def test_iterrecords_options(self):
+        df = self.klass({'a': [1, 2], 'def': [3.5, 4.5]})
+
+        assert list(df.iterrecords(name=None)) == [(0, 1, 3.5), (1, 2, 4.5)]
+        assert next(iter(df.iterrecords()))._fields == ('Index', 'a', '_2')
+
+        msg = "chunksize must be a positive integer"
+        with pytest.raises(ValueError, match=msg):
+            df.iterrecords(chunksize=0)
+
     def test_sequence_like_with_categorical(self):
 
         # GH 7839
@@ -62,7 +62,9 @@ class TestDataFrameBlockInternals():
         tm.assert_frame_equal(recons, consolidated)
 
         float_frame['F'] = 8.
-        assert len(float_frame._data.blocks) == 3
+        float_frame['G'] = 9.
+        # 'E', 'F' and 'G' are inserted into the same block
+        assert len(float_frame._data.blocks) == 2
 
         float_frame._consolidate(inplace=True)
         assert len(float_frame._data.blocks) == 1
@@ -585,3 +587,59 @@ starting,ending,measure
         expected = pd.DataFrame({"A": [1, 2, 3]})
         tm.assert_frame_equal(result, expected)
         assert isinstance(result._data.blocks[0], IntBlock)
+
+    @pytest.mark.parametrize('copy', [True, False])
+    def test_to_layout(self, float_frame, copy):
+        assert not float_frame.values.flags.c_contiguous
+
+        result = float_frame.to_layout('row', copy=copy)
+        tm.assert_frame_equal(result, float_frame)
+        assert result.values.flags.c_contiguous
+        assert np.shares_memory(result.values, result._data.blocks[0].values)
+
+        back = result.to_layout('column', copy=copy)
+        tm.assert_frame_equal(back, float_frame)
+        assert back.values.flags.f_contiguous
+        assert not np.shares_memory(back.values, result.values)
+
+        same = result.to_layout('row', copy=copy)
+        assert np.shares_memory(same.values, result.values) is not copy
+
+    def test_to_layout_invalid(self, float_frame):
+        with pytest.raises(ValueError, match="layout must be"):
+            float_frame.to_layout('diagonal')
+
+    def test_row_layout_kept(self, float_frame, float_string_frame):
+        df = float_frame.to_layout('row')
+
+        assert df.copy().values.flags.c_contiguous
+
+        # consolidating blocks of the same dtype keeps the layout
+        df = df.copy()
+        df['E'] = df['A'].values * 2
+        df['F'] = df['B'].values * 2
+        assert len(df._data.blocks) > 1
+        result = df.values
+        assert result.flags.c_contiguous
+        tm.assert_numpy_array_equal(result[:, :4], float_frame.values)
+        tm.assert_numpy_array_equal(result[:, 5], float_frame['B'].values * 2)
+
+        # interleaving mixed dtypes
+        mixed = float_string_frame.to_layout('row')
+        assert mixed.values.flags.c_contiguous
+        tm.assert_numpy_array_equal(mixed.values, float_string_frame.values)
+
+    def test_column_layout_by_default(self):
+        # a frame viewing a C-contiguous array is only row ordered by
+        # accident, copies and inserts use the default column layout
+        df = DataFrame(np.random.randn(5, 3), columns=['a', 'b', 'c'])
+        assert df.values.flags.c_contiguous
+        assert df._data.layout == 'column'
+
+        result = df.copy()
+        assert result._data.blocks[0].values.flags.c_contiguous
+        tm.assert_frame_equal(result, df)
+
+        for i in range(5):
+            result['x{}'.format(i)] = np.zeros(5)
+        assert len(result._data.blocks) == 2
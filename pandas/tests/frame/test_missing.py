@@ -553,6 +553,13 @@ class TestDataFrameMissingData(TestData):
         with pytest.raises(NotImplementedError, match='column by column'):
             df.fillna(df.max(1), axis=1)
 
+    def test_fillna_dict_inplace_view(self):
+        df = DataFrame({'a': [np.nan, 1.0], 'b': [np.nan, 2.0]})
+        view = df['a']
+        df.fillna({'a': 0.0}, inplace=True)
+        assert view.tolist() == [0.0, 1.0]
+        assert df['a'].tolist() == [0.0, 1.0]
+
     def test_fillna_dataframe(self):
         # GH 8377
         df = DataFrame({'a': [np.nan, 1, 2, np.nan, np.nan],
@@ -18,6 +18,36 @@ from pandas.core.indexes.base import InvalidIndexError
 from pandas.core.indexes.datetimelike import DatetimeIndexOpsMixin
 import pandas.util.testing as tm
 
+_ENGINE_FLAGS = ['is_unique', 'is_monotonic_increasing',
+                 'is_monotonic_decreasing']
+
+
+def warm_engine(index):
+    """
+    Build the hash table of ``index`` and compute the flags that indexes
+    derived from it can take over, return the flags.
+    """
+    index.get_loc(index[0])
+    return [getattr(index, flag) for flag in _ENGINE_FLAGS]
+
+
+def assert_engine_state_equal(result, expected=None, keys=()):
+    """
+    Check the flags of ``result``, whose engine may have taken over the
+    state of another one, and its lookups of ``keys`` against ``expected``,
+    by default an index of the same values computing its own.
+    """
+    if expected is None:
+        expected = result[np.arange(len(result))]
+        expected._reset_cache()
+    for flag in _ENGINE_FLAGS:
+        assert getattr(result, flag) == getattr(expected, flag), flag
+
+    positions = np.arange(len(result))
+    for key in keys:
+        tm.assert_almost_equal(positions[result.get_loc(key)],
+                               positions[expected.get_loc(key)])
+
 
 class Base(object):
     """ base class for index sub-class tests """
@@ -563,6 +593,30 @@ class Base(object):
             # test 0th element
             assert idx[0:4].equals(result.insert(0, idx[0]))
 
+    @pytest.mark.parametrize('derive', [
+        lambda idx: idx.append(idx[:2]),
+        lambda idx: idx.insert(len(idx), idx[-1]),
+        lambda idx: idx[1:4],
+        lambda idx: idx[::-2],
+        lambda idx: idx[3:1:-1],
+        lambda idx: idx.take([0, 2, 3]),
+        lambda idx: idx.take([4, 1]),
+        lambda idx: idx.take([1, 1]),
+        lambda idx: idx.copy(),
+        lambda idx: idx.copy(deep=True),
+        lambda idx: idx.rename('foo')])
+    def test_derived_engine_state(self, derive):
+
+        for name, idx in compat.iteritems(self.indices):
+            if len(idx) < 5:
+                continue
+
+            idx = idx[:6]
+            warm_engine(idx)
+            result = derive(idx)
+            # look up the appended values
+            assert_engine_state_equal(result, keys=result[len(idx):])
+
     def test_delete_base(self):
 
         for name, idx in compat.iteritems(self.indices):
@@ -54,6 +54,36 @@ class TestDatetimeIndex(object):
             right.iloc[i] *= -10
             tm.assert_series_equal(left, right)
 
+    def test_get_indexer_large_monotonic(self, monkeypatch):
+        from pandas._libs import index as libindex
+
+        monkeypatch.setattr(libindex, '_SIZE_CUTOFF', 100)
+        idx = pd.date_range('2014-11-26', periods=1000, freq='S')
+        target = idx[::-7].append(pd.DatetimeIndex(['2000-01-01', pd.NaT]))
+
+        result = idx.get_indexer(target)
+        expected = np.append(np.arange(999, -1, -7), [-1, -1])
+        tm.assert_numpy_array_equal(result, expected.astype(np.intp))
+        assert not idx._engine.is_mapping_populated
+
+    @pytest.mark.parametrize('check_monotonic', [True, False])
+    def test_is_unique_large_nat_first(self, monkeypatch, check_monotonic):
+        from pandas._libs import index as libindex
+
+        monkeypatch.setattr(libindex, '_SIZE_CUTOFF', 100)
+        values = pd.date_range('2014-11-26', periods=1000, freq='S')
+        idx = pd.DatetimeIndex([pd.NaT]).append(values).append(values[:1])
+        if check_monotonic:
+            assert not idx.is_monotonic_increasing
+        assert not idx.is_unique
+
+        result = idx.get_loc(values[0])
+        expected = np.zeros(len(idx), dtype=bool)
+        expected[[1, len(idx) - 1]] = True
+        tm.assert_numpy_array_equal(result, expected)
+        with pytest.raises(Exception, match='uniquely valued'):
+            idx.get_indexer(values)
+
     def test_time_overflow_for_32bit_machines(self):
         # GH8943.  On some machines NumPy defaults to np.int32 (for example,
         # 32-bit Linux machines).  In the function _generate_regular_range
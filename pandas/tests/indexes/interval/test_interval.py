@@ -1162,6 +1162,51 @@ class TestIntervalIndex(Base):
         result = index.is_overlapping
         assert result is expected
 
+    @pytest.mark.parametrize('start, shift, na_value', [
+        (0, 1, np.nan),
+        (Timestamp('2018-01-01'), Timedelta('1 day'), pd.NaT),
+        (Timedelta('0 days'), Timedelta('1 day'), pd.NaT)])
+    def test_overlaps_indexer(self, start, shift, na_value, closed,
+                              other_closed):
+        np.random.seed(1234)
+        lefts = np.random.randint(0, 10, 20)
+        widths = np.random.randint(1, 4, 20)
+        tuples = [(start + l * shift, start + (l + w) * shift)
+                  for l, w in zip(lefts, widths)]
+        index = IntervalIndex.from_tuples(
+            tuples[:12] + [(na_value, na_value)], closed=closed)
+        other = IntervalIndex.from_tuples(
+            [(na_value, na_value)] + tuples[12:], closed=other_closed)
+
+        indexer, other_indexer = index.overlaps_indexer(other)
+        expected = [(i, j) for i, iv in enumerate(index)
+                    for j, other_iv in enumerate(other)
+                    if notna(iv) and notna(other_iv) and
+                    iv.overlaps(other_iv)]
+        assert lzip(indexer, other_indexer) == expected
+
+        # an IntervalArray works the same
+        result = index.overlaps_indexer(other.values)
+        tm.assert_numpy_array_equal(result[0], indexer)
+        tm.assert_numpy_array_equal(result[1], other_indexer)
+
+    def test_overlaps_indexer_empty(self, closed):
+        index = IntervalIndex.from_breaks([0, 1, 2], closed=closed)
+        for other in [index[:0], IntervalIndex.from_breaks([3, 4])]:
+            indexer, other_indexer = index.overlaps_indexer(other)
+            tm.assert_numpy_array_equal(indexer, np.array([], dtype=np.intp))
+            tm.assert_numpy_array_equal(other_indexer,
+                                        np.array([], dtype=np.intp))
+
+    def test_overlaps_indexer_invalid(self):
+        index = IntervalIndex.from_breaks([0, 1, 2])
+        with pytest.raises(TypeError, match='must be an IntervalIndex'):
+            index.overlaps_indexer(Interval(0, 1))
+
+        other = interval_range(Timestamp('2018-01-01'), periods=2)
+        with pytest.raises(TypeError, match='compatible dtypes'):
+            index.overlaps_indexer(other)
+
     @pytest.mark.parametrize('tuples', [
         lzip(range(10), range(1, 11)),
         lzip(date_range('20170101', periods=10),
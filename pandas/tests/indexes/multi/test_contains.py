@@ -3,8 +3,6 @@
 import numpy as np
 import pytest
 
-from pandas.compat import PYPY
-
 import pandas as pd
 from pandas import MultiIndex
 import pandas.util.testing as tm
@@ -33,15 +31,6 @@ def test_contains(idx):
     assert None not in idx
 
 
-@pytest.mark.skipif(not PYPY, reason="tuples cmp recursively on PyPy")
-def test_isin_nan_pypy():
-    idx = MultiIndex.from_arrays([['foo', 'bar'], [1.0, np.nan]])
-    tm.assert_numpy_array_equal(idx.isin([('bar', np.nan)]),
-                                np.array([False, True]))
-    tm.assert_numpy_array_equal(idx.isin([('bar', float('nan'))]),
-                                np.array([False, True]))
-
-
 def test_isin():
     values = [('foo', 2), ('bar', 3), ('quux', 4)]
 
@@ -60,13 +49,13 @@ def test_isin():
     assert result.dtype == np.bool_
 
 
-@pytest.mark.skipif(PYPY, reason="tuples cmp recursively on PyPy")
-def test_isin_nan_not_pypy():
+def test_isin_nan():
+    # missing labels match, as in the other set operations
     idx = MultiIndex.from_arrays([['foo', 'bar'], [1.0, np.nan]])
     tm.assert_numpy_array_equal(idx.isin([('bar', np.nan)]),
-                                np.array([False, False]))
+                                np.array([False, True]))
     tm.assert_numpy_array_equal(idx.isin([('bar', float('nan'))]),
-                                np.array([False, False]))
+                                np.array([False, True]))
 
 
 def test_isin_level_kwarg():
@@ -12,6 +12,7 @@ import pandas as pd
 from pandas import (
     Categorical, CategoricalIndex, Index, IntervalIndex, MultiIndex,
     date_range)
+import pandas.core.common as com
 from pandas.core.indexes.base import InvalidIndexError
 import pandas.util.testing as tm
 from pandas.util.testing import assert_almost_equal
@@ -391,3 +392,51 @@ def test_get_indexer_categorical_time():
          Categorical(date_range("2012-01-01", periods=3, freq='H'))])
     result = midx.get_indexer(midx)
     tm.assert_numpy_array_equal(result, np.arange(9, dtype=np.intp))
+
+
+@pytest.mark.parametrize('seq', [
+    ['b'],
+    [['a', 'c'], 2],
+    [slice(None), [1, 3], 'x'],
+    [['c', 'b'], slice(None), ['y']],
+    [slice('b', 'c'), 2],
+    [[], 1]])
+@pytest.mark.parametrize('shuffle', [False, True])
+def test_get_locs(seq, shuffle):
+    # lists, labels and slices are resolved through the combined codes of
+    # the levels; compare with a label by label search
+    idx = MultiIndex.from_product([list('abc'), [1, 2, 3], ['x', 'y']])
+    if shuffle:
+        if any(isinstance(k, slice) and not com.is_null_slice(k)
+               for k in seq):
+            pytest.skip('slicing requires a lexsorted index')
+        idx = idx[np.random.RandomState(0).permutation(len(idx))]
+
+    def matches(label):
+        for value, k in zip(label, seq):
+            if isinstance(k, slice):
+                if not com.is_null_slice(k) and not k.start <= value <= k.stop:
+                    return False
+            elif isinstance(k, list):
+                if value not in k:
+                    return False
+            elif value != k:
+                return False
+        return True
+
+    expected = np.array([i for i, label in enumerate(idx) if matches(label)],
+                        dtype='int64')
+    tm.assert_numpy_array_equal(idx.get_locs(seq), expected)
+
+
+def test_get_locs_unused_label():
+    idx = MultiIndex(levels=[['a', 'b', 'c'], [1, 2, 3]],
+                     codes=[[0, 0, 1], [0, 1, 0]])
+    tm.assert_numpy_array_equal(idx.get_locs(['b', 2]),
+                                np.array([], dtype='int64'))
+    with pytest.raises(KeyError, match='c'):
+        idx.get_locs(['c', 1])
+    with pytest.raises(KeyError, match='3'):
+        idx.get_locs([slice(None), 3])
+    tm.assert_numpy_array_equal(idx.get_locs([['c'], 3]),
+                                np.array([], dtype='int64'))
@@ -370,3 +370,88 @@ def test_setops_disallow_true(method):
 
     with pytest.raises(ValueError, match="The 'sort' keyword only takes"):
         getattr(idx1, method)(idx2, sort=True)
+
+
+@pytest.mark.parametrize("sort", [None, False])
+@pytest.mark.parametrize("method", ['union', 'intersection', 'difference',
+                                    'symmetric_difference'])
+def test_setops_codes(method, sort):
+    # the set operations work on the codes, not on the tuples
+    idx1 = pd.MultiIndex.from_arrays([['b', 'a', 'c', 'a', np.nan, 'b'],
+                                      [2., 1., 1., 1., 3., np.nan]])
+    idx2 = pd.MultiIndex.from_arrays([['d', 'a', 'b', np.nan],
+                                      [1., 1., 3., 3.]],
+                                     names=['first', 'second'])
+    result = getattr(idx1, method)(idx2, sort=sort)
+    assert idx1._tuples is None
+    assert idx2._tuples is None
+
+    set1, set2 = set(map(str, idx1)), set(map(str, idx2))
+    expected = {'union': set1 | set2, 'intersection': set1 & set2,
+                'difference': set1 - set2,
+                'symmetric_difference': set1 ^ set2}[method]
+    assert sorted(map(str, result)) == sorted(expected)
+    assert result.is_unique
+    assert result.names == [None, None]
+    if sort is None:
+        assert result.dropna().is_monotonic_increasing
+
+
+def test_isin_unique_argsort_codes():
+    idx = pd.MultiIndex.from_product([['b', 'a'], [2, 1]])
+    idx = idx.append(idx)
+
+    tm.assert_numpy_array_equal(idx.isin([('a', 1), ('c', 1)]),
+                                np.array([False, False, False, True] * 2))
+    tm.assert_index_equal(idx.unique(), idx[:4])
+    tm.assert_numpy_array_equal(idx.argsort(),
+                                np.array([3, 7, 2, 6, 1, 5, 0, 4]))
+    assert idx.shape == (8, )
+    assert idx.size == 8
+    assert idx._tuples is None
+
+
+def test_isin_missing_values():
+    idx = pd.MultiIndex.from_tuples([('a', 'x'), (np.nan, 'x')])
+    tm.assert_numpy_array_equal(idx.isin([(np.nan, 'x')]),
+                                np.array([False, True]))
+    tm.assert_numpy_array_equal(idx.isin([(None, 'x')]),
+                                np.array([False, True]))
+    tm.assert_numpy_array_equal(idx.isin([('a', 'x'), ('b', np.nan)]),
+                                np.array([True, False]))
+
+
+@pytest.mark.parametrize('method', ['intersection', 'difference'])
+def test_setops_sort_unused_labels(method):
+    # the labels only found in other are not compared
+    idx1 = pd.MultiIndex.from_arrays([[2, 1, 3], ['b', 'a', 'c']])
+    idx2 = pd.MultiIndex.from_arrays([['x', 2], ['y', 'b']])
+    result = getattr(idx1, method)(idx2, sort=None)
+    expected = {'intersection': [(2, 'b')],
+                'difference': [(1, 'a'), (3, 'c')]}[method]
+    assert list(result) == expected
+
+    idx = pd.MultiIndex(levels=[[2, 'x', 1]], codes=[[0, 2, 0]])
+    tm.assert_numpy_array_equal(idx.argsort(), np.array([1, 0, 2]))
+
+
+@pytest.mark.parametrize("sort", [None, False])
+def test_setops_result_levels(sort):
+    # the result is built from the codes, its levels are the sorted labels
+    # in use, as from_arrays would give
+    idx1 = pd.MultiIndex.from_arrays([[3, 1, 2], ['b', 'a', 'c']])
+    idx2 = pd.MultiIndex.from_arrays([['x', 1, 2], ['d', 'a', 'b']])
+
+    result = idx1.intersection(idx2, sort=sort)
+    expected = pd.MultiIndex.from_tuples([(1, 'a')])
+    tm.assert_index_equal(result, expected)
+    tm.assert_index_equal(result.levels[0], pd.Index([1]))
+    tm.assert_index_equal(result.levels[1], pd.Index(['a']))
+
+    result = idx1.union(idx2, sort=sort)
+    expected = pd.MultiIndex.from_arrays([result.get_level_values(0),
+                                          result.get_level_values(1)])
+    for level, expected_level in zip(result.levels, expected.levels):
+        tm.assert_index_equal(level, expected_level)
+    for level_codes, expected_codes in zip(result.codes, expected.codes):
+        tm.assert_numpy_array_equal(level_codes, expected_codes)
@@ -26,7 +26,8 @@ import pandas.core.config as cf
 from pandas.core.index import _get_combined_index, ensure_index_from_sequences
 from pandas.core.indexes.api import Index, MultiIndex
 from pandas.core.sorting import safe_sort
-from pandas.tests.indexes.common import Base
+from pandas.tests.indexes.common import (
+    Base, assert_engine_state_equal, warm_engine)
 import pandas.util.testing as tm
 from pandas.util.testing import assert_almost_equal
 
@@ -2518,6 +2519,51 @@ class TestMixedIntIndex(Base):
         expected = Index([], dtype=object)
         tm.assert_index_equal(result, expected)
 
+    def test_dump_engine_object(self):
+        index = Index(['a', 'b'])
+        with tm.ensure_clean() as path:
+            with pytest.raises(TypeError, match='can not be serialized'):
+                index.dump_engine(path)
+
+        # pickling ignores hash tables that can not be saved
+        index.get_loc('a')
+        with pd.option_context('io.pickle.index_engine', True):
+            result = tm.round_trip_pickle(index)
+        tm.assert_index_equal(result, index)
+        assert not result._engine.is_mapping_populated
+
+    @pytest.mark.parametrize('index', [
+        Index(['a', 'b', 'c']), Index([1, 2, 3]), Index([3, 2, 1]),
+        Index([1, 1, 2])])
+    def test_append_engine(self, index):
+        warm_engine(index)
+
+        for result in [index.append(Index(index[-2:])),
+                       index.insert(len(index), 4),
+                       index.insert(len(index), 0)]:
+            assert result._engine.is_mapping_populated
+            assert_engine_state_equal(result, Index(list(result)))
+            tm.assert_numpy_array_equal(
+                result.get_indexer_for(result),
+                Index(list(result)).get_indexer_for(result))
+
+        # the hash table of the index is left alone
+        assert 4 not in index
+
+    @pytest.mark.parametrize('index', [
+        Index(['a', 'b', 'c']), Index([1, 2, 3]), Index([3, 2, 1]),
+        Index([1, 1, 2]), pd.date_range('2000', periods=3)])
+    def test_copy_shares_engine(self, index):
+        warm_engine(index)
+
+        for result in [index.copy(), index.copy(deep=True),
+                       index.rename('foo'), index._shallow_copy()]:
+            assert result._engine.mapping is index._engine.mapping
+            assert_engine_state_equal(result, index)
+
+        # subsets get the flags only
+        assert not index[:2]._engine.is_mapping_populated
+
 
 class TestIndexUtils(object):
 
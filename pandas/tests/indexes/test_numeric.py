@@ -5,6 +5,7 @@ from datetime import datetime
 import numpy as np
 import pytest
 
+from pandas._libs import index as libindex
 from pandas._libs.tslibs import Timestamp
 from pandas.compat import range
 
@@ -92,6 +93,52 @@ class Numeric(Base):
             result = self.create_index().insert(1, na)
             tm.assert_index_equal(result, expected)
 
+    @pytest.mark.parametrize('mmap', [True, False])
+    def test_dump_load_engine(self, mmap):
+        idx = self.create_index()
+        expected = idx.get_indexer(idx[::-1])
+
+        with tm.ensure_clean() as path:
+            idx.dump_engine(path)
+            result = Index(idx.values.copy())
+            result.load_engine(path, mmap=mmap)
+
+            assert result._engine.is_mapping_populated
+            assert result.is_unique
+            tm.assert_numpy_array_equal(result.get_indexer(idx[::-1]),
+                                        expected)
+            assert result.get_loc(idx[2]) == 2
+            with pytest.raises(KeyError):
+                result.get_loc(idx.max() + 1)
+
+            with pytest.raises(ValueError, match='state is for'):
+                Index(idx.values[:-1]).load_engine(path)
+            with pytest.raises(ValueError, match='for different values'):
+                Index(idx.values[::-1]).load_engine(path)
+
+        # the hash table of the dumped index is not frozen
+        idx._engine.mapping.map_locations(idx.values)
+
+    def test_load_engine_invalid(self):
+        with tm.ensure_clean() as path:
+            with open(path, 'wb') as f:
+                f.write(b'not an engine')
+            with pytest.raises(ValueError, match='not a file written'):
+                self.create_index().load_engine(path)
+
+    def test_pickle_engine(self):
+        idx = self.create_index()
+        idx.get_loc(idx[1])
+
+        with pd.option_context('io.pickle.index_engine', True):
+            result = tm.round_trip_pickle(idx)
+        tm.assert_index_equal(result, idx)
+        assert result._engine.is_mapping_populated
+        assert result.get_loc(idx[1]) == 1
+
+        result = tm.round_trip_pickle(idx)
+        assert not result._engine.is_mapping_populated
+
 
 class TestFloat64Index(Numeric):
     _holder = Float64Index
@@ -650,6 +697,25 @@ class TestInt64Index(NumericInt):
         expected = np.array([0, 1, 1, 2, 2, 3, 3, 4, 4, 5], dtype=np.intp)
         tm.assert_numpy_array_equal(indexer, expected)
 
+    @pytest.mark.parametrize('target', [
+        np.arange(-5, 3005, 3),
+        np.arange(3005, -5, -3),
+        np.random.RandomState(0).permutation(np.arange(-5, 3005, 3))])
+    def test_get_indexer_large_monotonic(self, monkeypatch, target):
+        # large increasing indexes are searched without a hash table
+        monkeypatch.setattr(libindex, '_SIZE_CUTOFF', 100)
+        index = Int64Index(np.arange(1000) * 2)
+
+        result = index.get_indexer(target)
+        expected = np.where((target % 2 == 0) & (target >= 0) &
+                            (target < 2000), target // 2, -1)
+        tm.assert_numpy_array_equal(result, expected.astype(np.intp))
+        assert not index._engine.is_mapping_populated
+
+        result = pd.Series(np.arange(1000), index=index).reindex(target)
+        tm.assert_numpy_array_equal(result.isna().values, expected == -1)
+        assert not index._engine.is_mapping_populated
+
     def test_intersection(self):
         other = Index([1, 2, 3, 4, 5])
         result = self.index.intersection(other)
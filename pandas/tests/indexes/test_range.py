@@ -233,6 +233,18 @@ class TestRangeIndex(Numeric):
             # either depending on numpy version
             result = idx.delete(len(idx))
 
+    @pytest.mark.parametrize('loc, expected', [
+        (0, RangeIndex(1, 5, name='Foo')),
+        (-5, RangeIndex(1, 5, name='Foo')),
+        (4, RangeIndex(0, 4, name='Foo')),
+        ([0, 1], RangeIndex(2, 5, name='Foo')),
+        ([1, 3], RangeIndex(0, 5, 2, name='Foo')),
+        (2, Int64Index([0, 1, 3, 4], name='Foo'))])
+    def test_delete_keeps_range(self, loc, expected):
+        idx = RangeIndex(5, name='Foo')
+        result = idx.delete(loc)
+        tm.assert_index_equal(result, expected, exact=True)
+
     def test_view(self):
         i = RangeIndex(0, name='Foo')
         i_view = i.view()
@@ -679,6 +691,42 @@ class TestRangeIndex(Numeric):
         with pytest.raises(IndexError):
             idx.take(np.array([1, -5]))
 
+    @pytest.mark.parametrize('indices, expected', [
+        ([], RangeIndex(1, 1, 3)),
+        ([2], RangeIndex(7, 10, 3)),
+        ([1, 2, 3], RangeIndex(4, 13, 3)),
+        ([0, 2, 4], RangeIndex(1, 19, 6)),
+        ([4, 2, 0], RangeIndex(13, -5, -6)),
+        ([3, 2, 1, 0], RangeIndex(10, -2, -3)),
+        ([0, 1, 3], Int64Index([1, 4, 10])),
+        ([1, 1], Int64Index([4, 4])),
+        ([-2, -1], Int64Index([10, 13]))])
+    def test_take_keeps_range(self, indices, expected):
+        idx = RangeIndex(1, 16, 3, name='foo')
+        expected = expected.rename('foo')
+
+        result = idx.take(indices)
+        tm.assert_index_equal(result, expected, exact=True)
+
+        result = idx[np.array(indices, dtype=np.intp)]
+        tm.assert_index_equal(result, expected, exact=True)
+
+    def test_getitem_mask_keeps_range(self):
+        idx = RangeIndex(1, 16, 3, name='foo')
+
+        mask = np.array([False, True, True, True, False])
+        result = idx[mask]
+        tm.assert_index_equal(result, RangeIndex(4, 13, 3, name='foo'),
+                              exact=True)
+
+        result = idx[~mask]
+        tm.assert_index_equal(result, Int64Index([1, 13], name='foo'),
+                              exact=True)
+
+        result = idx[np.zeros(5, dtype=bool)]
+        assert isinstance(result, RangeIndex)
+        assert len(result) == 0
+
     def test_print_unicode_columns(self):
         df = pd.DataFrame({u("\u05d0"): [1, 2, 3],
                            "\u05d1": [4, 5, 6],
@@ -871,6 +919,7 @@ class TestRangeIndex(Numeric):
                  ([RI(2,), RI(2, 5), RI(5, 8, 4)], RI(0, 6)),
                  ([RI(2,), RI(3, 5), RI(5, 8, 4)], I64([0, 1, 3, 4, 5])),
                  ([RI(-2, 2), RI(2, 5), RI(5, 8, 4)], RI(-2, 6)),
+                 ([RI(1, 1), RI(0, -1, -1)], RI(0, 1)),
                  ([RI(3,), I64([-1, 3, 15])], I64([0, 1, 2, -1, 3, 15])),
                  ([RI(3,), F64([-1, 3.1, 15.])], F64([0, 1, 2, -1, 3.1, 15.])),
                  ([RI(3,), OI(['a', None, 14])], OI([0, 1, 2, 'a', None, 14])),
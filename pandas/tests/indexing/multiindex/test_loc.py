@@ -378,3 +378,21 @@ def test_loc_getitem_lowerdim_corner(multiindex_dataframe_random_data):
     expected = 0
     result = df.sort_index().loc[('bar', 'three'), 'B']
     assert result == expected
+
+
+@pytest.mark.parametrize('shuffle', [False, True])
+def test_loc_getitem_partial_tuples(shuffle):
+    index = MultiIndex.from_product([list('abc'), [1, 2, 3], ['x', 'y']])
+    if shuffle:
+        index = index[np.random.RandomState(0).permutation(len(index))]
+    df = DataFrame({'A': np.arange(len(index))}, index=index)
+
+    keys = [('b', 2), ('a',), ('c', 3, 'x')]
+    result = df.loc[keys]
+    expected = pd.concat([df.loc[[label for label in index
+                                  if label[:len(key)] == key]]
+                          for key in keys])
+    tm.assert_frame_equal(result, expected)
+
+    with pytest.raises(KeyError, match='not in index'):
+        df.loc[[('b', 2), ('a', 4)]]
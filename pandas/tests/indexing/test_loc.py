@@ -778,3 +778,36 @@ Region_1,Site_2,3977723089,A,5/20/2015 8:33,5/20/2015 9:09,Yes,No"""
         msg = "cannot copy sequence with size 2 to array axis with dimension 0"
         with pytest.raises(ValueError, match=msg):
             df.loc[0:2, 'x'] = data
+
+    def test_loc_getitem_scalar_axes_change(self):
+        df = DataFrame({'a': [1, 2, 3], 'b': [4., 5., 6.]},
+                       index=['x', 'y', 'z'])
+        assert df.loc['y', 'b'] == 5.
+        assert df.loc['z', 'a'] == 3
+
+        # the axes checked for scalar access follow the ones of the frame
+        df.index = ['x', 'y', 'y']
+        tm.assert_series_equal(df.loc['y', 'b'],
+                               Series([5., 6.], index=['y', 'y'], name='b'))
+        df.index = ['x', 'y', 'z']
+        assert df.loc['y', 'b'] == 5.
+
+        df.columns = ['a', 'a']
+        tm.assert_frame_equal(df.loc[['y'], 'a'], df.iloc[[1]])
+        assert df.loc['y', :].tolist() == [2, 5.]
+
+        df['c'] = 7
+        assert df.loc['x', 'c'] == 7
+
+        with pytest.raises(KeyError, match='w'):
+            df.loc['w', 'c']
+        with pytest.raises(KeyError, match='d'):
+            df.loc['x', 'd']
+
+    def test_loc_getitem_scalar_fallback(self):
+        df = DataFrame({'a': [1, 2, 3]},
+                       index=date_range('2019-01-01', periods=3))
+        assert df.loc[Timestamp('2019-01-02'), 'a'] == 2
+        assert df.loc['2019-01-02', 'a'] == 2
+        tm.assert_series_equal(df.loc['2019-01', 'a'], df['a'])
+        assert df.loc[lambda x: x.index[1], 'a'] == 2
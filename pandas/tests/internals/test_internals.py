@@ -7,6 +7,7 @@ import itertools
 import operator
 import re
 import sys
+import weakref
 
 import numpy as np
 import pytest
@@ -676,6 +677,83 @@ class TestBlockManager(object):
         tm.assert_numpy_array_equal(cons.blocks[0].mgr_locs.as_array,
                                     np.arange(len(cons.items), dtype=np.int64))
 
+    def test_insert_appends_to_buffer(self):
+        df = DataFrame(index=range(5))
+        expected = {}
+        for i in range(50):
+            if i % 3:
+                values = np.arange(5, dtype='float64') + i
+            else:
+                values = np.arange(5, dtype='int64') * i
+            df['c{}'.format(i)] = values
+            expected['c{}'.format(i)] = values
+
+        # inserts of the same dtype share a block
+        assert df._data.nblocks == 2
+        expected = DataFrame(expected, columns=df.columns)
+        assert_frame_equal(df, expected)
+
+        # an item inserted in the middle gets a block of its own
+        df.insert(3, 'x', np.ones(5))
+        df['c1'] = np.zeros(5)
+        df['y'] = np.ones(5)
+        expected.insert(3, 'x', np.ones(5))
+        expected['c1'] = np.zeros(5)
+        expected['y'] = np.ones(5)
+        assert df._data.nblocks == 3
+        assert_frame_equal(df, expected)
+
+    def test_insert_does_not_modify_copy(self):
+        df = DataFrame(index=range(3))
+        df['a'] = [1.0, 2.0, 3.0]
+        df['b'] = [4.0, 5.0, 6.0]
+        result = df.copy(deep=False)
+
+        df['c'] = [7.0, 8.0, 9.0]
+        df['d'] = [0.0, 0.0, 0.0]
+        assert list(result.columns) == ['a', 'b']
+        assert_frame_equal(result, DataFrame({'a': [1.0, 2.0, 3.0],
+                                              'b': [4.0, 5.0, 6.0]}))
+
+        result['c'] = [-1.0, -1.0, -1.0]
+        assert_series_equal(df['c'], Series([7.0, 8.0, 9.0], name='c'))
+
+    def test_fast_xs_dtype_cache(self):
+        mgr = create_mgr('a: f8; b: i8')
+        tm.assert_numpy_array_equal(mgr.fast_xs(0), np.array([0.0, 1.0]))
+
+        # replaced blocks are neither kept alive nor used for the dtype
+        old = weakref.ref(mgr.blocks[0])
+        mgr.blocks = (mgr.blocks[0].astype(object), mgr.blocks[1])
+        assert old() is None
+        assert mgr.fast_xs(0).dtype == np.object_
+
+    def test_insert_regrow_keeps_columns_in_sync(self):
+        df = DataFrame(index=range(3))
+        df.insert(0, 'a', [1.0, 2.0, 3.0])
+        df.insert(1, 'b', [4.0, 5.0, 6.0])
+        s = df['b']
+        # enough inserts to reallocate the buffer holding 'b' several times
+        for i in range(10):
+            df.insert(len(df.columns), 'c{}'.format(i), [0.0, 0.0, 0.0])
+
+        s[0] = -1.0
+        df.at[1, 'b'] = -2.0
+        expected = Series([-1.0, -2.0, 6.0], name='b')
+        assert_series_equal(df['b'], expected)
+        tm.assert_numpy_array_equal(df.values[:, 1], expected.values)
+
+    def test_insert_consolidation_threshold(self):
+        df = DataFrame(index=range(3))
+        with pd.option_context('compute.consolidation_threshold', 3):
+            for i in range(4):
+                df[i] = pd.Categorical(['a', 'b', 'c'])
+                df['f{}'.format(i)] = [1.5, 2.5, 3.5]
+                df['i{}'.format(i)] = [1, 2, 3]
+
+        assert df._data.nblocks == 6
+        assert_series_equal(df['f3'], Series([1.5, 2.5, 3.5], name='f3'))
+
     def test_reindex_index(self):
         pass
 
@@ -1294,3 +1372,204 @@ def test_block_shape():
 
     assert (a._data.blocks[0].mgr_locs.indexer ==
             b._data.blocks[0].mgr_locs.indexer)
+
+
+class TestCopyOnWrite(object):
+
+    @pytest.fixture(autouse=True)
+    def copy_on_write(self):
+        with pd.option_context('mode.copy_on_write', True):
+            yield
+
+    def test_copy_is_lazy(self):
+        df = DataFrame({'a': [1, 2, 3], 'b': [1.5, 2.5, 3.5]})
+        result = df.copy()
+
+        assert np.shares_memory(result['a'].values, df['a'].values)
+
+        result.iloc[0, 0] = 10
+        assert not np.shares_memory(result['a'].values, df['a'].values)
+        assert df.iloc[0, 0] == 1
+        assert result.iloc[0, 0] == 10
+
+        # the original no longer shares column 'a' and writes in place,
+        # while column 'b' is still shared and gets copied
+        values = df['a'].values
+        df.iloc[1, 0] = 20
+        df.iloc[0, 1] = 0.5
+        assert np.shares_memory(values, df['a'].values)
+        assert not np.shares_memory(result['b'].values, df['b'].values)
+        tm.assert_series_equal(result['a'], Series([10, 2, 3], name='a'))
+        tm.assert_series_equal(result['b'], Series([1.5, 2.5, 3.5],
+                                                   name='b'))
+
+    def test_write_to_original(self):
+        ser = Series([1.0, 2.0, 3.0])
+        result = ser.copy()
+        ser[0] = 10.0
+        ser.iloc[1] = 20.0
+        ser[ser > 10] = 0.0
+
+        tm.assert_series_equal(result, Series([1.0, 2.0, 3.0]))
+        tm.assert_series_equal(ser, Series([10.0, 0.0, 3.0]))
+
+    def test_block_refs(self):
+        mgr = create_mgr('a,b: f8')
+        result = mgr.copy()
+
+        assert result.blocks[0] is not mgr.blocks[0]
+        assert result.blocks[0].is_shared
+        assert mgr.blocks[0].is_shared
+
+        del result
+        assert not mgr.blocks[0].is_shared
+
+    def test_slice_does_not_update_parent(self):
+        df = DataFrame({'a': [1, 2, 3], 'b': [1.5, 2.5, 3.5]})
+        expected = df.copy()
+
+        sliced = df[0:2]
+        sliced.iloc[0, 1] = -1.0
+        subset = df[df['a'] > 1]
+        subset['b'] = 0.0
+
+        tm.assert_frame_equal(df, expected)
+        assert sliced.iloc[0, 1] == -1.0
+
+    def test_chained_assignment(self):
+        df = DataFrame({'a': [1, 2, 3], 'b': [1.5, 2.5, 3.5]})
+        expected = df.copy()
+
+        with pd.option_context('mode.chained_assignment', 'raise'):
+            df['a'][0] = 10
+            df[df['a'] > 1]['b'] = 0.0
+            df.loc[0:1]['b'] = 0.0
+
+        tm.assert_frame_equal(df, expected)
+
+    def test_column_is_not_a_view(self):
+        df = DataFrame({'a': [1, 2, 3], 'b': [1.5, 2.5, 3.5]})
+        col = df['a']
+        col[0] = 10
+
+        assert df.loc[0, 'a'] == 1
+        assert df['a'] is not col
+
+        df.loc[1, 'a'] = 20
+        assert col[1] == 2
+
+    @pytest.mark.parametrize('setter', ['at', 'iat', 'loc', 'setitem'])
+    def test_setting_copies_shared_blocks(self, setter):
+        df = DataFrame({'a': [1, 2, 3], 'b': [1.5, 2.5, 3.5]})
+        view = df[:]
+        other = DataFrame(df)
+
+        if setter == 'at':
+            df.at[0, 'a'] = 10
+        elif setter == 'iat':
+            df.iat[0, 0] = 10
+        elif setter == 'loc':
+            df.loc[0, 'a'] = 10
+        else:
+            df['a'] = [10, 2, 3]
+
+        assert df.loc[0, 'a'] == 10
+        assert view.loc[0, 'a'] == 1
+        assert other.loc[0, 'a'] == 1
+
+    def test_inplace_methods(self):
+        df = DataFrame({'a': [1.0, np.nan, 3.0], 'b': ['x', 'y', 'z']})
+        result = df.copy()
+
+        df.fillna(0, inplace=True)
+        df.replace('x', 'w', inplace=True)
+        df.replace(['y', 'z'], ['v', 'u'], inplace=True)
+
+        assert df['a'].tolist() == [1.0, 0.0, 3.0]
+        assert df['b'].tolist() == ['w', 'v', 'u']
+        assert np.isnan(result.loc[1, 'a'])
+        assert result['b'].tolist() == ['x', 'y', 'z']
+
+    def test_fillna_dict(self):
+        df = DataFrame({'a': [1.0, np.nan, 3.0], 'b': [np.nan, 2.0, 3.0]})
+        result = df.copy()
+        view = df[:]
+
+        df.fillna({'a': 0.0}, inplace=True)
+        assert np.isnan(view.loc[1, 'a'])
+        assert df['a'].tolist() == [1.0, 0.0, 3.0]
+        assert np.isnan(result.loc[1, 'a'])
+
+    @pytest.mark.parametrize('method', [
+        lambda df: df.T,
+        lambda df: df.swapaxes(0, 1, copy=False),
+        lambda df: df['x'],
+    ])
+    def test_views_of_values(self, method):
+        columns = MultiIndex.from_tuples([('x', 'a'), ('x', 'b'), ('y', 'c')])
+        df = DataFrame(np.arange(9.0).reshape(3, 3), columns=columns)
+        expected = DataFrame(np.arange(9.0).reshape(3, 3), columns=columns)
+
+        result = method(df)
+        result.iloc[0, 0] = -1.0
+        tm.assert_frame_equal(df, expected)
+
+
+class TestBlockThreads(object):
+
+    @pytest.fixture(autouse=True)
+    def block_threads(self, monkeypatch):
+        # small frames should go through the thread pool as well
+        monkeypatch.setattr('pandas.core.internals.managers.'
+                            '_threaded_min_size', 0)
+        monkeypatch.setattr('pandas.core.internals.managers.cpu_count',
+                            lambda: 4)
+        with pd.option_context('compute.block_threads', 4):
+            yield
+
+    @pytest.fixture
+    def df(self):
+        df = DataFrame(np.random.randn(20, 6), columns=list('abcdef'))
+        df.iloc[::3, ::2] = np.nan
+        df['g'] = np.arange(20)
+        df['h'] = ['x', np.nan] * 10
+        return df
+
+    @pytest.mark.parametrize('method, kwargs', [
+        ('astype', {'dtype': object}),
+        ('fillna', {'value': 0}),
+        ('fillna', {'value': 0, 'limit': 2}),
+        ('fillna', {'method': 'ffill'}),
+        ('shift', {'periods': 2}),
+        ('shift', {'periods': 1, 'axis': 1}),
+        ('diff', {}),
+        ('interpolate', {}),
+        ('quantile', {'q': [0.25, 0.75]}),
+    ])
+    def test_matches_serial(self, df, method, kwargs):
+        if method in ('diff', 'interpolate', 'quantile'):
+            df = df.drop('h', axis=1)
+        result = getattr(df, method)(**kwargs)
+        with pd.option_context('compute.block_threads', 1):
+            expected = getattr(df, method)(**kwargs)
+        assert_frame_equal(result, expected)
+
+    def test_where_aligned(self, df):
+        df = df.drop('h', axis=1)
+        cond = df > 0
+        other = -df
+        result = df.where(cond, other)
+        with pd.option_context('compute.block_threads', 1):
+            expected = df.where(cond, other)
+        assert_frame_equal(result, expected)
+
+    def test_single_block_split(self):
+        df = DataFrame(np.random.randn(10, 8))
+        df.iloc[::2] = np.nan
+
+        result = df.fillna(1.5)
+        assert result.notna().all().all()
+        assert len(result._data.blocks) == 1
+        assert_frame_equal(result.astype('f4'),
+                           df.fillna(1.5).astype('f4'))
+        assert_frame_equal(df.diff(), df - df.shift(1))
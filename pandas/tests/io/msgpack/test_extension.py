@@ -2,6 +2,8 @@ from __future__ import print_function
 
 import array
 
+import pytest
+
 import pandas.io.msgpack as msgpack
 from pandas.io.msgpack import ExtType
 
@@ -61,3 +63,14 @@ def test_extension_type():
     s = msgpack.packb(obj, default=default)
     obj2 = msgpack.unpackb(s, ext_hook=ext_hook)
     assert obj == obj2
+
+
+def test_pack_ext_type_buffer():
+    data = array.array('b', [65, 66, 67])
+    assert (msgpack.packb(ExtType(0x42, data)) ==
+            msgpack.packb(ExtType(0x42, b'ABC')))
+
+
+def test_ext_type_bad_data():
+    with pytest.raises(TypeError, match="data must be bytes"):
+        ExtType(0x42, 42)
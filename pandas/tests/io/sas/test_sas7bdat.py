@@ -148,6 +148,28 @@ def test_encoding_options(datapath):
         assert(x == y.decode())
 
 
+@pytest.mark.parametrize('encoding', [None, 'utf-8'])
+def test_blank_and_unset_strings(datapath, encoding):
+    from pandas.io.sas.sas7bdat import SAS7BDATReader
+    fname = datapath("io", "sas", "data", "test1.sas7bdat")
+    expected = pd.read_sas(fname, encoding=encoding)
+
+    # the reader stops at a zero-length column, leaving the string cells
+    # of the following columns unset
+    rdr = SAS7BDATReader(fname, encoding=encoding)
+    rdr._column_data_lengths[5] = 0
+    result = rdr.read()
+    rdr.close()
+
+    strings = [name for name, kind in zip(result.columns, rdr._column_types)
+               if kind == b's']
+    # the blank strings of the columns before are missing
+    assert expected['Column2'].isna().any()
+    tm.assert_series_equal(result['Column2'], expected['Column2'])
+    for name in strings[1:]:
+        assert result[name].isna().all()
+
+
 def test_productsales(datapath):
     fname = datapath("io", "sas", "data", "productsales.sas7bdat")
     df = pd.read_sas(fname, encoding='utf-8')
@@ -355,3 +355,111 @@ class TestMMapWrapper(object):
             df.to_csv(path)
             with pytest.raises(ValueError, match='Unknown engine'):
                 pd.read_csv(path, engine='pyt')
+
+
+@pytest.fixture
+def content_cache():
+    icom._content_cache.clear()
+    with pd.option_context('io.cache.max_bytes', 1 << 20):
+        yield icom._content_cache
+    icom._content_cache.clear()
+
+
+class LocalFileSystem(object):
+    """Stand-in for an s3fs/gcsfs file system backed by a directory"""
+    def __init__(self, root):
+        self.root = root
+        self.opened = 0
+
+    def info(self, path):
+        stat = os.stat(os.path.join(self.root, path))
+        return {'Size': stat.st_size, 'ETag': str(stat.st_mtime)}
+
+    def open(self, path, mode='rb'):
+        self.opened += 1
+        return open(os.path.join(self.root, path), mode)
+
+
+class TestContentCache(object):
+
+    def test_disabled_by_default(self):
+        assert pd.get_option('io.cache.max_bytes') == 0
+        with tm.ensure_clean('test.csv.gz') as path:
+            tm.makeDataFrame().to_csv(path)
+            pd.read_csv(path)
+        assert len(icom._content_cache) == 0
+
+    @pytest.mark.parametrize('engine', ['c', 'python'])
+    @pytest.mark.parametrize('compression', ['gzip', 'bz2', 'zip', 'xz'])
+    def test_read_csv_compressed(self, content_cache, engine, compression):
+        if compression == 'xz':
+            td.skip_if_no_lzma()
+        df = pd.DataFrame({'A': range(10), 'B': list('abcdefghij')})
+        with tm.ensure_clean() as path:
+            df.to_csv(path, index=False, compression=compression)
+            for _ in range(3):
+                result = pd.read_csv(path, engine=engine,
+                                     compression=compression)
+                tm.assert_frame_equal(result, df)
+            assert (content_cache.hits, content_cache.misses) == (2, 1)
+
+            # a changed file is not served from the cache
+            df = df.iloc[:5]
+            df.to_csv(path, index=False, compression=compression)
+            os.utime(path, (0, 0))
+            result = pd.read_csv(path, engine=engine,
+                                 compression=compression)
+            tm.assert_frame_equal(result, df)
+            assert content_cache.misses == 2
+            assert len(content_cache) == 1
+
+    def test_read_pickle_compressed(self, content_cache):
+        df = tm.makeDataFrame()
+        with tm.ensure_clean('test.pkl.gz') as path:
+            df.to_pickle(path)
+            tm.assert_frame_equal(pd.read_pickle(path), df)
+            tm.assert_frame_equal(pd.read_pickle(path), df)
+        assert (content_cache.hits, content_cache.misses) == (1, 1)
+
+    def test_lru_eviction(self, content_cache):
+        with pd.option_context('io.cache.max_bytes', 10):
+            content_cache.put(('a', 4, 0, None), b'aaaa')
+            content_cache.put(('b', 4, 0, None), b'bbbb')
+            assert content_cache.get(('a', 4, 0, None)) == b'aaaa'
+            content_cache.put(('c', 4, 0, None), b'cccc')
+            assert content_cache.get(('b', 4, 0, None)) is None
+            assert content_cache.nbytes == 8
+
+            # too large to be cached
+            content_cache.put(('d', 11, 0, None), b'd' * 11)
+            assert content_cache.get(('d', 11, 0, None)) is None
+
+            # a new version of a file replaces the old one
+            content_cache.put(('a', 2, 1, None), b'aa')
+            assert content_cache.get(('a', 4, 0, None)) is None
+            assert content_cache.nbytes == 6
+
+        # lowering the budget evicts
+        with pd.option_context('io.cache.max_bytes', 3):
+            assert len(content_cache) == 1
+            assert content_cache.get(('a', 2, 1, None)) == b'aa'
+
+    def test_remote_buffer(self, content_cache):
+        with tm.ensure_clean_dir() as root:
+            fs = LocalFileSystem(root)
+            with open(os.path.join(root, 'data.csv'), 'wb') as f:
+                f.write(b'A,B\n1,2\n')
+
+            for _ in range(2):
+                buf = icom._get_cached_remote_buffer(
+                    fs, 'data.csv', 's3://bucket/data.csv',
+                    fs.open('data.csv'))
+                tm.assert_frame_equal(pd.read_csv(buf),
+                                      pd.DataFrame({'A': [1], 'B': [2]}))
+            assert (content_cache.hits, content_cache.misses) == (1, 1)
+
+            with pd.option_context('io.cache.max_bytes', 0):
+                f = fs.open('data.csv')
+                assert icom._get_cached_remote_buffer(
+                    fs, 'data.csv', 's3://bucket/data.csv', f) is f
+                f.close()
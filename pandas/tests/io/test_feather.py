@@ -120,6 +120,35 @@ class TestFeather(object):
         self.check_round_trip(df, use_threads=True)
         self.check_round_trip(df, use_threads=False)
 
+    @pytest.mark.skipif(pyarrow_version < LooseVersion('0.12.0'),
+                        reason='memory_map requires pyarrow >= 0.12.0')
+    def test_rw_memory_map(self):
+        df = pd.DataFrame({'int': np.arange(10),
+                           'float': np.arange(10, dtype='float64'),
+                           'float_with_null': [1., np.nan] * 5,
+                           'string': list('abcdefghij'),
+                           'dt': pd.date_range('20130101', periods=10)})
+        self.check_round_trip(df, memory_map=True)
+        self.check_round_trip(df, expected=df[['string', 'float']],
+                              columns=['string', 'float'], memory_map=True)
+        self.check_round_trip(df, memory_map=True, zero_copy=True)
+        self.check_round_trip(df, expected=df[['string', 'float']],
+                              columns=['string', 'float'], memory_map=True,
+                              zero_copy=True)
+
+        with ensure_clean() as path:
+            to_feather(df, path)
+            result = read_feather(path, memory_map=True)
+            result.loc[0, 'int'] = 100
+            assert result.loc[0, 'int'] == 100
+            assert_frame_equal(read_feather(path, memory_map=True), df)
+
+            result = read_feather(path, memory_map=True, zero_copy=True)
+            assert_frame_equal(result, df)
+            # numeric columns are views of the mapped file
+            assert not result['int'].values.flags.writeable
+            assert not result['float'].values.flags.writeable
+
     def test_write_with_index(self):
 
         df = pd.DataFrame({'A': [1, 2, 3]})
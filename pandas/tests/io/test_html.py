@@ -15,7 +15,8 @@ from pandas.errors import ParserError
 import pandas.util._test_decorators as td
 
 from pandas import (
-    DataFrame, Index, MultiIndex, Series, Timestamp, date_range, read_csv)
+    DataFrame, Index, MultiIndex, Series, Timestamp, concat, date_range,
+    read_csv)
 import pandas.util.testing as tm
 from pandas.util.testing import makeCustomDataframe as mkdf, network
 
@@ -1159,3 +1160,135 @@ class TestReadHtml(object):
         while helper_thread1.is_alive() or helper_thread2.is_alive():
             pass
         assert None is helper_thread1.err is helper_thread2.err
+
+
+@td.skip_if_no('lxml')
+class TestReadHtmlChunks(object):
+
+    @pytest.mark.parametrize('filename, kwargs', [
+        ('banklist.html', {'match': 'Florida', 'attrs': {'id': 'table'}}),
+        ('spam.html', {'match': '.*Water.*'}),
+        ('valid_markup.html', {'index_col': 0}),
+        ('nyse_wsj.html', {}),
+    ])
+    def test_same_as_tree_parser(self, datapath, filename, kwargs):
+        path = datapath('io', 'data', filename)
+        expected = read_html(path, flavor='lxml', **kwargs)
+        result = read_html(path, flavor='lxml', chunksize=10000, **kwargs)
+        assert not isinstance(result, list)
+        assert_framelist_equal([concat(chunks) for chunks in result],
+                               expected)
+
+    @pytest.mark.parametrize('chunksize', [1, 7, 1000])
+    def test_chunks(self, datapath, chunksize):
+        path = datapath('io', 'data', 'banklist.html')
+        expected = read_html(path, attrs={'id': 'table'})[0]
+        tables = read_html(path, attrs={'id': 'table'}, chunksize=chunksize)
+        chunks = list(next(tables))
+        assert list(tables) == []
+        assert len(chunks) == -(-len(expected) // chunksize)
+        assert all(len(chunk) <= chunksize for chunk in chunks)
+        tm.assert_frame_equal(concat(chunks), expected)
+
+    def test_streams_rows(self):
+        rows = ''.join('<tr><td>{i}</td><td>x{i}</td></tr>'.format(i=i)
+                       for i in range(25))
+        html = ('<html><body><p>junk</p><table id="t">'
+                '<thead><tr><th>a</th><th>b</th></tr></thead>'
+                '<tfoot><tr><td>99</td><td>foot</td></tr></tfoot>'
+                '<tbody>' + rows + '</tbody></table></body></html>')
+
+        tables = read_html(StringIO(html), chunksize=10, attrs={'id': 't'})
+        chunks = list(next(tables))
+        assert [len(chunk) for chunk in chunks] == [10, 10, 6]
+        result = concat(chunks, ignore_index=True)
+        expected = DataFrame({'a': list(range(25)) + [99],
+                              'b': ['x{i}'.format(i=i) for i in range(25)] +
+                                   ['foot']})
+        tm.assert_frame_equal(result, expected)
+
+    def test_match_and_colspan_rowspan(self):
+        html = """<table><tr><td>1</td><td>2</td></tr></table>
+        <table>
+          <tr><th>A</th><th colspan="2">B</th></tr>
+          <tr><td rowspan="2">a</td><td>b</td><td>c</td></tr>
+          <tr><td>d</td><td>needle</td></tr>
+        </table>"""
+        result = list(next(read_html(html, match='needle', chunksize=1)))
+        expected = DataFrame([['a', 'b', 'c'], ['a', 'd', 'needle']],
+                             columns=['A', 'B', 'B.1'])
+        assert len(result) == 2
+        tm.assert_frame_equal(concat(result), expected)
+
+    def test_displayed_only(self):
+        html = """<table>
+          <tr><th>a</th></tr>
+          <tr><td>foo<span style="display: none">bar</span></td></tr>
+          <tr style="display:none"><td>hidden</td></tr>
+        </table>
+        <table style="display: none"><tr><td>foo</td></tr></table>"""
+        tables = read_html(html, chunksize=5)
+        result = list(next(tables))
+        assert list(tables) == []
+        assert len(result) == 1
+        tm.assert_frame_equal(result[0], DataFrame({'a': ['foo']}))
+
+    def test_match_child_and_tail_text(self):
+        html = """<table><tr><td>1</td></tr></table>
+        <table><tr><td>a <b>child</b> tail</td></tr></table>
+        <table><tr><td>b</td></tr></table>"""
+        for match in ['child', 'tail']:
+            result = [concat(chunks) for chunks in
+                      read_html(html, match=match, chunksize=2)]
+            assert_framelist_equal(result, [DataFrame(['a child tail'])])
+
+    def test_tables_separately(self):
+        html = """<table><tr><th>a</th></tr><tr><td>1</td></tr>
+          <tr><td>2</td></tr><tr><td>3</td></tr></table>
+        <table></table>
+        <table><tr><th>b</th></tr><tr><td>4</td></tr></table>"""
+        tables = read_html(html, chunksize=2)
+
+        # the chunks left of a table can't be read after the next table
+        first = next(tables)
+        tm.assert_frame_equal(next(first), DataFrame({'a': [1, 2]}))
+        second = next(tables)
+        tm.assert_frame_equal(next(second), DataFrame({'b': [4]}))
+        msg = "must be read before the next table"
+        with pytest.raises(ValueError, match=msg):
+            next(first)
+        with pytest.raises(StopIteration):
+            next(tables)
+
+        # nor after collecting the tables
+        tables = list(read_html(html, chunksize=2))
+        assert len(tables) == 2
+        tm.assert_frame_equal(next(tables[0]), DataFrame({'a': [1, 2]}))
+        with pytest.raises(ValueError, match=msg):
+            next(tables[0])
+
+    def test_wide_rows(self):
+        html = """<table><tr><th>a</th><th>b</th></tr>
+          <tr><td>1</td></tr>
+          <tr><td>2</td><td>3</td><td>4</td></tr></table>"""
+        with pytest.raises(ParserError, match='row 2 of the table has 3'):
+            list(next(read_html(html, chunksize=1)))
+
+        # narrower rows are padded
+        html = html.replace('<td>4</td>', '')
+        result = concat(next(read_html(html, chunksize=1)))
+        tm.assert_frame_equal(result, DataFrame({'a': [1, 2],
+                                                 'b': [np.nan, 3]}))
+
+    def test_no_match(self):
+        chunks = read_html('<table><tr><td>1</td></tr></table>',
+                           match='nothing', chunksize=2)
+        with pytest.raises(ValueError, match='No tables found'):
+            list(chunks)
+
+    def test_invalid(self):
+        html = '<table><tr><td>1</td></tr></table>'
+        with pytest.raises(ValueError, match="'lxml' flavor"):
+            read_html(html, flavor='bs4', chunksize=2)
+        with pytest.raises(ValueError, match="'chunksize' must be"):
+            read_html(html, chunksize=0)
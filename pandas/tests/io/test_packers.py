@@ -16,6 +16,7 @@ from pandas import (
     Categorical, DataFrame, Index, Interval, MultiIndex, NaT, Panel, Period,
     Series, Timestamp, bdate_range, compat, date_range, period_range)
 from pandas.tests.test_panel import assert_panel_equal
+from pandas.util._move import stolenbuf
 import pandas.util.testing as tm
 from pandas.util.testing import (
     assert_categorical_equal, assert_frame_equal, assert_index_equal,
@@ -643,6 +644,22 @@ class TestCompression(TestPackers):
         for k in self.frame.keys():
             assert_frame_equal(self.frame[k], i_rec[k])
 
+    def test_plain_no_copy(self):
+        i_rec = self.encode_decode(self.frame)
+        for k in self.frame.keys():
+            value = i_rec[k]
+            assert_frame_equal(value, self.frame[k])
+            for block in value._data.blocks:
+                if block.is_object:
+                    continue
+                # the unpacked bytes are moved into the array, not copied
+                base = block.values
+                while getattr(base, 'base', None) is not None:
+                    base = base.base
+                assert isinstance(base, stolenbuf)
+                assert block.values.flags.writeable
+                block.values[:, 0] = block.values[:, 1]
+
     def _test_compression(self, compress):
         i_rec = self.encode_decode(self.frame, compress=compress)
         for k in self.frame.keys():
@@ -14,7 +14,8 @@ import pandas as pd
 from pandas.util import testing as tm
 
 from pandas.io.parquet import (
-    FastParquetImpl, PyArrowImpl, get_engine, read_parquet, to_parquet)
+    FastParquetImpl, PyArrowImpl, _predicate_may_match, get_engine,
+    read_parquet, to_parquet)
 
 try:
     import pyarrow  # noqa
@@ -146,6 +147,23 @@ def check_round_trip(df, engine=None, path=None,
         compare(repeat)
 
 
+@pytest.mark.parametrize('op, value, lo, hi, expected', [
+    ('==', 5, 1, 3, False),
+    ('>', 2.5, 1, 3, True),
+    ('in', [4, 5], 1, 3, False),
+    ('==', u'b', b'a', b'c', True),
+    ('==', u'd', b'a', b'c', False),
+    ('<', pd.Timestamp('2000-01-01'), datetime.datetime(2001, 1, 1),
+     datetime.datetime(2002, 1, 1), False),
+    # statistics of another kind never rule a row group out
+    ('==', 5, b'a', b'c', True),
+    ('<', 'a', 1, 3, True),
+    ('in', [1, 'x'], 5, 6, True),
+    ('==', pd.Timestamp('2000-01-01'), 1, 3, True)])
+def test_predicate_may_match(op, value, lo, hi, expected):
+    assert _predicate_may_match(op, value, lo, hi) is expected
+
+
 def test_invalid_engine(df_compat):
     with pytest.raises(ValueError):
         check_round_trip(df_compat, 'foo', 'bar')
@@ -284,6 +302,42 @@ class TestBasic(Base):
         check_round_trip(df, engine, expected=expected,
                          read_kwargs={'columns': ['string']})
 
+    @pytest.mark.parametrize('filters, expected', [
+        ([('a', '>=', 7)], [7, 8, 9]),
+        ([('a', 'in', [1, 8]), ('b', '!=', 'x')], [8]),
+        ([[('a', '<', 2)], [('b', '==', 'z')]], [0, 1, 5, 9]),
+        ([('b', 'not in', ['x', 'y', 'z'])], []),
+    ])
+    def test_read_filters(self, engine, filters, expected):
+        df = pd.DataFrame({'a': np.arange(10),
+                           'b': ['x', 'y', 'z', 'x', 'y',
+                                 'z', 'x', 'y', 'x', 'z']})
+        if engine == 'pyarrow':
+            write_kwargs = {'row_group_size': 3}
+        else:
+            write_kwargs = {'row_group_offsets': 3}
+
+        with tm.ensure_clean() as path:
+            df.to_parquet(path, engine, compression=None, **write_kwargs)
+            result = read_parquet(path, engine, filters=filters)
+            result_columns = read_parquet(path, engine, columns=['b'],
+                                          filters=filters)
+
+        tm.assert_frame_equal(result.reset_index(drop=True),
+                              df.iloc[expected].reset_index(drop=True))
+        tm.assert_frame_equal(result_columns.reset_index(drop=True),
+                              df[['b']].iloc[expected].reset_index(drop=True))
+
+    @pytest.mark.parametrize('filters', [
+        [], ('a', '==', 1), [('a', 1)], [('a', '~', 1)], [('a', 'in', 1)],
+        [('c', '==', 1)]])
+    def test_read_filters_invalid(self, engine, filters):
+        df = pd.DataFrame({'a': [1, 2, 3]})
+        with tm.ensure_clean() as path:
+            df.to_parquet(path, engine, compression=None)
+            with pytest.raises(ValueError):
+                read_parquet(path, engine, filters=filters)
+
     def test_write_index(self, engine):
         check_names = engine != 'fastparquet'
 
@@ -437,6 +491,26 @@ class TestParquetPyArrow(Base):
         check_round_trip(df_compat, pa,
                          path='s3://pandas-test/pyarrow.parquet')
 
+    def test_filters_skip_row_groups(self, pa, monkeypatch):
+        import pyarrow.parquet as pq
+        df = pd.DataFrame({'a': np.arange(100)})
+        read = []
+        read_row_group = pq.ParquetFile.read_row_group
+
+        def counting_read_row_group(self, i, *args, **kwargs):
+            read.append(i)
+            return read_row_group(self, i, *args, **kwargs)
+
+        monkeypatch.setattr(pq.ParquetFile, 'read_row_group',
+                            counting_read_row_group)
+        with tm.ensure_clean() as path:
+            df.to_parquet(path, pa, compression=None, row_group_size=10)
+            result = read_parquet(path, pa, filters=[('a', '>', 84)])
+
+        assert read == [8, 9]
+        tm.assert_frame_equal(result.reset_index(drop=True),
+                              df.iloc[85:].reset_index(drop=True))
+
     def test_partition_cols_supported(self, pa, df_full):
         # GH #23283
         partition_cols = ['bool', 'int']
@@ -449,6 +523,85 @@ class TestParquetPyArrow(Base):
             assert len(dataset.partitions.partition_names) == 2
             assert dataset.partitions.partition_names == set(partition_cols)
 
+    def test_partition_cols_roundtrip(self, pa):
+        df = pd.DataFrame({'a': np.arange(12),
+                           'p': list('xxyyzzxxyyzz'),
+                           'q': [1, 2] * 6})
+        with tm.ensure_clean_dir() as path:
+            df.to_parquet(path, pa, partition_cols=['p', 'q'],
+                          compression=None)
+            assert sorted(os.listdir(path)) == ['p=x', 'p=y', 'p=z']
+            assert sorted(os.listdir(os.path.join(path, 'p=x'))) == [
+                'q=1', 'q=2']
+            result = read_parquet(path, pa)
+
+        result = result.sort_values('a').reset_index(drop=True)
+        expected = df.copy()
+        expected['p'] = pd.Categorical(expected['p'])
+        expected['q'] = pd.Categorical(expected['q'])
+        tm.assert_frame_equal(result, expected)
+
+    def test_partition_cols_read_filters(self, pa, monkeypatch):
+        import pyarrow.parquet as pq
+        df = pd.DataFrame({'a': np.arange(12),
+                           'p': list('xxyyzzxxyyzz'),
+                           'q': [1, 2] * 6})
+        read = []
+        read_row_group = pq.ParquetFile.read_row_group
+
+        def counting_read_row_group(self, i, *args, **kwargs):
+            read.append(i)
+            return read_row_group(self, i, *args, **kwargs)
+
+        monkeypatch.setattr(pq.ParquetFile, 'read_row_group',
+                            counting_read_row_group)
+        with tm.ensure_clean_dir() as path:
+            df.to_parquet(path, pa, partition_cols=['p', 'q'],
+                          compression=None)
+            result = read_parquet(path, pa, columns=['a', 'q'],
+                                  filters=[('p', 'in', ['y']),
+                                           ('q', '==', 2), ('a', '>', 3)])
+
+        # only the p=y/q=2 partition is read
+        assert len(read) == 1
+        tm.assert_numpy_array_equal(result['a'].values,
+                                    np.array([9], dtype='int64'))
+        assert list(result.columns) == ['a', 'q']
+
+    def test_partition_cols_filesystem(self, pa, monkeypatch):
+        # datasets on a given filesystem are written and read by pyarrow
+        import pyarrow.parquet as pq
+        from pyarrow.filesystem import LocalFileSystem
+        filesystems = []
+        write_to_dataset = pq.write_to_dataset
+
+        def recording_write_to_dataset(*args, **kwargs):
+            filesystems.append(kwargs.get('filesystem'))
+            return write_to_dataset(*args, **kwargs)
+
+        monkeypatch.setattr(pq, 'write_to_dataset',
+                            recording_write_to_dataset)
+        fs = LocalFileSystem.get_instance()
+        df = pd.DataFrame({'a': np.arange(4), 'p': list('xyxy')})
+        with tm.ensure_clean_dir() as path:
+            df.to_parquet(path, pa, partition_cols=['p'], compression=None,
+                          filesystem=fs)
+            assert sorted(os.listdir(path)) == ['p=x', 'p=y']
+            result = read_parquet(path, pa, filesystem=fs)
+
+        assert filesystems == [fs]
+        result = result.sort_values('a')
+        tm.assert_numpy_array_equal(result['a'].values, df['a'].values)
+        assert list(result['p'].astype(str)) == list(df['p'])
+
+    def test_partition_cols_invalid(self, pa):
+        df = pd.DataFrame({'a': [1, 2], 'b': [3, 4]})
+        with tm.ensure_clean_dir() as path:
+            with pytest.raises(ValueError):
+                df.to_parquet(path, pa, partition_cols=['c'])
+            with pytest.raises(ValueError):
+                df.to_parquet(path, pa, partition_cols=['a', 'b'])
+
 
 class TestParquetFastParquet(Base):
 
@@ -15,9 +15,12 @@ $ python generate_legacy_storage_files.py <output_dir> pickle
 from distutils.version import LooseVersion
 import glob
 import os
+import pickle
 import shutil
+import struct
 from warnings import catch_warnings, simplefilter
 
+import numpy as np
 import pytest
 
 from pandas.compat import PY3, is_platform_little_endian
@@ -27,6 +30,8 @@ import pandas as pd
 from pandas import Index
 import pandas.util.testing as tm
 
+from pandas.io.pickle import _get_pickle5
+
 from pandas.tseries.offsets import Day, MonthEnd
 
 
@@ -479,3 +484,68 @@ class TestProtocol(object):
             with tm.ensure_clean(get_random_path) as path:
                 df = tm.makeDataFrame()
                 df.to_pickle(path, protocol=protocol)
+
+
+# ---------------------
+# test out-of-band buffers
+# ---------------------
+
+@pytest.mark.skipif(_get_pickle5() is None,
+                    reason="pickle protocol 5 is not available")
+class TestOutOfBand(object):
+
+    def _make_frame(self):
+        return pd.DataFrame({'a': np.arange(10, dtype='float64'),
+                             'b': np.arange(10),
+                             'c': list('abcdefghij'),
+                             'd': pd.date_range('2000', periods=10,
+                                                tz='US/Eastern'),
+                             'e': pd.Categorical(list('aabbccddee'))})
+
+    @pytest.mark.parametrize('memory_map', [True, False])
+    def test_round_trip(self, memory_map, get_random_path):
+        df = self._make_frame()
+        with tm.ensure_clean(get_random_path) as path:
+            df.to_pickle(path, out_of_band=True)
+            result = pd.read_pickle(path, memory_map=memory_map)
+            tm.assert_frame_equal(result, df)
+
+            # the loaded frame is writeable and does not write to the file
+            result.iloc[0, 0] = 100.
+            assert result.iloc[0, 0] == 100.
+            tm.assert_frame_equal(pd.read_pickle(path), df)
+
+    @pytest.mark.parametrize('compression', [
+        'gzip', 'bz2', 'zip', pytest.param('xz', marks=td.skip_if_no_lzma)])
+    def test_round_trip_compression(self, compression, get_random_path):
+        df = self._make_frame()
+        with tm.ensure_clean(get_random_path) as path:
+            df.to_pickle(path, compression=compression, out_of_band=True)
+            result = pd.read_pickle(path, compression=compression,
+                                    memory_map=True)
+            tm.assert_frame_equal(result, df)
+
+    def test_series(self, get_random_path):
+        s = pd.Series(np.random.randn(100))
+        with tm.ensure_clean(get_random_path) as path:
+            pd.to_pickle(s, path, out_of_band=True)
+            result = pd.read_pickle(path, memory_map=True)
+            tm.assert_series_equal(result, s)
+
+    def test_buffers_written_out_of_band(self, get_random_path):
+        df = pd.DataFrame(np.random.randn(1000, 4))
+        with tm.ensure_clean(get_random_path) as path:
+            df.to_pickle(path, out_of_band=True)
+            with open(path, 'rb') as fh:
+                assert fh.read(8) == b'PDPKLOOB'
+                header_length = struct.unpack('<Q', fh.read(8))[0]
+                header = pickle.loads(fh.read(header_length))
+        assert header['buffer_lengths'] == [df.values.nbytes]
+        assert header['pickle_length'] < df.values.nbytes
+
+    def test_bad_protocol(self, get_random_path):
+        df = self._make_frame()
+        msg = "out_of_band requires protocol >= 5"
+        with tm.ensure_clean(get_random_path) as path:
+            with pytest.raises(ValueError, match=msg):
+                df.to_pickle(path, protocol=4, out_of_band=True)
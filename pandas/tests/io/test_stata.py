@@ -25,7 +25,7 @@ import pandas.util.testing as tm
 from pandas.io.parsers import read_csv
 from pandas.io.stata import (
     InvalidColumnName, PossiblePrecisionLoss, StataMissingValue, StataReader,
-    read_stata)
+    StataStrLWriter, read_stata)
 
 
 @pytest.fixture
@@ -1166,6 +1166,18 @@ class TestStata(object):
                 tm.assert_frame_equal(from_frame, chunk, check_dtype=False)
                 pos += chunksize
 
+    def test_read_chunks_strls_columns(self):
+        fname = self.dta21_117
+        columns = ['z', 'x']
+
+        parsed = read_stata(fname, columns=columns,
+                            convert_categoricals=False)
+        with read_stata(fname, iterator=True, columns=columns,
+                        convert_categoricals=False) as itr:
+            chunks = pd.concat([itr.read(2), itr.read(2)])
+            assert itr._strls_read
+        tm.assert_frame_equal(parsed, chunks)
+
     @pytest.mark.parametrize('version', [114, 117])
     def test_write_variable_labels(self, version):
         # GH 13631, add support for writing variable labels
@@ -1557,6 +1569,26 @@ class TestStata(object):
             expected = output.fillna('')
             tm.assert_frame_equal(reread, expected)
 
+    def test_strl_generate_table(self):
+        df = DataFrame({'idx': [0, 1, 2],
+                        'a': ['x', 'y', None],
+                        'b': ['y', '', 'z']},
+                       columns=['idx', 'a', 'b'])
+        ssw = StataStrLWriter(df.copy(), ['a', 'b'])
+        gso_table, gso_df = ssw.generate_table()
+
+        expected_table = OrderedDict([('', (0, 0)), ('x', (2, 1)),
+                                      ('y', (3, 1)), ('z', (3, 3))])
+        assert gso_table == expected_table
+        assert list(gso_table) == list(expected_table)
+
+        offset = 2 ** 32
+        expected = df.copy()
+        expected['a'] = np.array([2 + offset, 3 + offset, 0], dtype=np.uint64)
+        expected['b'] = np.array([3 + offset, 0, 3 + 3 * offset],
+                                 dtype=np.uint64)
+        tm.assert_frame_equal(gso_df, expected)
+
     @pytest.mark.parametrize('version', [114, 117])
     def test_all_none_exception(self, version):
         output = [
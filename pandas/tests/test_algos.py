@@ -1418,6 +1418,57 @@ class TestHashTable(object):
         size_hint = np.iinfo(np.uint32).max + 1
         tbl = hashtable(size_hint=size_hint) # noqa
 
+    @pytest.mark.parametrize('htable, dtype', [
+        (ht.Float64HashTable, 'float64'),
+        (ht.Int64HashTable, 'int64'),
+        (ht.UInt64HashTable, 'uint64')])
+    def test_state(self, htable, dtype):
+        vals = np.arange(100, dtype=dtype)[::-1]
+        table = htable()
+        table.map_locations(vals)
+
+        state = table.get_state()
+        assert state['size'] == 100
+        assert not state['keys'].flags.writeable
+        with pytest.raises(ValueError, match='external reference'):
+            table.map_locations(vals)
+
+        state = {key: value.copy() if isinstance(value, np.ndarray)
+                 else value for key, value in state.items()}
+        result = htable()
+        result.set_state(state)
+        assert len(result) == 100
+        tm.assert_numpy_array_equal(result.lookup(vals),
+                                    np.arange(100, dtype=np.int64))
+        with pytest.raises(ValueError, match='external reference'):
+            result.set_item(vals[0], 0)
+
+        state['vals'] = state['vals'][:-1]
+        with pytest.raises(ValueError, match='vals of the hash table'):
+            htable().set_state(state)
+
+    @pytest.mark.parametrize('htable, dtype', [
+        (ht.PyObjectHashTable, 'object'),
+        (ht.Float64HashTable, 'float64'),
+        (ht.Int64HashTable, 'int64'),
+        (ht.UInt64HashTable, 'uint64')])
+    def test_copy(self, htable, dtype):
+        vals = np.arange(100).astype(dtype)
+        table = htable()
+        table.map_locations(vals[:60])
+        if hasattr(table, 'get_state'):
+            # the copy of a table with a frozen state can be modified
+            table.get_state()
+
+        result = table.copy()
+        result.map_locations(vals[60:], 60)
+        assert len(table) == 60
+        assert len(result) == 100
+        tm.assert_numpy_array_equal(result.lookup(vals),
+                                    np.arange(100, dtype=np.int64))
+        expected = np.where(np.arange(100) < 60, np.arange(100), -1)
+        tm.assert_numpy_array_equal(table.lookup(vals), expected)
+
 
 def test_quantile():
     s = Series(np.random.randn(100))
@@ -1574,6 +1625,31 @@ class TestTseriesUtil(object):
         expect_filler = np.array([-1, -1, -1, -1, -1], dtype=np.int64)
         tm.assert_numpy_array_equal(filler, expect_filler)
 
+    @pytest.mark.parametrize('dtype', ['int64', 'uint64', 'float64',
+                                       'int32'])
+    def test_lookup_sorted(self, dtype):
+        old = np.array([1, 5, 10, 11, 30], dtype=dtype)
+        new = np.array([0, 1, 5, 6, 11, 30, 31], dtype=dtype)
+        expected = np.array([-1, 0, 1, -1, 3, 4, -1], dtype=np.int64)
+
+        result = libalgos.lookup_sorted(old, new)
+        tm.assert_numpy_array_equal(result, expected)
+
+        # unsorted values are searched from the previous position
+        order = np.array([6, 2, 0, 5, 1, 4, 3])
+        result = libalgos.lookup_sorted(old, new[order])
+        tm.assert_numpy_array_equal(result, expected[order])
+
+        result = libalgos.lookup_sorted(old[:0], new)
+        tm.assert_numpy_array_equal(result, np.repeat(-1, len(new)))
+
+    def test_lookup_sorted_nan(self):
+        old = np.array([1.5, 2.5])
+        new = np.array([np.nan, 2.5, np.nan, 1.5])
+        result = libalgos.lookup_sorted(old, new)
+        expected = np.array([-1, 1, -1, 0], dtype=np.int64)
+        tm.assert_numpy_array_equal(result, expected)
+
 
 def test_is_lexsorted():
     failure = [